@@ -0,0 +1,119 @@
+import time
+import random
+from typing import Any, Callable, Dict, List
+from atheris.core.serialization import CODECS, Codec
+
+
+def wallet_snapshot(wallets: int = 20000) -> Dict[str, Any]:
+    """Shape of wallet_tracker/snapshot (WalletActivityAgent.snapshot)."""
+    return {
+        f"wallet{i:08d}": {
+            "tx_history": [random.randint(0, 50) for _ in range(10)],
+            "spike": random.random() < 0.05
+        }
+        for i in range(wallets)
+    }
+
+
+def indexer_latest(validators: int = 2000, transactions: int = 5000) -> Dict[str, Any]:
+    """Shape of indexer/latest (SolanaIndexer.run)."""
+    return {
+        "slot": 250_000_000,
+        "validators": [
+            {
+                "identity": f"Validator{i:040d}",
+                "vote_account": f"Vote{i:044d}",
+                "score": round(random.random(), 4),
+                "votes": random.randint(0, 1_000_000),
+                "stake": random.randint(0, 10**12),
+                "delinquent": random.random() < 0.02
+            }
+            for i in range(validators)
+        ],
+        "governance_accounts": [{"pubkey": f"Gov{i:041d}", "proposals": random.randint(0, 40)} for i in range(200)],
+        "transactions": [
+            {
+                "signature": f"{i:088d}",
+                "slot": 250_000_000,
+                "fee": 5000,
+                "success": True,
+                "accounts": [f"Acct{j:040d}" for j in range(4)]
+            }
+            for i in range(transactions)
+        ],
+        "timestamp": time.time()
+    }
+
+
+def log_entries(count: int = 20000) -> List[Dict[str, Any]]:
+    """Shape of traffic_monitor/delegate_monitor log entries."""
+    return [
+        {"timestamp": time.time(), "event": {"timestamp": time.time(), "programs_tracked": 120, "anomalies": i % 3}}
+        for i in range(count)
+    ]
+
+
+def _measure(fn: Callable[[], Any], min_time: float = 0.5) -> float:
+    """Return the mean seconds per call of `fn`, repeating for at least `min_time`."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / calls
+
+
+def bench_codec(codec: Codec, payload: Any) -> Dict[str, float]:
+    raw = codec.encode(payload)
+    encode_s = _measure(lambda: codec.encode(payload))
+    decode_s = _measure(lambda: codec.decode(raw))
+    return {
+        "bytes": len(raw),
+        "encode_mb_s": len(raw) / encode_s / 1e6,
+        "decode_mb_s": len(raw) / decode_s / 1e6,
+        "encode_ms": encode_s * 1000,
+        "decode_ms": decode_s * 1000
+    }
+
+
+def bench_log_codec(codec: Codec, entries: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Per-record encoding, as done by SegmentedLog.append."""
+    encoded = [codec.encode(e) for e in entries]
+    total = sum(len(r) for r in encoded)
+    encode_s = _measure(lambda: [codec.encode(e) for e in entries])
+    decode_s = _measure(lambda: [codec.decode(r) for r in encoded])
+    return {
+        "bytes": total,
+        "encode_mb_s": total / encode_s / 1e6,
+        "decode_mb_s": total / decode_s / 1e6,
+        "encode_ms": encode_s * 1000,
+        "decode_ms": decode_s * 1000
+    }
+
+
+def run():
+    random.seed(7)
+    payloads = {
+        "wallet_tracker/snapshot": wallet_snapshot(),
+        "indexer/latest": indexer_latest()
+    }
+    entries = log_entries()
+
+    header = f"{'payload':<26}{'codec':<14}{'bytes':>12}{'enc MB/s':>10}{'dec MB/s':>10}{'enc ms':>9}{'dec ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for label, payload in payloads.items():
+        for name, codec in CODECS.items():
+            r = bench_codec(codec, payload)
+            print(f"{label:<26}{name:<14}{r['bytes']:>12,}{r['encode_mb_s']:>10.1f}{r['decode_mb_s']:>10.1f}"
+                  f"{r['encode_ms']:>9.2f}{r['decode_ms']:>9.2f}")
+    for name, codec in CODECS.items():
+        r = bench_log_codec(codec, entries)
+        print(f"{'log entries x20000':<26}{name:<14}{r['bytes']:>12,}{r['encode_mb_s']:>10.1f}{r['decode_mb_s']:>10.1f}"
+              f"{r['encode_ms']:>9.2f}{r['decode_ms']:>9.2f}")
+
+
+if __name__ == "__main__":
+    run()
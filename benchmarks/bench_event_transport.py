@@ -0,0 +1,111 @@
+import os
+import io
+import time
+import tempfile
+import threading
+import contextlib
+import multiprocessing
+from typing import Any, Dict, List
+from atheris.utils.message_bus import MessageBus
+from atheris.utils.ipc_transport import TransportClient, TransportHub
+
+MESSAGES = 100_000
+BATCH = 1000
+
+
+def message(i: int) -> Dict[str, Any]:
+    """Shape of an alert_triggered traffic_spike payload."""
+    return {"type": "traffic_spike", "program_id": f"Program{i % 500:040d}", "tx_count": i, "average": 420.0,
+            "timestamp": time.time()}
+
+
+def bench_in_process(count: int) -> float:
+    """Seconds to publish `count` messages to one subscriber of an in-process MessageBus."""
+    done = threading.Event()
+    received = [0]
+
+    def on_message(_):
+        received[0] += 1
+        if received[0] == count:
+            done.set()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        bus = MessageBus()
+        bus.subscribe("bench", on_message)
+        payloads = [message(i) for i in range(count)]
+        start = time.perf_counter()
+        for payload in payloads:
+            bus.publish("bench", payload)
+        done.wait()
+        return time.perf_counter() - start
+
+
+def _subscriber(path: str, count: int):
+    client = TransportClient(path)
+    received = [0]
+    done = threading.Event()
+
+    def on_batch(messages: List[Any]):
+        received[0] += len(messages)
+        if received[0] >= count:
+            done.set()
+
+    client.subscribe("bench", on_batch, batch=True)
+    client.publish("bench.ready", True)
+    done.wait()
+    client.publish("bench.done", received[0])
+    client.close()
+
+
+def bench_cross_process(path: str, count: int, batch: int) -> float:
+    """
+    Seconds to deliver `count` messages to a subscriber in another process
+    through a TransportHub, published one by one (batch=1) or in batches.
+    """
+    ready, done = threading.Event(), threading.Event()
+    client = TransportClient(path)
+    client.subscribe("bench.ready", lambda _: ready.set())
+    client.subscribe("bench.done", lambda _: done.set())
+    client.flush()
+
+    process = multiprocessing.Process(target=_subscriber, args=(path, count))
+    process.start()
+    ready.wait()
+
+    payloads = [message(i) for i in range(count)]
+    start = time.perf_counter()
+    if batch == 1:
+        for payload in payloads:
+            client.publish("bench", payload)
+    else:
+        for i in range(0, count, batch):
+            client.publish_many("bench", payloads[i:i + batch])
+    done.wait()
+    elapsed = time.perf_counter() - start
+
+    process.join()
+    client.close()
+    return elapsed
+
+
+def run():
+    path = os.path.join(tempfile.mkdtemp(), "bench.sock")
+    hub = TransportHub(path)
+    hub.start()
+
+    results = {
+        "in-process MessageBus": bench_in_process(MESSAGES),
+        "cross-process publish": bench_cross_process(path, MESSAGES, 1),
+        f"cross-process publish_many x{BATCH}": bench_cross_process(path, MESSAGES, BATCH),
+    }
+    hub.stop()
+
+    header = f"{'delivery':<36}{'messages':>10}{'seconds':>10}{'msg/s':>12}"
+    print(header)
+    print("-" * len(header))
+    for label, seconds in results.items():
+        print(f"{label:<36}{MESSAGES:>10,}{seconds:>10.3f}{MESSAGES / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    run()
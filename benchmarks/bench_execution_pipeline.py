@@ -0,0 +1,79 @@
+import io
+import time
+import contextlib
+from typing import Any, Dict, List
+from atheris.core.agent_base import AgentBase
+from atheris.core.execution_pipeline import ExecutionPipeline
+
+ITEMS = 50_000
+IDLE_STAGES = 20
+IDLE_SECONDS = 2.0
+
+
+class EchoAgent(AgentBase):
+    """Stage doing a little work per item, with a batch entry point."""
+
+    def run(self):
+        return None
+
+    def run_with_input(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {"value": data["value"] + 1}
+
+    def run_with_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [{"value": item["value"] + 1} for item in items]
+
+
+def build(stages: int, workers: int, batch_size: int) -> ExecutionPipeline:
+    pipeline = ExecutionPipeline()
+    names = [f"stage{i}" for i in range(stages)]
+    for name in names:
+        pipeline.register_agent(name, EchoAgent({"interval": 1}), workers=workers, batch_size=batch_size)
+    for src, dest in zip(names, names[1:]):
+        pipeline.define_route(src, [dest])
+    return pipeline
+
+
+def bench_idle(stages: int, seconds: float) -> float:
+    """CPU seconds used per wall second by a started pipeline with nothing queued."""
+    pipeline = build(stages, 1, 1)
+    pipeline.start()
+    time.sleep(0.2)
+    cpu, wall = time.process_time(), time.perf_counter()
+    time.sleep(seconds)
+    used = (time.process_time() - cpu) / (time.perf_counter() - wall)
+    pipeline.stop()
+    return used
+
+
+def bench_throughput(items: int, workers: int, batch_size: int) -> float:
+    """Seconds to push `items` through a 3-stage pipeline and drain it."""
+    pipeline = build(3, workers, batch_size)
+    pipeline.start()
+    start = time.perf_counter()
+    for i in range(items):
+        pipeline.enqueue_task("stage0", {"value": i})
+    pipeline.drain()
+    elapsed = time.perf_counter() - start
+    pipeline.stop()
+    return elapsed
+
+
+def run():
+    with contextlib.redirect_stdout(io.StringIO()):
+        idle = bench_idle(IDLE_STAGES, IDLE_SECONDS)
+        results = {
+            (workers, batch_size): bench_throughput(ITEMS, workers, batch_size)
+            for workers, batch_size in [(1, 1), (4, 1), (1, 64), (4, 64)]
+        }
+
+    print(f"idle CPU with {IDLE_STAGES} stages: {idle * 100:.1f}% of a core")
+    print()
+    header = f"{'workers/stage':>14}{'batch size':>12}{'items':>10}{'seconds':>10}{'items/s':>12}"
+    print(header)
+    print("-" * len(header))
+    for (workers, batch_size), seconds in results.items():
+        print(f"{workers:>14}{batch_size:>12}{ITEMS:>10,}{seconds:>10.3f}{ITEMS / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,47 @@
+import os
+import random
+import shutil
+import tempfile
+from typing import Any, Dict
+from atheris.benchmarks.bench_codecs import wallet_snapshot, indexer_latest, _measure
+from atheris.core.persistence_manager import PersistenceManager
+from atheris.core.storage_backends import FileBackend, SQLiteBackend
+
+
+def bench_load(base_path: str, backend: str, payload: Any, codec: str, read_cache: bool) -> float:
+    """Mean seconds per load() of an unchanged key."""
+    storage = FileBackend(base_path) if backend == "file" else SQLiteBackend(os.path.join(base_path, "atheris.db"))
+    persistence = PersistenceManager(base_path=base_path, backend=storage, read_cache=read_cache,
+                                     codecs={"bench": codec})
+    persistence.save("bench", "state", payload)
+    persistence.load("bench", "state")  # fill the cache
+    seconds = _measure(lambda: persistence.load("bench", "state"))
+    persistence.close()
+    return seconds
+
+
+def run():
+    random.seed(7)
+    payloads: Dict[str, Any] = {
+        "wallet_tracker/snapshot": wallet_snapshot(),
+        "indexer/latest": indexer_latest()
+    }
+
+    header = f"{'payload':<26}{'backend':<9}{'codec':<8}{'no cache ms':>13}{'cache ms':>10}{'speedup':>9}"
+    print(header)
+    print("-" * len(header))
+    for label, payload in payloads.items():
+        for backend in ("file", "sqlite"):
+            for codec in ("json", "pickle"):
+                base_path = tempfile.mkdtemp()
+                try:
+                    uncached = bench_load(base_path, backend, payload, codec, read_cache=False)
+                    cached = bench_load(base_path, backend, payload, codec, read_cache=True)
+                finally:
+                    shutil.rmtree(base_path, ignore_errors=True)
+                print(f"{label:<26}{backend:<9}{codec:<8}{uncached * 1000:>13.2f}{cached * 1000:>10.2f}"
+                      f"{uncached / cached:>8.1f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -1,4 +1,5 @@
 import time
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Optional
 
@@ -30,6 +31,19 @@ class AgentBase(ABC):
         """
         pass
 
+    async def arun(self):
+        """
+        Optional asyncio version of run() for I/O-bound agents. Agents that
+        override it are run by AsyncAgentRuntime in its event loop instead
+        of on a thread; the default runs run() in the loop's executor.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.run)
+
+    @property
+    def is_async(self) -> bool:
+        """Whether the agent implements arun() itself."""
+        return type(self).arun is not AgentBase.arun
+
     def stop(self):
         """
         Gracefully stops the agent's operation.
@@ -74,3 +88,20 @@ class AgentBase(ABC):
             self.run()
         except Exception as e:
             self._handle_exception(e)
+
+    async def aexecute(self, executor=None):
+        """
+        Asyncio counterpart of execute(): awaits arun() for async agents and
+        runs execute() in `executor` (the loop's default if None) for the rest.
+        """
+        if not self.is_async:
+            await asyncio.get_running_loop().run_in_executor(executor, self.execute)
+            return
+        if not self.active:
+            return
+
+        try:
+            self._update_status()
+            await self.arun()
+        except Exception as e:
+            self._handle_exception(e)
@@ -1,24 +1,44 @@
 import importlib
 from typing import Dict, Type, Any, Optional
 from atheris.core.agent_base import AgentBase
+from atheris.core.process_executor import EXECUTORS
 
 
 class AgentRegistry:
     _registry: Dict[str, Type[AgentBase]] = {}
+    _executors: Dict[str, str] = {}
 
     @classmethod
-    def register(cls, name: str, agent_class: Type[AgentBase]):
+    def register(cls, name: str, agent_class: Type[AgentBase], executor: str = "thread"):
         """
         Register an agent class by name.
 
         Args:
             name (str): Unique identifier for the agent
             agent_class (Type[AgentBase]): The agent class
+            executor (str): "thread", or "process" for CPU-bound agents whose
+                pipeline work should run in worker processes (see ProcessRunner)
         """
         if not issubclass(agent_class, AgentBase):
             raise ValueError("Agent class must inherit from AgentBase")
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}")
         cls._registry[name] = agent_class
-        print(f"[AgentRegistry] Registered agent '{name}'")
+        cls._executors[name] = executor
+        print(f"[AgentRegistry] Registered agent '{name}' ({executor} executor)")
+
+    @classmethod
+    def executor(cls, name: str) -> str:
+        """Executor an agent was registered with ("thread" if unregistered)."""
+        return cls._executors.get(name, "thread")
+
+    @classmethod
+    def executor_of(cls, agent_class: Type[AgentBase]) -> str:
+        """Executor a class was registered with under any name ("thread" if none)."""
+        for name, registered in cls._registry.items():
+            if registered is agent_class:
+                return cls._executors[name]
+        return "thread"
 
     @classmethod
     def get(cls, name: str) -> Optional[Type[AgentBase]]:
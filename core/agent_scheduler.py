@@ -0,0 +1,214 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from atheris.core.agent_base import AgentBase
+
+# fixed_delay: the next run starts `interval` after the previous one finished
+# fixed_rate: runs start every `interval` seconds measured from the first
+#   one, whatever they take; ticks missed while a run overran are skipped
+SCHEDULE_MODES = ("fixed_delay", "fixed_rate")
+
+SCHEDULER_WORKERS = 8
+
+
+class _Job:
+    def __init__(self, name: str, agent: AgentBase, mode: str, jitter: float):
+        self.name = name
+        self.agent = agent
+        self.mode = mode
+        self.jitter = jitter
+        self.pending: Optional[int] = None  # sequence number of the job's live heap entry
+        self.running = False
+        self.removed = False
+        self.slot = 0.0  # unjittered due time of the current/next fixed-rate tick
+        self.due = 0.0
+        self.interval = agent.interval  # interval the pending run was scheduled with
+        self.last_finish: Optional[float] = None
+        self.runs = 0
+        self.missed = 0
+        self.total_lag = 0.0
+        self.last_duration = 0.0
+
+
+class AgentScheduler:
+    def __init__(self, workers: int = SCHEDULER_WORKERS):
+        """
+        Runs agents' execute() on their intervals from one scheduling thread
+        and a bounded worker pool, instead of one sleeping thread per agent.
+
+        Due times live in a heap; the scheduling thread sleeps until the
+        earliest one and hands the agent to the pool. An agent never runs
+        twice at once. Intervals are read from `agent.interval` each time a
+        run is scheduled, and set_interval() applies a change immediately.
+
+        Args:
+            workers (int): Agents that may run at the same time
+        """
+        self.workers = workers
+        self._jobs: Dict[str, _Job] = {}
+        self._heap: List[Tuple[float, int, str]] = []  # (due, seq, name)
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            # Jobs whose run finished while stopped were not queued again
+            now = time.monotonic()
+            for job in self._jobs.values():
+                if job.pending is None and not job.running:
+                    due = max(job.last_finish + job.agent.interval, now) if job.last_finish is not None else now
+                    job.slot = due
+                    self._push(job, due + self._jitter(job))
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="agent")
+            self._thread = threading.Thread(target=self._run, daemon=True, name="agent-scheduler")
+            self._thread.start()
+        print(f"[AgentScheduler] Started with {self.workers} workers")
+
+    def stop(self, wait: bool = True):
+        """Stop scheduling; with `wait`, also wait for running agents to finish."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+        print("[AgentScheduler] Stopped")
+
+    def schedule(self, name: str, agent: AgentBase, mode: str = "fixed_delay", jitter: float = 0.0,
+                 initial_delay: Optional[float] = None):
+        """
+        Run `agent` every `agent.interval` seconds.
+
+        Args:
+            name (str): Job name, used by set_interval() and unschedule()
+            agent (AgentBase): Agent whose execute() is called
+            mode (str): One of SCHEDULE_MODES
+            jitter (float): Up to this many seconds are added at random to
+                each due time, so agents sharing an interval spread out
+            initial_delay (float): Seconds until the first run (default: a
+                random delay within `jitter`)
+        """
+        if mode not in SCHEDULE_MODES:
+            raise ValueError(f"Unknown schedule mode: {mode}")
+        job = _Job(name, agent, mode, jitter)
+        with self._cond:
+            if name in self._jobs:
+                self._jobs[name].removed = True
+            self._jobs[name] = job
+            job.slot = time.monotonic() + (initial_delay if initial_delay is not None else 0.0)
+            self._push(job, job.slot + (self._jitter(job) if initial_delay is None else 0.0))
+
+    def unschedule(self, name: str):
+        """Stop scheduling a job; a run in progress finishes."""
+        with self._cond:
+            job = self._jobs.pop(name, None)
+            if job is not None:
+                job.removed = True
+                job.pending = None
+
+    def set_interval(self, name: str, interval: float):
+        """
+        Change a job's interval now: the pending run is moved to `interval`
+        after the previous run started (fixed_rate) or finished (fixed_delay).
+        """
+        with self._cond:
+            job = self._jobs.get(name)
+            if job is None:
+                raise KeyError(name)
+            job.agent.interval = interval
+            if job.running or job.last_finish is None:
+                return  # the interval is read again when scheduling the next run
+            if job.mode == "fixed_rate":
+                job.slot = max(job.slot - job.interval + interval, time.monotonic())
+                self._push(job, job.slot + self._jitter(job))
+            else:
+                self._push(job, max(job.last_finish + interval, time.monotonic()) + self._jitter(job))
+
+    def status(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per job: runs, ticks missed because a run overran (fixed_rate),
+        average lag between due time and start, last run duration in
+        seconds and seconds until the next run.
+        """
+        now = time.monotonic()
+        with self._cond:
+            return {
+                name: {
+                    "mode": job.mode,
+                    "interval": job.agent.interval,
+                    "runs": job.runs,
+                    "missed": job.missed,
+                    "avg_lag": job.total_lag / job.runs if job.runs else 0.0,
+                    "last_duration": job.last_duration,
+                    "running": job.running,
+                    "next_in": None if job.running else max(job.due - now, 0.0),
+                }
+                for name, job in self._jobs.items()
+            }
+
+    def _jitter(self, job: _Job) -> float:
+        return random.uniform(0, job.jitter) if job.jitter else 0.0
+
+    def _push(self, job: _Job, due: float):
+        """Queue the job's next run (called with _cond held), replacing a pending one."""
+        job.pending = next(self._counter)
+        job.due = due
+        job.interval = job.agent.interval
+        heapq.heappush(self._heap, (due, job.pending, job.name))
+        self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running:
+                    if self._heap and self._heap[0][0] <= time.monotonic():
+                        break
+                    self._cond.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                if not self._running:
+                    return
+                _, seq, name = heapq.heappop(self._heap)
+                job = self._jobs.get(name)
+                if job is None or job.pending != seq:
+                    continue  # superseded by set_interval(), unschedule() or a new schedule()
+                job.pending = None
+                job.running = True
+            self._executor.submit(self._execute, job)
+
+    def _execute(self, job: _Job):
+        start = time.monotonic()
+        job.total_lag += start - job.due  # includes time waiting for a free worker
+        try:
+            job.agent.execute()
+        except Exception as e:  # execute() handles agent errors; this is a last resort
+            print(f"[AgentScheduler] Error running '{job.name}': {e}")
+        finish = time.monotonic()
+
+        with self._cond:
+            job.running = False
+            job.runs += 1
+            job.last_duration = finish - start
+            job.last_finish = finish
+            if job.removed or not self._running:
+                return
+            interval = job.agent.interval
+            if job.mode == "fixed_rate":
+                job.slot += interval
+                if job.slot < finish:
+                    # Overran: skip the ticks that passed instead of bursting to catch up
+                    missed = int((finish - job.slot) // interval) + 1
+                    job.missed += missed
+                    job.slot += missed * interval
+                self._push(job, job.slot + self._jitter(job))
+            else:
+                self._push(job, finish + interval + self._jitter(job))
@@ -0,0 +1,198 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set
+from atheris.core.agent_base import AgentBase
+
+# Threads shared by sync agents, which the runtime runs via run_in_executor
+ADAPTER_WORKERS = 8
+
+# Runs of one agent allowed in flight at once unless add() says otherwise
+DEFAULT_CONCURRENCY = 1
+
+
+class _AsyncJob:
+    def __init__(self, name: str, agent: AgentBase, max_concurrency: int):
+        self.name = name
+        self.agent = agent
+        self.max_concurrency = max_concurrency
+        self.slots: Optional[asyncio.Semaphore] = None  # created inside the loop
+        self.driver: Optional[asyncio.Task] = None
+        self.tasks: Set[asyncio.Task] = set()
+        self.runs = 0
+        self.total_lag = 0.0
+        self.last_duration = 0.0
+
+
+class AsyncAgentRuntime:
+    def __init__(self, adapter_workers: int = ADAPTER_WORKERS):
+        """
+        Runs agents from one asyncio event loop.
+
+        Agents that implement arun() run as coroutines in the loop, so an
+        agent waiting on RPC or storage holds no thread. Other agents go
+        through a sync adapter: their execute() runs on a small shared
+        thread pool via run_in_executor.
+
+        Each agent starts a run every `agent.interval` seconds with at most
+        `max_concurrency` of its runs in flight. A tick that finds every slot
+        busy waits for one to free up; missed ticks are not replayed.
+
+        Args:
+            adapter_workers (int): Threads for sync agents run through the adapter
+        """
+        self.adapter_workers = adapter_workers
+        self._jobs: Dict[str, _AsyncJob] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def add(self, name: str, agent: AgentBase, max_concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Run `agent` every `agent.interval` seconds; takes effect immediately
+        if the runtime is already running.
+
+        Args:
+            name (str): Job name, used by remove() and status()
+            agent (AgentBase): Agent whose arun() (or execute(), for sync agents) is run
+            max_concurrency (int): Runs of this agent allowed in flight at once
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        job = _AsyncJob(name, agent, max_concurrency)
+        with self._lock:
+            previous = self._jobs.get(name)
+            self._jobs[name] = job
+            loop = self._loop
+        if loop is not None:
+            if previous is not None:
+                loop.call_soon_threadsafe(self._cancel, previous)
+            loop.call_soon_threadsafe(self._launch, job)
+
+    def remove(self, name: str):
+        """Stop running a job; runs in progress are cancelled (sync ones finish)."""
+        with self._lock:
+            job = self._jobs.pop(name, None)
+            loop = self._loop
+        if job is not None and loop is not None:
+            loop.call_soon_threadsafe(self._cancel, job)
+
+    async def run(self):
+        """Run every added agent in the current event loop until stop() is called."""
+        loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.adapter_workers,
+                                                thread_name_prefix="async-adapter")
+        with self._lock:
+            self._loop = loop
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            self._launch(job)
+        print(f"[AsyncAgentRuntime] Running {len(jobs)} agents in one event loop")
+
+        try:
+            await self._stopped.wait()
+        finally:
+            with self._lock:
+                self._loop = None
+                jobs = list(self._jobs.values())
+            for job in jobs:
+                self._cancel(job)
+            pending = [task for job in jobs for task in ([job.driver] if job.driver else []) + list(job.tasks)]
+            await asyncio.gather(*pending, return_exceptions=True)
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            print("[AsyncAgentRuntime] Stopped")
+
+    def start(self):
+        """Run the event loop in a background thread."""
+        if self._thread is not None:
+            return
+        ready = threading.Event()
+
+        def main():
+            async def serve():
+                task = asyncio.ensure_future(self.run())
+                await asyncio.sleep(0)  # let run() publish its loop
+                ready.set()
+                await task
+            asyncio.run(serve())
+
+        self._thread = threading.Thread(target=main, daemon=True, name="async-runtime")
+        self._thread.start()
+        ready.wait()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Cancel all runs and stop the loop; waits for the background thread if start() was used."""
+        with self._lock:
+            loop = self._loop
+        if loop is not None and self._stopped is not None:
+            loop.call_soon_threadsafe(self._stopped.set)
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+            self._thread = None
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per job: whether the agent runs natively in the loop, its interval
+        and concurrency limit, runs completed and in flight, average lag
+        between due time and start, and the last run duration in seconds.
+        """
+        with self._lock:
+            jobs = dict(self._jobs)
+        return {
+            name: {
+                "async": job.agent.is_async,
+                "interval": job.agent.interval,
+                "max_concurrency": job.max_concurrency,
+                "runs": job.runs,
+                "in_flight": len(job.tasks),
+                "avg_lag": job.total_lag / job.runs if job.runs else 0.0,
+                "last_duration": job.last_duration,
+            }
+            for name, job in jobs.items()
+        }
+
+    def _launch(self, job: _AsyncJob):
+        """Start the job's driver (in the loop)."""
+        job.slots = asyncio.Semaphore(job.max_concurrency)
+        job.driver = asyncio.ensure_future(self._drive(job))
+
+    def _cancel(self, job: _AsyncJob):
+        """Cancel the job's driver and async runs (in the loop)."""
+        if job.driver is not None:
+            job.driver.cancel()
+        for task in list(job.tasks):
+            task.cancel()
+
+    async def _drive(self, job: _AsyncJob):
+        loop = asyncio.get_running_loop()
+        due = loop.time()
+        while True:
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await job.slots.acquire()
+            started = loop.time()
+            task = asyncio.ensure_future(self._execute(job, started - due))
+            job.tasks.add(task)
+            task.add_done_callback(job.tasks.discard)
+            due = max(due + job.agent.interval, started)
+
+    async def _execute(self, job: _AsyncJob, lag: float):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            await job.agent.aexecute(self._executor)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # aexecute() handles agent errors; this is a last resort
+            print(f"[AsyncAgentRuntime] Error running '{job.name}': {e}")
+        finally:
+            job.slots.release()
+            job.runs += 1
+            job.total_lag += lag
+            job.last_duration = loop.time() - started
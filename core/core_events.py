@@ -1,5 +1,15 @@
-from typing import Callable, Dict, List, Any
+from typing import Awaitable, Callable, Deque, Dict, List, Any, Optional, Set, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import heapq
+import inspect
+import itertools
+import threading
 import time
+from atheris.core.event_journal import EventJournal, JournalConsumer
+from atheris.utils.ipc_transport import TransportClient
+from atheris.utils.handler_stats import HandlerStats, SLOW_HANDLER_THRESHOLD
 
 
 # Define global event catalog
@@ -16,20 +26,563 @@ EVENT_TYPES = {
 }
 
 
-class EventBus:
+# sync: handlers run on the emitter's thread (default)
+# async: emits are queued per event type and run by a worker pool
+DISPATCH_MODES = ("sync", "async")
+
+# Events of one type a worker handles before giving other types a turn
+DISPATCH_BATCH = 64
+
+# Async dispatch lanes, most urgent first. Workers serve the highest lane
+# with work, except that a lane whose oldest ready type has waited longer
+# than its LANE_MAX_WAIT (seconds) is served first, so bulk traffic in
+# lower lanes is delayed under load but never starved.
+PRIORITY_LANES = ("high", "normal", "low")
+LANE_MAX_WAIT = {"high": None, "normal": 0.5, "low": 2.0}
+DEFAULT_PRIORITIES = {
+    "agent_error": "high",
+    "validator_changed": "high",
+    "new_block": "low",
+}
+
+# Defaults for batch subscribers
+BATCH_MAX_SIZE = 1000
+BATCH_MAX_LATENCY = 0.1  # seconds
+
+
+class _Timers:
+    """
+    One background thread running callbacks at deadlines (time.monotonic()),
+    started on first use.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Callable[[], None]]] = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def call_at(self, deadline: float, callback: Callable[[], None]):
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._counter), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    self._cond.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                _, _, callback = heapq.heappop(self._heap)
+            try:
+                callback()
+            except Exception as e:
+                print(f"[EventBus] Error in timer callback: {e}")
+
+
+class BatchSubscriber:
+    def __init__(self, event_type: str, handler: Callable[[List[Dict[str, Any]]], None],
+                 max_batch_size: int, max_latency: Optional[float], timers: _Timers,
+                 stats: Optional[HandlerStats] = None):
+        """
+        Buffers payloads for a handler that takes a list of payloads.
+
+        The buffer is delivered once it holds `max_batch_size` payloads, or
+        `max_latency` seconds after its oldest payload arrived. Batches are
+        delivered one at a time and in emit order.
+        """
+        self.event_type = event_type
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._timers = timers
+        self._stats = stats
+        self._buffer: List[Dict[str, Any]] = []
+        self._deadline: Optional[float] = None
+        self._lock = threading.Lock()
+        self._deliver_lock = threading.Lock()
+
+    def __call__(self, payload: Dict[str, Any]):
+        self.add([payload])
+
+    def add(self, payloads: List[Dict[str, Any]]):
+        with self._lock:
+            self._buffer.extend(payloads)
+            full = len(self._buffer) >= self.max_batch_size
+        if full:
+            self.flush(full_only=True)
+
+        deadline = None
+        with self._lock:
+            if self._buffer and self._deadline is None and self.max_latency is not None:
+                self._deadline = deadline = time.monotonic() + self.max_latency
+        if deadline is not None:
+            self._timers.call_at(deadline, self._on_deadline)
+
+    def _on_deadline(self):
+        with self._lock:
+            due = self._deadline is not None and self._deadline <= time.monotonic()
+        if due:
+            self.flush()
+
+    def flush(self, full_only: bool = False):
+        """
+        Deliver everything buffered (or with full_only, only full batches) in
+        batches of at most max_batch_size.
+        """
+        with self._deliver_lock:
+            while True:
+                with self._lock:
+                    if full_only and len(self._buffer) < self.max_batch_size:
+                        return
+                    batch = self._buffer[:self.max_batch_size]
+                    del self._buffer[:self.max_batch_size]
+                    if not self._buffer:
+                        self._deadline = None
+                if not batch:
+                    return
+                start = time.perf_counter()
+                error = False
+                try:
+                    self.handler(batch)
+                except Exception as e:
+                    error = True
+                    print(f"[EventBus] Error in batch handler for '{self.event_type}': {e}")
+                if self._stats is not None:
+                    self._stats.record(self.event_type, self.handler, time.perf_counter() - start, error)
+
+
+class AsyncHandler:
+    def __init__(self, event_type: str, handler: Callable[[Any], Awaitable[None]],
+                 loop: asyncio.AbstractEventLoop, stats: HandlerStats):
+        """
+        Runs a coroutine handler on its event loop. Calling it from any
+        thread only schedules the coroutine, so emitters never wait for it
+        and the loop is never blocked by the bus.
+        """
+        self.event_type = event_type
+        self.handler = handler
+        self.loop = loop
+        self._stats = stats
+        self._tasks: Set[asyncio.Task] = set()  # the loop only keeps weak references to tasks
+
+    def __call__(self, payload: Any):
+        if self.loop.is_closed():
+            print(f"[EventBus] Event loop of async handler for '{self.event_type}' is closed")
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self._spawn(payload)
+        else:
+            self.loop.call_soon_threadsafe(self._spawn, payload)
+
+    def _spawn(self, payload: Any):
+        task = self.loop.create_task(self.run(payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def run(self, payload: Any):
+        start = time.perf_counter()
+        error = False
+        try:
+            await self.handler(payload)
+        except Exception as e:
+            error = True
+            print(f"[EventBus] Error in async handler for '{self.event_type}': {e}")
+        self._stats.record(self.event_type, self.handler, time.perf_counter() - start, error)
+
+
+class Subscription:
+    def __init__(self, handler: Callable, where: Optional[Dict[str, Any]], seq: int):
+        """
+        A handler plus its payload filter. Each `where` condition is an
+        equality (field == value) or, for a list/tuple/set value, a
+        membership test (field in values).
+        """
+        self.handler = handler
+        self.seq = seq
+        self.where: Dict[str, frozenset] = {
+            field: frozenset(value) if isinstance(value, (list, tuple, set, frozenset)) else frozenset([value])
+            for field, value in (where or {}).items()
+        }
+
+    def matches(self, payload: Dict[str, Any]) -> bool:
+        if not self.where:
+            return True
+        if not isinstance(payload, dict):
+            return False
+        try:
+            return all(payload.get(field) in allowed for field, allowed in self.where.items())
+        except TypeError:  # unhashable payload value
+            return False
+
+
+class DispatchIndex:
     def __init__(self):
         """
+        Subscriptions of one event type, indexed by the first field of their
+        `where` filter, so routing a payload only looks at subscriptions that
+        can match it: unfiltered ones plus one hash lookup per indexed field.
+        """
+        self.subscriptions: List[Subscription] = []
+        self.unfiltered: List[Subscription] = []
+        self.by_field: Dict[str, Dict[Any, List[Subscription]]] = {}
+
+    def add(self, subscription: Subscription):
+        # Copy-on-write, so emitters on other threads can keep routing
+        # through the previous structures without locking
+        if not subscription.where:
+            self.unfiltered = self.unfiltered + [subscription]
+        else:
+            field, allowed = next(iter(subscription.where.items()))
+            table = {value: list(subs) for value, subs in self.by_field.get(field, {}).items()}
+            for value in allowed:
+                table.setdefault(value, []).append(subscription)
+            self.by_field = {**self.by_field, field: table}
+        self.subscriptions = self.subscriptions + [subscription]
+
+    def match(self, payload: Dict[str, Any]) -> List[Subscription]:
+        """Return the subscriptions whose filter matches `payload`."""
+        matched = list(self.unfiltered)
+        if not isinstance(payload, dict):
+            return matched  # only unfiltered subscribers take other payloads
+        for field, table in self.by_field.items():
+            try:
+                candidates = table.get(payload.get(field))
+            except TypeError:  # unhashable payload value
+                continue
+            if candidates:
+                matched.extend(s for s in candidates if s.matches(payload))
+        return matched
+
+    def route(self, payloads: List[Dict[str, Any]]) -> List[Tuple[Callable, List[Dict[str, Any]]]]:
+        """Group payloads per matching handler, in subscription order."""
+        if not self.by_field:
+            return [(s.handler, payloads) for s in self.unfiltered]
+
+        routed: Dict[int, List[Dict[str, Any]]] = {}
+        for payload in payloads:
+            for subscription in self.match(payload):
+                routed.setdefault(subscription.seq, []).append(payload)
+        return [(self.subscriptions[seq].handler, routed[seq]) for seq in sorted(routed)]
+
+
+class Coalescer:
+    def __init__(self, event_type: str, release: Callable[[List[Dict[str, Any]]], None], timers: _Timers):
+        """
+        Merges duplicate events of one type within a window.
+
+        Each rule names the payload fields that identify duplicates (e.g.
+        program_id) and a window in seconds. The first matching payload of a
+        key passes through unchanged and opens a window; duplicates arriving
+        before it closes are held and folded together, and when it closes
+        (if any arrived) one event is released: the latest duplicate plus
+        "count", "first_timestamp" and "last_timestamp" of the duplicates.
+        Windows are fixed from the first event, so a condition that persists
+        is reported at least once per window rather than never. Held
+        duplicates are not journaled until their window closes.
+        """
+        self.event_type = event_type
+        self.rules: List[Tuple[Tuple[str, ...], float, Subscription]] = []
+        self._release = release
+        self._timers = timers
+        self._pending: Dict[Tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def add_rule(self, key: List[str], window: float, where: Optional[Dict[str, Any]] = None):
+        self.rules = self.rules + [(tuple(key), window, Subscription(None, where, 0))]
+
+    def absorb(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Hold payloads matched by a rule; return the ones that pass through."""
+        passed = []
+        for payload in payloads:
+            if not isinstance(payload, dict):
+                passed.append(payload)
+                continue
+            for index, (fields, window, condition) in enumerate(self.rules):
+                if condition.matches(payload):
+                    break
+            else:
+                passed.append(payload)
+                continue
+
+            key = (index,) + tuple(payload.get(field) for field in fields)
+            try:
+                hash(key)
+            except TypeError:
+                passed.append(payload)
+                continue
+
+            timestamp = payload.get("timestamp")
+            if not isinstance(timestamp, (int, float)):
+                timestamp = time.time()
+            with self._lock:
+                merged = self._pending.get(key)
+                if merged is None:
+                    self._pending[key] = {"payload": None, "count": 0, "first": None, "last": None}
+                else:
+                    merged["payload"] = payload
+                    merged["count"] += 1
+                    if merged["first"] is None:
+                        merged["first"] = timestamp
+                    merged["last"] = timestamp
+            if merged is None:
+                passed.append(payload)  # leading edge: the first of a window is not delayed
+                self._timers.call_at(time.monotonic() + window, lambda key=key: self._close(key))
+        return passed
+
+    def _close(self, key: Tuple):
+        with self._lock:
+            merged = self._pending.pop(key, None)
+        if merged is not None and merged["count"]:
+            self._release([self._merge(merged)])
+
+    def flush(self):
+        """Release every open window now."""
+        with self._lock:
+            pending, self._pending = list(self._pending.values()), {}
+        held = [self._merge(merged) for merged in pending if merged["count"]]
+        if held:
+            self._release(held)
+
+    @staticmethod
+    def _merge(merged: Dict[str, Any]) -> Dict[str, Any]:
+        return {**merged["payload"], "count": merged["count"],
+                "first_timestamp": merged["first"], "last_timestamp": merged["last"]}
+
+
+class EventBus:
+    def __init__(self, dispatch: str = "sync", workers: int = 4, journal: Optional[EventJournal] = None,
+                 transport: Optional[TransportClient] = None,
+                 slow_handler_threshold: Optional[float] = SLOW_HANDLER_THRESHOLD):
+        """
         Initializes a pub-sub style event system.
+
+        In async mode emit() only enqueues: each event type has its own FIFO
+        queue, and a bounded pool of worker threads drains them. A type is
+        processed by at most one worker at a time, so handlers see the events
+        of a type in emit order, while slow handlers of one type do not hold
+        up emitters or other types.
+
+        Each event type belongs to a priority lane (DEFAULT_PRIORITIES, else
+        "normal"; see set_priority()), and under load workers take critical
+        types such as agent_error ahead of bulk ones such as new_block.
+        lane_stats() reports how long events waited in each lane, and
+        stats() how long each handler took.
+
+        Coroutine handlers (async def) run on the event loop they were
+        subscribed from, and aemit() emits from a loop without blocking it.
+
+        With a journal every emitted event is also appended to disk before
+        it is dispatched, and durable subscribers (subscribe_durable) consume
+        it from there under a consumer group, catching up on whatever was
+        emitted while they were down.
+
+        With a transport, events are also exchanged with EventBus instances
+        in other processes connected to the same TransportHub (topic
+        'event.<type>'): local emits are forwarded, and remote ones are
+        dispatched to local subscribers.
+
+        Args:
+            dispatch (str): One of DISPATCH_MODES
+            workers (int): Worker threads used in async mode
+            journal (EventJournal): Durable journal of emitted events
+            transport (TransportClient): Connection to a cross-process hub
+            slow_handler_threshold (float): Seconds after which a handler call
+                is reported as slow (None to disable)
         """
+        if dispatch not in DISPATCH_MODES:
+            raise ValueError(f"Unknown dispatch mode: {dispatch}")
         self.subscribers: Dict[str, List[Callable[[Dict], None]]] = {}
+        self._indexes: Dict[str, DispatchIndex] = {}
+        self.dispatch = dispatch
+        self.workers = workers
+        self.journal = journal
+        self._consumers: List[JournalConsumer] = []
+        self.transport: Optional[TransportClient] = None
+        self._transport_failed = False
+        self.emitted = 0  # events published by this process, after coalescing
+        self._coalescers: Dict[str, Coalescer] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None  # runs sync handlers for aemit() and coalesced releases
+        self.handler_stats = HandlerStats("EventBus", slow_handler_threshold)
 
-    def subscribe(self, event_type: str, handler: Callable[[Dict], None]):
+        # Async dispatch state
+        self._queues: Dict[str, Deque[Tuple[float, Dict[str, Any]]]] = {}  # (enqueued at, payload)
+        self._scheduled: Set[str] = set()  # types waiting in a lane or being handled
+        self.priorities: Dict[str, str] = dict(DEFAULT_PRIORITIES)
+        self._lanes: Dict[str, Deque[Tuple[str, float]]] = {lane: deque() for lane in PRIORITY_LANES}  # (type, ready since)
+        self._lane_stats = {lane: {"dispatched": 0, "total_delay": 0.0, "max_delay": 0.0, "starvation_picks": 0}
+                            for lane in PRIORITY_LANES}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._work = threading.Condition(self._lock)
+        self._outstanding = 0  # events queued or being handled
+        self._threads: List[threading.Thread] = []
+        self._retiring = 0  # workers told to exit that have not yet done so
+        self._timers = _Timers()
+        if transport is not None:
+            self.attach_transport(transport)
+
+    def configure(self, dispatch: Optional[str] = None, workers: Optional[int] = None,
+                  journal: Optional[str] = None, transport: Optional[str] = None,
+                  coalesce: Optional[List[Dict[str, Any]]] = None, priorities: Optional[Dict[str, str]] = None,
+                  slow_handler_threshold: Optional[float] = None):
+        """
+        Change the dispatch mode or worker count at runtime. Switching back
+        to sync dispatch first drains the queued events. A `journal`
+        directory enables the durable event journal, a `transport` socket
+        path connects to a TransportHub, `coalesce` adds coalescing rules
+        ({"event_type", "key", "window", "where"}, see coalesce()),
+        `priorities` maps event types to lanes (see set_priority()) and
+        `slow_handler_threshold` sets when a handler call counts as slow.
+        """
+        if dispatch is not None and dispatch not in DISPATCH_MODES:
+            raise ValueError(f"Unknown dispatch mode: {dispatch}")
+        if workers is not None:
+            self.workers = workers
+            with self._lock:
+                surplus = len(self._threads) - self._retiring - self.workers
+                if surplus > 0:
+                    self._retiring += surplus  # the next idle workers exit
+                    self._work.notify_all()
+        if dispatch == "sync" and self.dispatch == "async":
+            self.drain()
+        if dispatch is not None:
+            self.dispatch = dispatch
+        if journal is not None:
+            self.journal = EventJournal(journal)
+            print(f"[EventBus] Journaling events to {journal}")
+        if transport is not None:
+            self.attach_transport(TransportClient(transport))
+            print(f"[EventBus] Connected to transport hub at {transport}")
+        for rule in coalesce or []:
+            self.coalesce(**rule)
+        for event_type, lane in (priorities or {}).items():
+            self.set_priority(event_type, lane)
+        if slow_handler_threshold is not None:
+            self.handler_stats.slow_threshold = slow_handler_threshold
+        print(f"[EventBus] Dispatch mode '{self.dispatch}' with {self.workers} workers")
+
+    def coalesce(self, event_type: str, key: List[str], window: float, where: Optional[Dict[str, Any]] = None):
+        """
+        Merge duplicate events before they are journaled or dispatched.
+        The first event of `event_type` (matching `where`, if given) for a
+        `key` goes out at once; later ones with equal `key` fields within
+        `window` seconds of it become one event, released when the window
+        closes and carrying "count", "first_timestamp" and "last_timestamp".
+        Rules are tried in the order they were added. No rules are set by
+        default; e.g. in the "events" config section:
+
+            "coalesce": [
+                {"event_type": "alert_triggered", "key": ["program_id"], "window": 30,
+                 "where": {"type": "traffic_spike"}},
+                {"event_type": "validator_changed", "key": ["identity"], "window": 60},
+                {"event_type": "wallet_active", "key": ["wallet"], "window": 30}
+            ]
+
+        Args:
+            event_type (str): Event type to coalesce
+            key (list): Payload fields identifying duplicates, e.g. ["program_id"]
+            window (float): Seconds from the first event until the merged duplicates are released
+            where (dict): Only coalesce payloads matching this filter
+        """
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+        if event_type not in self._coalescers:
+            self._coalescers[event_type] = Coalescer(
+                event_type,
+                lambda payloads: self._release_coalesced(event_type, payloads),
+                self._timers
+            )
+        self._coalescers[event_type].add_rule(key, window, where)
+        print(f"[EventBus] Coalescing '{event_type}' by {key} over {window}s{f' where {where}' if where else ''}")
+
+    def set_priority(self, event_type: str, lane: str):
+        """
+        Put an event type in one of PRIORITY_LANES. Only affects async
+        dispatch; types already waiting move on their next turn.
+        """
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+        if lane not in PRIORITY_LANES:
+            raise ValueError(f"Unknown priority lane: {lane}")
+        self.priorities[event_type] = lane
+
+    def lane_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Queueing delay per lane in async mode: events dispatched, their
+        average and maximum wait in seconds between emit and dispatch,
+        events still queued, and how often the lane was served ahead of
+        higher lanes because it had waited too long.
+        """
+        with self._lock:
+            queued = {lane: 0 for lane in PRIORITY_LANES}
+            for event_type, pending in self._queues.items():
+                queued[self.priorities.get(event_type, "normal")] += len(pending)
+            return {
+                lane: {
+                    "dispatched": stats["dispatched"],
+                    "avg_delay": stats["total_delay"] / stats["dispatched"] if stats["dispatched"] else 0.0,
+                    "max_delay": stats["max_delay"],
+                    "queued": queued[lane],
+                    "starvation_picks": stats["starvation_picks"],
+                }
+                for lane, stats in self._lane_stats.items()
+            }
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Per-handler instrumentation: {event_type: {handler name: {"calls",
+        "errors", "avg", "max", "p50", "p95", "p99", "histogram"}}}, times in
+        seconds (see HandlerStats.snapshot()). Batch handlers count one call
+        per batch.
+        """
+        return self.handler_stats.snapshot()
+
+    def attach_transport(self, transport: TransportClient):
+        """Exchange events with other processes through `transport`."""
+        self.transport = transport
+        self._transport_failed = False
+        for event_type in list(self._indexes):
+            self._subscribe_remote(event_type)
+
+    def _subscribe_remote(self, event_type: str):
+        self.transport.subscribe(f"event.{event_type}", lambda payloads: self._receive(event_type, payloads),
+                                 batch=True)
+
+    def _receive(self, event_type: str, payloads: List[Dict[str, Any]]):
+        """Dispatch events emitted by another process."""
+        if self.dispatch == "async":
+            self._enqueue(event_type, payloads)
+        else:
+            self._dispatch(event_type, payloads)
+
+    def subscribe(self, event_type: str, handler: Callable, where: Optional[Dict[str, Any]] = None,
+                  batch: bool = False, max_batch_size: int = BATCH_MAX_SIZE,
+                  max_latency: Optional[float] = BATCH_MAX_LATENCY,
+                  loop: Optional[asyncio.AbstractEventLoop] = None):
         """
         Subscribe a handler to a specific event type.
 
         Args:
             event_type (str): The event to listen for
-            handler (callable): A function that takes a payload dict
+            handler (callable): A function that takes a payload dict, or with
+                batch=True a list of payload dicts. May be a coroutine
+                function, which then runs as a task on `loop`
+            where (dict): Only deliver payloads whose fields match, e.g.
+                {"type": "traffic_spike"} or {"type": ["analysis_complete", "output_ready"]};
+                the first field is used to index the subscription
+            batch (bool): Deliver payloads in batches
+            max_batch_size (int): Largest batch delivered to a batch handler
+            max_latency (float): Seconds a payload may wait for its batch to
+                fill (None: only full batches and drain() deliver)
+            loop (AbstractEventLoop): Loop of a coroutine handler (default:
+                the running loop)
         """
         if event_type not in EVENT_TYPES:
             raise ValueError(f"Unknown event type: {event_type}")
@@ -37,12 +590,73 @@ class EventBus:
         if event_type not in self.subscribers:
             self.subscribers[event_type] = []
 
+        is_async = inspect.iscoroutinefunction(handler)
+        if is_async:
+            if loop is None:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    raise ValueError("Coroutine handlers need a running event loop or loop=") from None
+            handler = AsyncHandler(event_type, handler, loop, self.handler_stats)
+        if batch:
+            # An async handler times itself when its task completes
+            handler = BatchSubscriber(event_type, handler, max_batch_size, max_latency, self._timers,
+                                      None if is_async else self.handler_stats)
         self.subscribers[event_type].append(handler)
-        print(f"[EventBus] Subscribed to '{event_type}'")
+
+        if event_type not in self._indexes:
+            self._indexes[event_type] = DispatchIndex()
+            if self.transport is not None:
+                self._subscribe_remote(event_type)
+        index = self._indexes[event_type]
+        index.add(Subscription(handler, where, len(index.subscriptions)))
+        print(f"[EventBus] Subscribed to '{event_type}'{' (batched)' if batch else ''}{' (async)' if is_async else ''}"
+              f"{f' where {where}' if where else ''}")
+
+    def subscribe_durable(self, group: str, event_type: str, handler: Callable[[Dict], None],
+                          where: Optional[Dict[str, Any]] = None, poll_interval: float = 0.5) -> JournalConsumer:
+        """
+        Subscribe a handler through the journal under a named consumer group.
+
+        The handler first receives every matching event journaled after the
+        group's committed offset (e.g. while its process was down), then new
+        ones as they are emitted, on the consumer's own thread. Delivery is
+        at-least-once.
+
+        Args:
+            group (str): Consumer group; its offset is kept across restarts
+            event_type (str): The event to listen for
+            handler (callable): A function that takes a payload dict
+            where (dict): Payload filter, as in subscribe()
+            poll_interval (float): Seconds between checks for events journaled
+                by other processes
+        """
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+        if self.journal is None:
+            raise RuntimeError("Durable subscriptions need a journal: configure(journal=<directory>)")
+
+        subscription = Subscription(handler, where, 0)
+
+        def deliver(record: Dict[str, Any]):
+            if subscription.matches(record["payload"]):
+                handler(record["payload"])
+
+        consumer = self.journal.follow(group, deliver, [event_type], poll_interval)
+        self._consumers.append(consumer)
+        print(f"[EventBus] Durable subscription '{group}' to '{event_type}'")
+        return consumer
+
+    def stop_durable(self, timeout: Optional[float] = None):
+        """Stop all durable subscriptions; their groups resume on the next start."""
+        for consumer in self._consumers:
+            consumer.stop(timeout)
+        self._consumers = []
 
     def emit(self, event_type: str, payload: Dict[str, Any]):
         """
-        Emit an event and notify all subscribed handlers.
+        Emit an event and notify all subscribed handlers, inline or through
+        the worker pool depending on the dispatch mode.
 
         Args:
             event_type (str): The type of event to fire
@@ -52,12 +666,277 @@ class EventBus:
             raise ValueError(f"Unknown event type: {event_type}")
 
         print(f"[EventBus] Emitting event '{event_type}' with payload: {payload}")
+        self._publish(event_type, [payload], inline=self.dispatch == "sync")
 
-        for handler in self.subscribers.get(event_type, []):
+    def emit_many(self, event_type: str, payloads: List[Dict[str, Any]]):
+        """
+        Emit several events of one type at once: validated and queued once,
+        and handed to batch subscribers as a whole.
+
+        Args:
+            event_type (str): The type of event to fire
+            payloads (list): Event-specific data, one dict per event
+        """
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+        if not payloads:
+            return
+
+        print(f"[EventBus] Emitting {len(payloads)} '{event_type}' events")
+        self._publish(event_type, payloads, inline=self.dispatch == "sync")
+
+    def emit_sync(self, event_type: str, payload: Dict[str, Any]):
+        """
+        Emit an event and run its handlers on the calling thread regardless
+        of the dispatch mode (e.g. in tests).
+        """
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+
+        print(f"[EventBus] Emitting event '{event_type}' with payload: {payload}")
+        self._publish(event_type, [payload], inline=True)
+
+    async def aemit(self, event_type: str, payload: Dict[str, Any]):
+        """
+        Emit an event from a coroutine without blocking the event loop.
+
+        Journaling, forwarding and sync handlers run on a thread pool;
+        coroutine handlers subscribed from this loop run concurrently as
+        tasks of it. In sync dispatch mode this returns once every handler
+        has finished, in async mode once the event is queued.
+
+        Args:
+            event_type (str): The type of event to fire
+            payload (dict): Event-specific data
+        """
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+
+        print(f"[EventBus] Emitting event '{event_type}' with payload: {payload}")
+        loop = asyncio.get_running_loop()
+        self._get_executor()
+        if self.dispatch == "async":
+            await loop.run_in_executor(self._executor, self._publish, event_type, [payload], False)
+            return
+
+        payloads = await loop.run_in_executor(self._executor, self._record, event_type, [payload], True)
+        index = self._indexes.get(event_type)
+        if not payloads or index is None:
+            return
+        pending = []
+        for handler, matched in index.route(payloads):
+            if isinstance(handler, AsyncHandler) and handler.loop is loop:
+                pending.extend(handler.run(p) for p in matched)
+            else:
+                pending.append(loop.run_in_executor(self._executor, self._call, event_type, handler, matched))
+        self._forward(event_type, payloads)
+        await asyncio.gather(*pending)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="eventbus")
+        return self._executor
+
+    def _release_coalesced(self, event_type: str, payloads: List[Dict[str, Any]]):
+        """
+        Publish the merged events of closed coalescing windows. Windows
+        close on the timer thread shared with batch subscribers, so handlers
+        never run here: async dispatch queues the events for the workers,
+        sync dispatch hands them to the executor. Either way drain() waits
+        for them.
+        """
+        if self.dispatch == "async":
+            self._publish(event_type, payloads, inline=False, coalesce=False)
+            return
+        with self._lock:
+            self._outstanding += len(payloads)
+        self._get_executor().submit(self._publish_released, event_type, payloads)
+
+    def _publish_released(self, event_type: str, payloads: List[Dict[str, Any]]):
+        try:
+            self._publish(event_type, payloads, inline=True, coalesce=False)
+        except Exception as e:
+            print(f"[EventBus] Error publishing coalesced '{event_type}': {e}")
+        finally:
+            with self._lock:
+                self._outstanding -= len(payloads)
+                if self._outstanding == 0:
+                    self._idle.notify_all()
+
+    def _publish(self, event_type: str, payloads: List[Dict[str, Any]], inline: bool, coalesce: bool = True):
+        """
+        Pass payloads through coalescing, then journal, forward and dispatch
+        them (on this thread if `inline`, else through the worker pool).
+        """
+        payloads = self._record(event_type, payloads, coalesce)
+        if not payloads:
+            return
+        if inline:
+            self._dispatch(event_type, payloads)
+        else:
+            self._enqueue(event_type, payloads)
+        self._forward(event_type, payloads)
+
+    def _record(self, event_type: str, payloads: List[Dict[str, Any]], coalesce: bool) -> List[Dict[str, Any]]:
+        """Coalesce and journal payloads; returns the ones to dispatch and forward."""
+        coalescer = self._coalescers.get(event_type) if coalesce else None
+        if coalescer is not None:
+            payloads = coalescer.absorb(payloads)
+            if not payloads:
+                return payloads
+
+        if self.journal is not None:
+            for payload in payloads:
+                self.journal.append(event_type, payload)
+        with self._lock:
+            self.emitted += len(payloads)
+        return payloads
+
+    def _forward(self, event_type: str, payloads: List[Dict[str, Any]]):
+        """
+        Publish payloads to other processes, after local dispatch. A lost
+        transport is reported (once per outage) and never fails the emit.
+        """
+        if self.transport is None:
+            return
+        try:
+            if len(payloads) == 1:
+                self.transport.publish(f"event.{event_type}", payloads[0])
+            else:
+                self.transport.publish_many(f"event.{event_type}", payloads)
+        except (RuntimeError, OSError) as e:
+            if not self._transport_failed:
+                print(f"[EventBus] Not forwarding events to other processes: {e}")
+            self._transport_failed = True
+        else:
+            self._transport_failed = False
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Release open coalescing windows, wait until every queued event has
+        been handled and deliver what batch subscribers still buffer, e.g.
+        on shutdown. Must not be called from
+        a handler.
+
+        Returns:
+            True if the queues are empty, False if `timeout` expired first.
+        """
+        for coalescer in list(self._coalescers.values()):
+            coalescer.flush()
+        with self._idle:
+            drained = self._idle.wait_for(lambda: self._outstanding == 0, timeout)
+        for handlers in list(self.subscribers.values()):
+            for handler in list(handlers):
+                if isinstance(handler, BatchSubscriber):
+                    handler.flush()
+        return drained
+
+    def _dispatch(self, event_type: str, payloads: List[Dict[str, Any]]):
+        index = self._indexes.get(event_type)
+        if index is None:
+            return
+        for handler, matched in index.route(payloads):
+            self._call(event_type, handler, matched)
+
+    def _call(self, event_type: str, handler: Callable, payloads: List[Dict[str, Any]]):
+        if isinstance(handler, BatchSubscriber):
+            handler.add(payloads)
+            return
+        if isinstance(handler, AsyncHandler):
+            for payload in payloads:
+                handler(payload)  # only schedules; timed when the task completes
+            return
+        for payload in payloads:
+            start = time.perf_counter()
+            error = False
             try:
                 handler(payload)
             except Exception as e:
+                error = True
                 print(f"[EventBus] Error in handler for '{event_type}': {e}")
+            self.handler_stats.record(event_type, handler, time.perf_counter() - start, error)
+
+    def _enqueue(self, event_type: str, payloads: List[Dict[str, Any]]):
+        enqueued_at = time.monotonic()
+        with self._lock:
+            self._queues.setdefault(event_type, deque()).extend((enqueued_at, payload) for payload in payloads)
+            self._outstanding += len(payloads)
+            if event_type not in self._scheduled:
+                self._scheduled.add(event_type)
+                self._make_ready(event_type)
+            self._ensure_workers()
+
+    def _make_ready(self, event_type: str):
+        """Queue a type for a worker in its lane (called with _lock held)."""
+        self._lanes[self.priorities.get(event_type, "normal")].append((event_type, time.monotonic()))
+        self._work.notify()
+
+    def _next_ready(self) -> Optional[str]:
+        """
+        Pop the type a worker should handle next (called with _lock held):
+        the head of a lane that waited past its LANE_MAX_WAIT, longest
+        overdue first, otherwise the head of the highest non-empty lane.
+        """
+        now = time.monotonic()
+        overdue, overdue_by = None, 0.0
+        for lane in PRIORITY_LANES:
+            max_wait = LANE_MAX_WAIT[lane]
+            if self._lanes[lane] and max_wait is not None:
+                late = now - self._lanes[lane][0][1] - max_wait
+                if late > overdue_by:
+                    overdue, overdue_by = lane, late
+        if overdue is not None:
+            if any(self._lanes[lane] for lane in PRIORITY_LANES[:PRIORITY_LANES.index(overdue)]):
+                self._lane_stats[overdue]["starvation_picks"] += 1
+            return self._lanes[overdue].popleft()[0]
+        for lane in PRIORITY_LANES:
+            if self._lanes[lane]:
+                return self._lanes[lane].popleft()[0]
+        return None
+
+    def _ensure_workers(self):
+        """Start worker threads up to `workers` (called with _lock held)."""
+        while len(self._threads) - self._retiring < self.workers:
+            thread = threading.Thread(target=self._worker_loop, daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _worker_loop(self):
+        while True:
+            with self._lock:
+                self._work.wait_for(lambda: self._retiring or any(self._lanes.values()))
+                if self._retiring:
+                    self._retiring -= 1
+                    self._threads.remove(threading.current_thread())
+                    return
+                event_type = self._next_ready()
+                pending = self._queues[event_type]
+                batch = [pending.popleft() for _ in range(min(DISPATCH_BATCH, len(pending)))]
+                stats = self._lane_stats[self.priorities.get(event_type, "normal")]
+                now = time.monotonic()
+                for enqueued_at, _ in batch:
+                    delay = now - enqueued_at
+                    stats["total_delay"] += delay
+                    if delay > stats["max_delay"]:
+                        stats["max_delay"] = delay
+                stats["dispatched"] += len(batch)
+
+            try:
+                self._dispatch(event_type, [payload for _, payload in batch])
+            except Exception as e:  # e.g. routing a payload that where-filters can't match
+                print(f"[EventBus] Error dispatching '{event_type}': {e}")
+            finally:
+                with self._lock:
+                    self._outstanding -= len(batch)
+                    if self._queues[event_type]:
+                        # Back of its lane, so other types get a turn
+                        self._make_ready(event_type)
+                    else:
+                        self._scheduled.discard(event_type)
+                    if self._outstanding == 0:
+                        self._idle.notify_all()
 
 
 # Global instance to be shared
@@ -0,0 +1,243 @@
+import os
+import json
+import time
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+from atheris.core.segmented_log import SegmentedLog, iter_segment
+from atheris.core.serialization import Codec
+
+JOURNAL_SEGMENT_BYTES = 64 * 1024 * 1024
+
+# An offset is the record's position: segment index in the high bits, byte
+# offset within the segment in the low OFFSET_BITS. Offsets grow with every
+# append, also across processes, and locate a record without any lookup.
+OFFSET_BITS = 40
+
+# Records a consumer handles between two offset commits
+COMMIT_EVERY = 100
+
+
+def make_offset(segment: int, position: int) -> int:
+    return (segment << OFFSET_BITS) | position
+
+
+def split_offset(offset: int) -> Tuple[int, int]:
+    return offset >> OFFSET_BITS, offset & ((1 << OFFSET_BITS) - 1)
+
+
+class EventJournal:
+    def __init__(self, directory: str, max_segment_bytes: int = JOURNAL_SEGMENT_BYTES,
+                 codec: Optional[Codec] = None):
+        """
+        Durable, append-only record of emitted events.
+
+        Events are appended to segment files ('events.000000.jsonl', ...) as
+        {"timestamp", "type", "payload"} records. Named consumer groups keep
+        a committed offset under '<directory>/consumers/', so a consumer that
+        was down resumes right after the last event it handled.
+
+        Args:
+            directory (str): Directory holding segments and committed offsets
+            max_segment_bytes (int): Size at which segments rotate
+            codec (Codec): Record codec (compact JSON lines by default)
+        """
+        self.directory = directory
+        self.log = SegmentedLog(directory, "events", max_segment_bytes, codec=codec)
+        self._consumers_dir = os.path.join(directory, "consumers")
+        os.makedirs(self._consumers_dir, exist_ok=True)
+        self._appended = threading.Condition()
+        self._generation = 0  # bumped by every append through this instance and by wake()
+
+    def append(self, event_type: str, payload: Dict[str, Any]) -> int:
+        """
+        Append an event and return its offset.
+        """
+        segment, position = self.log.append({"type": event_type, "payload": payload}, stamp=True)
+        self.wake()
+        return make_offset(segment, position)
+
+    def replay(self, from_offset: Optional[int] = None, from_time: Optional[float] = None,
+               event_types: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream journaled events oldest first as {"offset", "timestamp",
+        "type", "payload"} dicts.
+
+        Args:
+            from_offset (int): Start at this offset (as returned by append()
+                or found in a replayed record), inclusive
+            from_time (float): Start at the first event with timestamp >= from_time
+            event_types (iterable): Only these event types
+        """
+        types = set(event_types) if event_types is not None else None
+        if from_time is not None:
+            start = None
+            for path, position in self.log.plan_range(since=from_time):
+                start = make_offset(self._segment_index(path), position)
+                break
+            if start is None:
+                return
+            from_offset = max(from_offset or 0, start)
+
+        for offset, record in self._records(from_offset or 0):
+            if from_time is not None and record.get("timestamp", 0) < from_time:
+                continue
+            if types is not None and record.get("type") not in types:
+                continue
+            yield {"offset": offset, **record}
+
+    def _records(self, from_offset: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        start_segment, start_position = split_offset(from_offset)
+        files = self.log.segment_files()
+        for index in sorted(files):
+            if index < start_segment:
+                continue
+            position = start_position if index == start_segment else 0
+            for record_position, record in iter_segment(files[index], position):
+                yield make_offset(index, record_position), record
+
+    def _segment_index(self, path: str) -> int:
+        return int(os.path.basename(path).split(".")[1])
+
+    def end_offset(self) -> int:
+        """Return an offset past every event journaled so far."""
+        files = self.log.segment_files()
+        if not files:
+            return 0
+        last = max(files)
+        return make_offset(last, os.path.getsize(files[last]))
+
+    def committed(self, group: str) -> Optional[int]:
+        """Return the offset of the last event handled by a consumer group, if any."""
+        try:
+            with open(self._offset_path(group), "r", encoding="utf-8") as f:
+                return json.load(f)["offset"]
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+
+    def commit(self, group: str, offset: int):
+        """Record `offset` as the last event handled by a consumer group."""
+        fd, tmp_path = tempfile.mkstemp(dir=self._consumers_dir, prefix=f".{group}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"offset": offset, "committed_at": time.time()}, f)
+            os.replace(tmp_path, self._offset_path(group))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _offset_path(self, group: str) -> str:
+        return os.path.join(self._consumers_dir, f"{group}.json")
+
+    def consume(self, group: str, handler: Callable[[Dict[str, Any]], None],
+                event_types: Optional[Iterable[str]] = None, limit: Optional[int] = None) -> int:
+        """
+        Hand every event after the group's committed offset to `handler`,
+        committing as it goes (at-least-once: after a crash, up to
+        COMMIT_EVERY events may be handled again).
+
+        Returns:
+            Number of events handled.
+        """
+        types = set(event_types) if event_types is not None else None
+        committed = self.committed(group)
+        handled = 0
+        last = None
+        for record in self.replay(from_offset=committed or 0):
+            if committed is not None and record["offset"] <= committed:
+                continue
+            if limit is not None and handled >= limit:
+                break
+            # Events of other types are passed over but still committed, so
+            # they are not scanned again
+            last = record["offset"]
+            if types is not None and record.get("type") not in types:
+                continue
+            try:
+                handler(record)
+            except Exception as e:
+                print(f"[EventJournal] Error in consumer '{group}' at offset {record['offset']}: {e}")
+            handled += 1
+            if handled % COMMIT_EVERY == 0:
+                self.commit(group, last)
+        if last is not None and last != committed:
+            self.commit(group, last)
+        return handled
+
+    def follow(self, group: str, handler: Callable[[Dict[str, Any]], None],
+               event_types: Optional[Iterable[str]] = None, poll_interval: float = 0.5) -> "JournalConsumer":
+        """
+        Start a background consumer that catches up from the committed offset
+        and then keeps handling new events as they are journaled. Appends
+        from this process wake it immediately; other processes' appends are
+        picked up within `poll_interval` seconds.
+        """
+        consumer = JournalConsumer(self, group, handler, event_types, poll_interval)
+        consumer.start()
+        return consumer
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every append through this instance and by wake()."""
+        return self._generation
+
+    def wait_for_append(self, seen: int, timeout: float):
+        """Wait up to `timeout` seconds unless the generation moved past `seen`."""
+        with self._appended:
+            self._appended.wait_for(lambda: self._generation != seen, timeout)
+
+    def wake(self):
+        """Wake consumers waiting in wait_for_append()."""
+        with self._appended:
+            self._generation += 1
+            self._appended.notify_all()
+
+    def prune(self, max_age: float) -> int:
+        """
+        Delete whole segments whose events are all older than `max_age`
+        seconds. The active segment is always kept.
+
+        Returns:
+            Number of segments deleted.
+        """
+        cutoff = time.time() - max_age
+        files = self.log.segment_files()
+        indices = sorted(files)
+        removed = 0
+        for index, next_index in zip(indices, indices[1:]):
+            next_first = next(iter_segment(files[next_index]), (None, {}))[1].get("timestamp")
+            if next_first is None or next_first >= cutoff:
+                break
+            for path in (files[index], files[index] + ".idx"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            removed += 1
+        return removed
+
+
+class JournalConsumer(threading.Thread):
+    def __init__(self, journal: EventJournal, group: str, handler: Callable[[Dict[str, Any]], None],
+                 event_types: Optional[Iterable[str]], poll_interval: float):
+        super().__init__(daemon=True, name=f"journal-{group}")
+        self.journal = journal
+        self.group = group
+        self.handler = handler
+        self.event_types = list(event_types) if event_types is not None else None
+        self.poll_interval = poll_interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.is_set():
+            seen = self.journal.generation
+            # Bounded batches keep stop() responsive during a long catch-up
+            if not self.journal.consume(self.group, self.handler, self.event_types, limit=COMMIT_EVERY * 10):
+                self.journal.wait_for_append(seen, self.poll_interval)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop following once the current batch is handled."""
+        self._stopped.set()
+        self.journal.wake()
+        self.join(timeout)
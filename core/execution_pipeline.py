@@ -1,27 +1,75 @@
 import threading
 import queue
-from typing import Dict, List, Any, Callable
+from typing import Dict, List, Any, Callable, Optional
 from atheris.core.agent_base import AgentBase
+from atheris.core.agent_registry import AgentRegistry
+from atheris.core.process_executor import EXECUTORS, PROCESS_WORKERS, ProcessRunner, run_items
+
+# Seconds an idle worker blocks on its queue before re-checking for stop
+POLL_TIMEOUT = 0.5
+
+# Sentinel telling one worker to exit
+_STOP = object()
 
 
 class ExecutionPipeline:
-    def __init__(self):
+    def __init__(self, process_workers: int = PROCESS_WORKERS):
         """
         Initializes the execution pipeline with agent queues and routing logic.
+
+        Each registered agent is a stage with its own queue and one or more
+        worker threads that block on it, so idle stages use no CPU. A stage
+        with batch_size > 1 takes up to that many queued items at once and,
+        if the agent has run_with_batch(items) (returning one result per
+        item), hands them over in one call.
+
+        A stage registered with executor="process" runs its batches in a
+        shared pool of worker processes (see ProcessRunner); its worker
+        threads only wait for the results, so set `workers` to the number of
+        batches it may run at once.
+
+        Args:
+            process_workers (int): Size of the process pool used by process stages
         """
         self.agents: Dict[str, AgentBase] = {}
         self.queues: Dict[str, queue.Queue] = {}
         self.routes: Dict[str, List[str]] = {}
         self.handlers: Dict[str, Callable[[Any], None]] = {}
+        self.workers: Dict[str, int] = {}
+        self.batch_sizes: Dict[str, int] = {}
+        self.processed: Dict[str, int] = {}  # results each stage passed on (failed items excluded)
+        self.executors: Dict[str, str] = {}
+        self.process_runner = ProcessRunner(process_workers)
         self.running = False
+        self._threads: Dict[str, List[threading.Thread]] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._outstanding = 0  # items queued or being processed, across stages
 
-    def register_agent(self, name: str, agent: AgentBase):
+    def register_agent(self, name: str, agent: AgentBase, workers: int = 1, batch_size: int = 1,
+                       executor: Optional[str] = None):
         """
         Register a new agent with its own execution queue.
+
+        Args:
+            name (str): Stage name used in routes
+            agent (AgentBase): Agent run on each item
+            workers (int): Threads consuming this stage's queue
+            batch_size (int): Most items taken from the queue at once
+            executor (str): One of EXECUTORS (default: as registered in
+                AgentRegistry for the agent's class, else "thread")
         """
+        executor = executor or AgentRegistry.executor_of(type(agent))
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}")
         self.agents[name] = agent
+        self.executors[name] = executor
         self.queues[name] = queue.Queue()
-        print(f"[ExecutionPipeline] Agent '{name}' registered.")
+        self.workers[name] = workers
+        self.batch_sizes[name] = batch_size
+        self.processed[name] = 0
+        print(f"[ExecutionPipeline] Agent '{name}' registered ({workers} workers, batch size {batch_size}, "
+              f"{executor} executor).")
 
     def define_route(self, from_agent: str, to_agents: List[str]):
         """
@@ -42,8 +90,9 @@ class ExecutionPipeline:
         Add a task to a specific agent's queue.
         """
         if agent_name in self.queues:
+            with self._lock:
+                self._outstanding += 1
             self.queues[agent_name].put(data)
-            print(f"[ExecutionPipeline] Task enqueued to '{agent_name}'.")
 
     def start(self):
         """
@@ -51,15 +100,45 @@ class ExecutionPipeline:
         """
         self.running = True
         for name in self.agents:
-            thread = threading.Thread(target=self._agent_loop, args=(name,), daemon=True)
-            thread.start()
-            print(f"[ExecutionPipeline] Execution thread started for '{name}'.")
+            threads = self._threads.setdefault(name, [])
+            while len(threads) < self.workers[name]:
+                thread = threading.Thread(target=self._agent_loop, args=(name,), daemon=True,
+                                          name=f"pipeline-{name}-{len(threads)}")
+                threads.append(thread)
+                thread.start()
+            print(f"[ExecutionPipeline] {len(threads)} execution threads started for '{name}'.")
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued item, including results routed on to other
+        stages, has been processed.
+
+        Returns:
+            True if the pipeline is empty, False if `timeout` expired first.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._outstanding == 0, timeout)
 
-    def stop(self):
+    def stop(self, drain: bool = True, timeout: Optional[float] = None):
         """
-        Stop all pipeline operations.
+        Stop all pipeline operations: by default after processing what is
+        queued, then waking every worker so it exits.
         """
+        if drain and self.running and not self.drain(timeout):
+            print("[ExecutionPipeline] Timed out draining queues; stopping anyway")
         self.running = False
+        for name, threads in self._threads.items():
+            for _ in threads:
+                self.queues[name].put(_STOP)
+        for threads in self._threads.values():
+            for thread in threads:
+                thread.join(timeout)
+        self._threads = {}
+        self.process_runner.shutdown()
+        for q in self.queues.values():
+            # Workers that saw running=False first leave their sentinel behind
+            with q.mutex:
+                q.queue = type(q.queue)(item for item in q.queue if item is not _STOP)
         print("[ExecutionPipeline] Pipeline stopped.")
 
     def _agent_loop(self, name: str):
@@ -69,24 +148,72 @@ class ExecutionPipeline:
         """
         agent = self.agents[name]
         q = self.queues[name]
+        batch_size = self.batch_sizes[name]
+        use_batch = batch_size > 1 and hasattr(agent, "run_with_batch")
+        in_process = self.executors[name] == "process"
 
         while self.running:
             try:
-                if not q.empty():
-                    task_data = q.get()
-                    result = agent.run_with_input(task_data) if hasattr(agent, 'run_with_input') else agent.run()
+                item = q.get(timeout=POLL_TIMEOUT)
+            except queue.Empty:
+                continue
+            if item is _STOP:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < batch_size:
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
 
-                    # Output handler (dashboard, alerts, etc.)
-                    if name in self.handlers:
-                        self.handlers[name](result)
+            routed = 0
+            try:
+                if in_process:
+                    results = self.process_runner.run(name, agent, batch, use_batch)
+                else:
+                    results = run_items(name, agent, batch, use_batch)
+                routed = self._emit(name, results)
+            except Exception as e:  # e.g. a worker process that died
+                print(f"[ExecutionPipeline] Error in '{name}': {e}")
 
-                    # Route result to next agents
-                    next_agents = self.routes.get(name, [])
-                    for dest in next_agents:
-                        self.enqueue_task(dest, result)
+            with self._lock:
+                self.processed[name] += routed
+                self._outstanding -= len(batch)
+                if self._outstanding == 0:
+                    self._idle.notify_all()
+            if stop:
+                return
 
-            except Exception as e:
-                print(f"[ExecutionPipeline] Error in '{name}': {e}")
+    def _emit(self, name: str, results: List[Any]) -> int:
+        """
+        Pass a stage's results to its output handler and on along its routes.
+        A result whose handler raises is dropped; the rest still go on.
+
+        Returns:
+            The number of results routed.
+        """
+        handler = self.handlers.get(name)
+        next_agents = self.routes.get(name, [])
+        routed = 0
+        for result in results:
+            # Output handler (dashboard, alerts, etc.)
+            if handler is not None:
+                try:
+                    handler(result)
+                except Exception as e:
+                    print(f"[ExecutionPipeline] Error in output handler of '{name}': {e}")
+                    continue
+
+            # Route result to next agents
+            for dest in next_agents:
+                self.enqueue_task(dest, result)
+            routed += 1
+        return routed
 
     def reset(self):
         """
@@ -94,13 +221,19 @@ class ExecutionPipeline:
         """
         for q in self.queues.values():
             with q.mutex:
-                q.queue.clear()
+                cleared = sum(1 for item in q.queue if item is not _STOP)
+                q.queue = type(q.queue)(item for item in q.queue if item is _STOP)  # keep pending stops
+            with self._lock:
+                self._outstanding -= cleared
+                if self._outstanding == 0:
+                    self._idle.notify_all()
         self.routes = {}
         print("[ExecutionPipeline] Pipeline reset complete.")
 
 
 # Example usage
 if __name__ == "__main__":
+    import time
     from atheris.embedded.learning_agent import LearningAgent
     from atheris.embedded.analytical_agent import AnalyticalAgent
     from atheris.embedded.output_agent import OutputAgent
@@ -128,6 +261,6 @@ if __name__ == "__main__":
 
     try:
         while True:
-            pass
+            time.sleep(1)
     except KeyboardInterrupt:
         pipeline.stop()
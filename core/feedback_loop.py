@@ -1,20 +1,25 @@
 import time
-from typing import Callable, Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional
 from atheris.core.agent_base import AgentBase
+from atheris.core.agent_scheduler import AgentScheduler
 from atheris.core.persistence_manager import PersistenceManager
 
 
 class FeedbackLoop:
-    def __init__(self, agents: Dict[str, AgentBase], scoring_fn: Callable[[str, Any], float]):
+    def __init__(self, agents: Dict[str, AgentBase], scoring_fn: Callable[[str, Any], float],
+                 scheduler: Optional[AgentScheduler] = None):
         """
         Initialize feedback loop system.
 
         Args:
             agents (dict): Mapping of agent names to instances
             scoring_fn (func): Function to evaluate output quality
+            scheduler (AgentScheduler): Scheduler running the agents under the
+                same names, so interval changes apply to the pending run
         """
         self.agents = agents
         self.scoring_fn = scoring_fn
+        self.scheduler = scheduler
         self.persistence = PersistenceManager()
         self.feedback_data: Dict[str, List[float]] = {}
 
@@ -65,6 +70,12 @@ class FeedbackLoop:
             agent.interval = max(agent.interval - 1, 1)
             print(f"[FeedbackLoop] Speeding up '{agent_name}' to {agent.interval}s")
 
+        if self.scheduler is not None:
+            try:
+                self.scheduler.set_interval(agent_name, agent.interval)
+            except KeyError:
+                print(f"[FeedbackLoop] Agent '{agent_name}' is not scheduled; new interval applies next run")
+
         # Save new interval to persistence
         self.persistence.checkpoint_agent(agent_name, {"interval": agent.interval})
 
@@ -73,11 +84,11 @@ class FeedbackLoop:
         Load past feedback scores from logs (for continuity).
         """
         for agent_name in self.agents.keys():
-            logs = self.persistence.get_log_history(agent_name)
-            for entry in logs:
-                if "feedback_score" in entry.get("event", {}):
-                    score = entry["event"]["feedback_score"]
-                    self.feedback_data.setdefault(agent_name, []).append(score)
+            entries = self.persistence.iter_log_history(
+                agent_name, predicate=lambda entry: "feedback_score" in entry.get("event", {})
+            )
+            for entry in entries:
+                self.feedback_data.setdefault(agent_name, []).append(entry["event"]["feedback_score"])
 
     def manual_feedback(self, agent_name: str, score: float):
         """
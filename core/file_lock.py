@@ -0,0 +1,81 @@
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows: locks only cover threads of one process
+    fcntl = None
+
+
+class FileLock:
+    def __init__(self, path: str):
+        """
+        Advisory lock shared between threads and processes through a lock file.
+
+        Threads of one process are serialized by a thread lock; processes by
+        fcntl.flock on `path`. The lock file is opened lazily and reopened
+        after a fork, since a descriptor inherited from the parent would
+        share the parent's lock instead of taking its own.
+
+        Args:
+            path (str): Lock file path (created if missing)
+        """
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+
+    def _descriptor(self) -> int:
+        if self._fd is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Hold the lock exclusively, blocking until it is available."""
+        with self._hold(fcntl.LOCK_EX if fcntl else 0, blocking=True):
+            yield
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        """Hold the lock shared with other processes' readers."""
+        with self._hold(fcntl.LOCK_SH if fcntl else 0, blocking=True):
+            yield
+
+    @contextmanager
+    def try_exclusive(self) -> Iterator[bool]:
+        """Take the lock exclusively if it is free; yields whether it was taken."""
+        with self._hold(fcntl.LOCK_EX if fcntl else 0, blocking=False) as acquired:
+            yield acquired
+
+    @contextmanager
+    def _hold(self, operation: int, blocking: bool) -> Iterator[bool]:
+        if not self._thread_lock.acquire(blocking):
+            yield False
+            return
+        try:
+            if fcntl is None:
+                yield True
+                return
+            fd = self._descriptor()
+            try:
+                fcntl.flock(fd, operation if blocking else operation | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            self._thread_lock.release()
+
+    def close(self):
+        """Close the lock file descriptor."""
+        if self._fd is not None and self._pid == os.getpid():
+            os.close(self._fd)
+        self._fd = None
@@ -0,0 +1,206 @@
+import os
+import json
+import mmap
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from atheris.core.segmented_log import SegmentedLog, RECORD_HEADER, build_index, read_index, index_path
+from atheris.core.serialization import detect_codec
+
+
+class SegmentReader:
+    def __init__(self, path: str, index: Optional[List[Tuple[float, int]]] = None):
+        """
+        Read-only, memory-mapped view of one log segment.
+
+        Records are decoded one at a time straight from the mapping, so
+        scanning a segment keeps memory flat whatever its size. The mapping
+        covers the segment as it was when opened; later appends are not seen.
+
+        Args:
+            path (str): Segment file path
+            index (list): Sparse (timestamp, offset) index of the segment; read
+                from the '.idx' file (or rebuilt) when omitted
+        """
+        self.path = path
+        self.binary = not path.endswith(".jsonl")
+        self._index = index
+        self._file = open(path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        # mmap refuses zero-length files
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "SegmentReader":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def offsets(self, start: int = 0) -> Iterator[int]:
+        """
+        Yield the byte offset of every record from `start` (a record
+        boundary) on, walking the framing without decoding anything.
+        """
+        pos = start
+        if self.binary:
+            while pos + RECORD_HEADER.size <= self.size:
+                (length,) = RECORD_HEADER.unpack_from(self._map, pos)
+                end = pos + RECORD_HEADER.size + length
+                if end > self.size:
+                    return  # torn trailing record
+                yield pos
+                pos = end
+            return
+
+        while pos < self.size:
+            end = self._map.find(b"\n", pos)
+            if end < 0:
+                end = self.size
+            if end > pos:
+                yield pos
+            pos = end + 1
+
+    def record_at(self, offset: int) -> Dict[str, Any]:
+        """
+        Decode the record starting at `offset`.
+
+        Raises:
+            ValueError: If the record is not valid for the segment's codec
+        """
+        if self.binary:
+            (length,) = RECORD_HEADER.unpack_from(self._map, offset)
+            start = offset + RECORD_HEADER.size
+            payload = self._map[start:start + length]
+            return detect_codec(payload).decode(payload)
+
+        end = self._map.find(b"\n", offset)
+        return json.loads(self._map[offset:end if end >= 0 else self.size])
+
+    def records(self, start: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (offset, record) from `start` on, skipping undecodable records."""
+        for offset in self.offsets(start):
+            try:
+                yield offset, self.record_at(offset)
+            except ValueError:
+                continue
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for _, record in self.records():
+            yield record
+
+    def index(self) -> List[Tuple[float, int]]:
+        """Return the sparse (timestamp, offset) index of the segment."""
+        if self._index is None:
+            self._index = read_index(index_path(self.path)) or build_index(self.path)
+        return self._index
+
+    def seek_time(self, timestamp: float) -> int:
+        """
+        Return the offset of the first record with a timestamp >= `timestamp`
+        (or the segment size if there is none): a binary search over the
+        sparse index followed by a short scan.
+        """
+        points = self.index()
+        lo, hi = 0, len(points)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if points[mid][0] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        start = points[lo - 1][1] if lo > 0 else 0
+
+        for offset, record in self.records(start):
+            if record.get("timestamp", 0) >= timestamp:
+                return offset
+        return self.size
+
+    def range(self, since: Optional[float] = None, until: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily yield records with since <= timestamp <= until."""
+        start = self.seek_time(since) if since is not None else 0
+        for _, record in self.records(start):
+            timestamp = record.get("timestamp", 0)
+            if until is not None and timestamp > until:
+                continue  # a later record may still be in range; read to the end of the segment
+            if since is not None and timestamp < since:
+                continue
+            yield record
+
+
+class LogReader:
+    def __init__(self, log: SegmentedLog):
+        """
+        Read-only, memory-mapped access to a segmented log for analytics
+        and backtests over long histories.
+
+        Segments are mapped one at a time while iterating, so memory use
+        does not grow with the amount of history scanned.
+
+        Args:
+            log (SegmentedLog): Log to read
+        """
+        self.log = log
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.range()
+
+    def range(self, since: Optional[float] = None, until: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield records with since <= timestamp <= until, oldest first,
+        skipping segments that lie outside the window.
+        """
+        for path, offset in self.log.plan_range(since, until):
+            try:
+                reader = SegmentReader(path)
+            except FileNotFoundError:
+                continue  # removed by compaction since planning
+            past_until = False
+            with reader:
+                for _, record in reader.records(offset):
+                    timestamp = record.get("timestamp", 0)
+                    if since is not None and timestamp < since:
+                        continue
+                    if until is not None and timestamp > until:
+                        past_until = True  # later records of this segment may still be in range
+                        continue
+                    yield record
+            if past_until:
+                return
+
+    def slice(self, start: int, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield records by position (oldest record is 0), like
+        list[start:stop]; records before `start` are skipped without
+        being decoded.
+        """
+        position = 0
+        for reader in self._readers():
+            with reader:
+                for offset in reader.offsets():
+                    if stop is not None and position >= stop:
+                        return
+                    if position >= start:
+                        try:
+                            yield reader.record_at(offset)
+                        except ValueError:
+                            pass
+                    position += 1
+
+    def count(self) -> int:
+        """Return the number of records without decoding them."""
+        total = 0
+        for reader in self._readers():
+            with reader:
+                total += sum(1 for _ in reader.offsets())
+        return total
+
+    def _readers(self) -> Iterator[SegmentReader]:
+        files = self.log.segment_files()
+        for index in sorted(files):
+            try:
+                yield SegmentReader(files[index])
+            except FileNotFoundError:
+                continue
@@ -0,0 +1,82 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class RetentionPolicy:
+    def __init__(self, max_age: Optional[float] = None, max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = None, downsample: Optional[List[Tuple[float, float]]] = None):
+        """
+        Retention rules for an agent's log.
+
+        Args:
+            max_age (float): Drop entries older than this many seconds
+            max_entries (int): Keep at most this many entries (newest win)
+            max_bytes (int): Keep at most this many stored bytes (newest win)
+            downsample (list): [age, bucket] tiers in seconds; entries older than
+                `age` are reduced to one per `bucket`, e.g.
+                [[3600, 60], [86400, 3600]] keeps one per minute after an hour
+                and one per hour after a day
+        """
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.downsample = sorted((float(age), float(bucket)) for age, bucket in (downsample or []))
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RetentionPolicy":
+        """
+        Build a policy from a config dict with the constructor's keys.
+        """
+        unknown = set(config) - {"max_age", "max_entries", "max_bytes", "downsample"}
+        if unknown:
+            raise ValueError(f"Unknown retention options: {sorted(unknown)}")
+        return cls(**config)
+
+    def bucket_for(self, age: float) -> Optional[float]:
+        """Return the downsampling bucket size for an entry of `age` seconds, if any."""
+        bucket = None
+        for tier_age, tier_bucket in self.downsample:
+            if age >= tier_age:
+                bucket = tier_bucket
+        return bucket
+
+    def filter(self, entries: Iterable[Dict[str, Any]], now: float) -> Iterator[Dict[str, Any]]:
+        """
+        Apply max_age and downsampling to time-ordered log entries, keeping
+        the first entry of each bucket. Size limits are applied by the
+        backend, which knows how many newer entries remain untouched.
+        """
+        last_bucket = None
+        for entry in entries:
+            age = now - entry.get("timestamp", now)
+            if self.max_age is not None and age > self.max_age:
+                continue
+
+            bucket = self.bucket_for(age)
+            if bucket is None:
+                last_bucket = None
+                yield entry
+                continue
+
+            key = (bucket, int(entry["timestamp"] // bucket))
+            if key == last_bucket:
+                continue
+            last_bucket = key
+            yield entry
+
+    def entries_to_drop(self, sizes: List[int], newer_entries: int = 0, newer_bytes: int = 0) -> int:
+        """
+        Return how many of the oldest kept entries (with encoded `sizes`) must
+        go so that, together with entries newer than them, the log respects
+        max_entries and max_bytes.
+        """
+        drop = 0
+        if self.max_entries is not None:
+            drop = max(drop, len(sizes) + newer_entries - self.max_entries)
+        if self.max_bytes is not None:
+            excess = sum(sizes) + newer_bytes - self.max_bytes
+            count = 0
+            while excess > 0 and count < len(sizes):
+                excess -= sizes[count]
+                count += 1
+            drop = max(drop, count)
+        return min(max(drop, 0), len(sizes))
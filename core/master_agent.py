@@ -1,6 +1,5 @@
-import threading
 import time
-from typing import Dict, List
+from typing import Dict
 
 # Agent imports (defined in other files)
 from atheris.embedded.learning_agent import LearningAgent
@@ -8,6 +7,11 @@ from atheris.embedded.analytical_agent import AnalyticalAgent
 from atheris.embedded.output_agent import OutputAgent
 from atheris.interactive.responder_agent import ResponderAgent
 from atheris.interactive.chatbot_agent import ChatBotAgent
+from atheris.core.persistence_manager import PersistenceManager, configure as configure_persistence
+from atheris.core.core_events import event_bus
+from atheris.core.agent_scheduler import AgentScheduler, SCHEDULER_WORKERS
+from atheris.core.async_runtime import AsyncAgentRuntime, DEFAULT_CONCURRENCY
+from atheris.utils.ipc_transport import TransportHub
 
 class MasterAgent:
     def __init__(self, config: Dict):
@@ -15,6 +19,15 @@ class MasterAgent:
         Initialize the master agent with configuration for each AI agent.
         """
         self.config = config
+        if "persistence" in config:
+            configure_persistence(config["persistence"])
+        self.transport_hub = None
+        if config.get("events", {}).get("transport"):
+            # Agents in worker processes connect to this hub to share events
+            self.transport_hub = TransportHub(config["events"]["transport"])
+            self.transport_hub.start()
+        if "events" in config:
+            event_bus.configure(**config["events"])
         self.agents = {
             "learning": LearningAgent(config.get("learning", {})),
             "analysis": AnalyticalAgent(config.get("analysis", {})),
@@ -22,32 +35,37 @@ class MasterAgent:
             "responder": ResponderAgent(config.get("responder", {})),
             "chatbot": ChatBotAgent(config.get("chatbot", {})),
         }
-        self.agent_threads: List[threading.Thread] = []
+        # Defaults for every agent; an agent's own config may override
+        # "schedule" and "jitter"
+        self.scheduler_config = config.get("scheduler", {})
+        self.scheduler = AgentScheduler(self.scheduler_config.get("workers", SCHEDULER_WORKERS))
+        # Agents implementing arun() share one event loop instead; their
+        # config may set "max_concurrency"
+        self.async_runtime = AsyncAgentRuntime()
         self.running = False
+        self.persistence = PersistenceManager()
 
     def start_all_agents(self):
         """
-        Start all agents in individual threads.
+        Schedule all agents on the shared scheduler, or in the async runtime
+        for agents implementing arun().
         """
         self.running = True
+        self.persistence.start_log_compaction()
+        self.scheduler.start()
         for name, agent in self.agents.items():
-            thread = threading.Thread(target=self._run_agent_loop, args=(name, agent), daemon=True)
-            self.agent_threads.append(thread)
-            thread.start()
+            if agent.is_async:
+                self.async_runtime.add(name, agent, agent.config.get("max_concurrency", DEFAULT_CONCURRENCY))
+                print(f"[MasterAgent] Started agent '{name}' (async)")
+                continue
+            self.scheduler.schedule(
+                name, agent,
+                mode=agent.config.get("schedule", self.scheduler_config.get("mode", "fixed_delay")),
+                jitter=agent.config.get("jitter", self.scheduler_config.get("jitter", 0.0)),
+            )
             print(f"[MasterAgent] Started agent '{name}'")
-
-    def _run_agent_loop(self, name: str, agent):
-        """
-        Continuously run an agent on its defined interval.
-        """
-        print(f"[MasterAgent] Running loop for agent: {name}")
-        while self.running:
-            try:
-                agent.run()
-                time.sleep(agent.interval)
-            except Exception as e:
-                print(f"[MasterAgent] Error in '{name}': {e}")
-                time.sleep(3)
+        if any(agent.is_async for agent in self.agents.values()):
+            self.async_runtime.start()
 
     def stop_all_agents(self):
         """
@@ -55,14 +73,26 @@ class MasterAgent:
         """
         print("[MasterAgent] Stopping all agents...")
         self.running = False
+        self.scheduler.stop()
+        self.async_runtime.stop()
         for agent in self.agents.values():
             agent.stop()
+        if not event_bus.drain(timeout=10):
+            print("[MasterAgent] Timed out waiting for queued events")
+        event_bus.stop_durable(timeout=10)
+        if event_bus.transport is not None:
+            event_bus.transport.close()
+        if self.transport_hub is not None:
+            self.transport_hub.stop()
+        self.persistence.stop_log_compaction()
+        PersistenceManager.flush_all()
 
     def get_status(self) -> Dict:
         """
         Returns a summary of the system status and agent health.
         """
-        return {name: agent.status() for name, agent in self.agents.items()}
+        schedule = {**self.scheduler.status(), **self.async_runtime.status()}
+        return {name: {**agent.status(), "schedule": schedule.get(name)} for name, agent in self.agents.items()}
 
 # Run as script (for testing purposes)
 if __name__ == "__main__":
@@ -70,8 +100,11 @@ if __name__ == "__main__":
         "learning": {"interval": 5},
         "analysis": {"interval": 8},
         "output": {"interval": 10},
-        "responder": {"interval": 4},
-        "chatbot": {"interval": 6}
+        "responder": {"interval": 4, "schedule": "fixed_rate"},
+        "chatbot": {"interval": 6},
+        "persistence": {"durability": "buffered", "flush_interval": 2.0},
+        "events": {"dispatch": "async", "workers": 4},
+        "scheduler": {"workers": 4, "jitter": 0.5}
     }
 
     master_agent = MasterAgent(sample_config)
@@ -1,52 +1,197 @@
 import time
 import threading
-from typing import Dict, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Union
 from atheris.core.agent_base import AgentBase
 
+# Cycle reports kept for cycle_stats()
+CYCLE_HISTORY = 100
+
+
+def groups_to_dag(groups: List[List[str]]) -> Dict[str, List[str]]:
+    """Dependencies equivalent to running `groups` one after another."""
+    dag: Dict[str, List[str]] = {}
+    previous: List[str] = []
+    for group in groups:
+        for name in group:
+            dag[name] = list(previous)
+        previous = list(group)
+    return dag
+
+
+def validate_dag(dag: Dict[str, List[str]]) -> List[str]:
+    """
+    Return the agents of `dag` in a topological order, raising ValueError
+    if the dependencies contain a cycle.
+    """
+    nodes = set(dag) | {up for ups in dag.values() for up in ups}
+    pending = {name: len(set(dag.get(name, []))) for name in nodes}
+    downstream: Dict[str, List[str]] = {name: [] for name in nodes}
+    for name, ups in dag.items():
+        for up in set(ups):
+            downstream[up].append(name)
+    ready = deque(sorted(name for name, count in pending.items() if count == 0))
+    order = []
+    while ready:
+        name = ready.popleft()
+        order.append(name)
+        for dest in downstream[name]:
+            pending[dest] -= 1
+            if pending[dest] == 0:
+                ready.append(dest)
+    if len(order) != len(nodes):
+        raise ValueError(f"Schedule has a dependency cycle among: {sorted(nodes - set(order))}")
+    return order
+
+
 class OrchestrationEngine:
-    def __init__(self, agents: Dict[str, AgentBase], schedule: List[List[str]]):
+    def __init__(self, agents: Dict[str, AgentBase], schedule: Union[List[List[str]], Dict[str, List[str]]],
+                 workers: Optional[int] = None):
         """
         Initialize the orchestration engine.
 
+        Each cycle runs every agent once. An agent starts as soon as all of
+        its upstream agents have finished, on a worker pool that persists
+        across cycles. Each cycle's timing is recorded, including the
+        critical path: the chain of agents, each gated by the one before,
+        that ends with the last agent to finish and so bounds the cycle
+        latency.
+
         Args:
             agents (dict): All available agents, indexed by name
-            schedule (list of list): Ordered execution groups by agent names
+            schedule: Dependency DAG mapping each agent to its upstream
+                agents, e.g. {"analysis": ["learning"], "output": ["analysis"]},
+                or ordered execution groups by agent names (each group
+                depends on the whole previous one)
+            workers (int): Agents that may run at the same time (default: one per agent)
         """
         self.agents = agents
         self.schedule = schedule  # e.g. [["learning"], ["analysis"], ["output"]]
+        self.dag = self._to_dag(schedule)
         self.running = False
         self.interval = 10  # default full-cycle interval
+        self.workers = workers or max(1, len(agents))
+        self.cycles = 0
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=CYCLE_HISTORY)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._wake = threading.Event()
+
+    @staticmethod
+    def _to_dag(schedule: Union[List[List[str]], Dict[str, List[str]]]) -> Dict[str, List[str]]:
+        dag = dict(schedule) if isinstance(schedule, dict) else groups_to_dag(schedule)
+        for ups in list(dag.values()):
+            for up in ups:
+                dag.setdefault(up, [])  # upstream-only agents are roots
+        validate_dag(dag)
+        return dag
 
     def start(self):
         """Start the orchestration loop in a separate thread"""
         print("[OrchestrationEngine] Starting orchestration...")
         self.running = True
+        self._wake.clear()
         threading.Thread(target=self._run_loop, daemon=True).start()
 
     def _run_loop(self):
         """Main execution loop"""
         while self.running:
             print("[OrchestrationEngine] Beginning execution cycle...")
-            for step_index, group in enumerate(self.schedule):
-                print(f"[OrchestrationEngine] Executing step {step_index+1}: {group}")
-                self._execute_group(group)
-                time.sleep(0.5)  # buffer between steps
-
+            self.run_cycle()
             print("[OrchestrationEngine] Cycle complete. Sleeping...\n")
-            time.sleep(self.interval)
+            self._wake.wait(self.interval)
 
-    def _execute_group(self, group: List[str]):
-        """Execute a group of agents in parallel"""
-        threads = []
-        for name in group:
+    def run_cycle(self) -> Dict[str, Any]:
+        """
+        Run every agent of the schedule once, each as soon as its upstream
+        agents are done, and return the cycle report (see cycle_stats()).
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="orchestration")
+        dag = self.dag
+        downstream: Dict[str, List[str]] = {name: [] for name in dag}
+        for name, ups in dag.items():
+            for up in set(ups):
+                downstream[up].append(name)
+        pending = {name: len(set(ups)) for name, ups in dag.items()}
+        timings: Dict[str, Dict[str, float]] = {}
+        done = threading.Condition()
+        cycle_start = time.monotonic()
+        executor = self._executor
+
+        def launch(name: str):
             agent = self.agents.get(name)
-            if agent and agent.active:
-                thread = threading.Thread(target=self._safe_execute, args=(name, agent), daemon=True)
-                threads.append(thread)
-                thread.start()
-
-        for thread in threads:
-            thread.join()
+            if agent is not None and agent.active:
+                try:
+                    executor.submit(run, name, agent, time.monotonic())
+                    return
+                except RuntimeError:  # stopped mid-cycle: the rest is skipped
+                    pass
+            now = time.monotonic()
+            finish(name, now, now)
+
+        def run(name: str, agent: AgentBase, ready: float):
+            started = time.monotonic()
+            self._safe_execute(name, agent)
+            finish(name, started, time.monotonic(), ready)
+
+        def finish(name: str, started: float, finished: float, ready: Optional[float] = None):
+            released = []
+            with done:
+                timings[name] = {
+                    "start": started - cycle_start,
+                    "finish": finished - cycle_start,
+                    "duration": finished - started,
+                    "queued": started - (ready if ready is not None else started),  # waiting for a worker
+                }
+                for dest in downstream[name]:
+                    pending[dest] -= 1
+                    if pending[dest] == 0:
+                        released.append(dest)
+                if len(timings) == len(dag):
+                    done.notify_all()
+            for dest in released:
+                launch(dest)
+
+        for name in [name for name, count in pending.items() if count == 0]:
+            launch(name)
+        with done:
+            done.wait_for(lambda: len(timings) == len(dag))
+
+        report = self._report(dag, timings, time.monotonic() - cycle_start)
+        self.history.append(report)
+        path = " → ".join(f"{name} ({timings[name]['duration']:.2f}s)" for name in report["critical_path"])
+        print(f"[OrchestrationEngine] Cycle {report['cycle']} took {report['duration']:.2f}s; "
+              f"critical path: {path}")
+        return report
+
+    def _report(self, dag: Dict[str, List[str]], timings: Dict[str, Dict[str, float]],
+                duration: float) -> Dict[str, Any]:
+        self.cycles += 1
+        path: List[str] = []
+        node = max(timings, key=lambda name: timings[name]["finish"]) if timings else None
+        while node is not None:
+            path.append(node)
+            ups = dag.get(node, [])
+            node = max(ups, key=lambda name: timings[name]["finish"]) if ups else None
+        path.reverse()
+        return {
+            "cycle": self.cycles,
+            "duration": duration,
+            "critical_path": path,
+            "bottleneck": max(path, key=lambda name: timings[name]["duration"]) if path else None,
+            "agents": timings,
+        }
+
+    def cycle_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Report of the last cycle: {"cycle", "duration", "critical_path",
+        "bottleneck", "agents": {name: {"start", "finish", "duration",
+        "queued"}}}, times in seconds from the cycle start. The bottleneck is
+        the slowest agent on the critical path. Earlier cycles are kept in
+        `history`.
+        """
+        return self.history[-1] if self.history else None
 
     def _safe_execute(self, name: str, agent: AgentBase):
         """Safely execute agent and handle errors"""
@@ -59,10 +204,15 @@ class OrchestrationEngine:
     def stop(self):
         """Stop orchestration cycle"""
         self.running = False
+        self._wake.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         print("[OrchestrationEngine] Orchestration stopped.")
 
-    def update_schedule(self, new_schedule: List[List[str]]):
-        """Dynamically update agent execution order"""
+    def update_schedule(self, new_schedule: Union[List[List[str]], Dict[str, List[str]]]):
+        """Dynamically update agent dependencies; applies from the next cycle"""
+        self.dag = self._to_dag(new_schedule)
         self.schedule = new_schedule
         print(f"[OrchestrationEngine] Schedule updated to: {new_schedule}")
 
@@ -84,7 +234,7 @@ if __name__ == "__main__":
         "output": OutputAgent({"interval": 3})
     }
 
-    schedule = [["learning"], ["analysis"], ["output"]]
+    schedule = {"analysis": ["learning"], "output": ["analysis"]}
     engine = OrchestrationEngine(agents, schedule)
     engine.start()
 
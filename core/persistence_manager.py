@@ -1,85 +1,409 @@
 import os
-import json
 import time
-from typing import Any, Dict, Optional
+import pickle
+import atexit
+import weakref
+import itertools
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+from atheris.core.segmented_log import LOG_SEGMENT_BYTES
+from atheris.core.storage_backends import StorageBackend, FileBackend, SQLiteBackend
+from atheris.core.serialization import Codec, get_codec, record_codec
+from atheris.core.log_reader import LogReader
+from atheris.core.log_retention import RetentionPolicy
 
 STORAGE_ROOT = "./storage/"
 
+# buffered: saves are coalesced in memory and written by a background flusher
+# write_through: every save is written immediately (default)
+# fsync: every save is written immediately and fsync'ed to disk
+DURABILITY_LEVELS = ("buffered", "write_through", "fsync")
+
+# Defaults applied to every PersistenceManager created without explicit options
+PERSISTENCE_DEFAULTS: Dict[str, Any] = {
+    "backend": "file",  # 'file' or 'sqlite'
+    "sqlite_path": None,  # defaults to <base_path>/atheris.db
+    "durability": "write_through",
+    "flush_interval": 1.0,  # seconds between background flushes
+    "max_pending": 100,  # pending keys that trigger an early flush
+    "read_cache": True,  # keep loaded values in memory as pickles, skipping disk reads and parsing
+    "codec": "json",  # default codec for state ('json', 'compact_json', 'pickle', 'msgpack')
+    "codecs": {},  # per-agent or per-'agent/key' codec overrides, e.g. {"indexer/latest": "pickle"}
+    "delta_keys": [],  # 'agent' or 'agent/key' entries saved as delta checkpoints
+    "delta_compact_every": 50,  # deltas written before the next full snapshot
+    # Per-agent (or '*') RetentionPolicy options for logs. Empty by default:
+    # nothing is compacted until an agent opts in, e.g.
+    # {"traffic_monitor": {"max_age": 2592000, "downsample": [[3600, 60], [86400, 3600]]}}.
+    # Mind agents that read other agents' history (e.g. FeedbackLoop scoring).
+    "retention": {},
+    "retention_interval": 300,  # seconds between background log compactions
+}
+
+_instances: "weakref.WeakSet[PersistenceManager]" = weakref.WeakSet()
+
+_MISSING = object()
+
+
+def _copy(value: Any) -> Any:
+    """Deep copy through pickle, several times faster than copy.deepcopy on state-sized dicts."""
+    return pickle.loads(pickle.dumps(value, protocol=5))
+
+
+def configure(options: Dict[str, Any]):
+    """
+    Update the defaults used by PersistenceManager instances created afterwards.
+
+    Args:
+        options (dict): Subset of PERSISTENCE_DEFAULTS (e.g. the 'persistence' config section)
+    """
+    unknown = set(options) - set(PERSISTENCE_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown persistence options: {sorted(unknown)}")
+    if options.get("durability", "write_through") not in DURABILITY_LEVELS:
+        raise ValueError(f"Unknown durability level: {options['durability']}")
+    if options.get("backend", "file") not in ("file", "sqlite"):
+        raise ValueError(f"Unknown persistence backend: {options['backend']}")
+    for codec_name in [options.get("codec", "json")] + list(options.get("codecs", {}).values()):
+        get_codec(codec_name)
+    for policy in options.get("retention", {}).values():
+        RetentionPolicy.from_config(policy)
+    PERSISTENCE_DEFAULTS.update(options)
+    print(f"[PersistenceManager] Defaults updated: {options}")
+
 
 class PersistenceManager:
-    def __init__(self, base_path: str = STORAGE_ROOT):
+    def __init__(self, base_path: str = STORAGE_ROOT, log_segment_bytes: int = LOG_SEGMENT_BYTES,
+                 durability: Optional[str] = None, flush_interval: Optional[float] = None,
+                 max_pending: Optional[int] = None, backend: Optional[StorageBackend] = None,
+                 read_cache: Optional[bool] = None, codecs: Optional[Dict[str, str]] = None,
+                 delta_keys: Optional[List[str]] = None, delta_compact_every: Optional[int] = None):
         """
         Initialize the persistence manager.
 
+        Several processes may share one storage root: state files are
+        replaced atomically, log appends and rotation are serialized with
+        fcntl locks, and delta checkpoints are written under the backend's
+        state lock, falling back to a full snapshot when another process
+        wrote the value since this one did. Buffered saves are only visible
+        to other processes once flushed.
+
         Args:
             base_path (str): Root path for all storage
+            log_segment_bytes (int): Size at which agent log segments rotate
+            durability (str): One of DURABILITY_LEVELS (defaults to PERSISTENCE_DEFAULTS)
+            flush_interval (float): Seconds between background flushes in buffered mode
+            max_pending (int): Number of pending keys that triggers an early flush
+            backend (StorageBackend): Storage implementation; built from
+                PERSISTENCE_DEFAULTS['backend'] when omitted
+            read_cache (bool): Cache values returned by load()
+            codecs (dict): Codec overrides keyed by 'agent' or 'agent/key'
+                (merged over PERSISTENCE_DEFAULTS['codecs'])
+            delta_keys (list): 'agent' or 'agent/key' entries saved as delta checkpoints
+            delta_compact_every (int): Deltas written before a full snapshot is taken again
         """
         self.base_path = base_path
+        self.durability = durability or PERSISTENCE_DEFAULTS["durability"]
+        self.flush_interval = flush_interval or PERSISTENCE_DEFAULTS["flush_interval"]
+        self.max_pending = max_pending or PERSISTENCE_DEFAULTS["max_pending"]
+        self.read_cache = PERSISTENCE_DEFAULTS["read_cache"] if read_cache is None else read_cache
+        self.default_codec = get_codec(PERSISTENCE_DEFAULTS["codec"])
+        self.codecs = {name: get_codec(codec_name) for name, codec_name in
+                       {**PERSISTENCE_DEFAULTS["codecs"], **(codecs or {})}.items()}
+        self.delta_keys = set(PERSISTENCE_DEFAULTS["delta_keys"] if delta_keys is None else delta_keys)
+        self.delta_compact_every = delta_compact_every or PERSISTENCE_DEFAULTS["delta_compact_every"]
+        if self.durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Unknown durability level: {self.durability}")
+
         if not os.path.exists(base_path):
             os.makedirs(base_path)
-        print(f"[PersistenceManager] Initialized at {base_path}")
+        self.backend = backend or self._create_backend(log_segment_bytes)
+
+        # Write-behind state: latest unsaved value per (agent, key)
+        self._pending: Dict[Tuple[str, str], Any] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
+
+        # Read cache: (agent, key) -> (backend version token, parsed value)
+        self._cache: Dict[Tuple[str, str], Tuple[Hashable, bytes]] = {}  # (version token, pickled value)
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Delta checkpoints: per (agent, key) fingerprints of the persisted
+        # top-level values and the number of deltas since the last full write
+        self._delta_state: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._delta_lock = threading.Lock()
+
+        # Log retention, keyed by agent name or '*' for all other agents
+        self.retention: Dict[str, RetentionPolicy] = {
+            name: RetentionPolicy.from_config(policy) for name, policy in PERSISTENCE_DEFAULTS["retention"].items()
+        }
+        self._compaction_stop = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+
+        _instances.add(self)
+        print(f"[PersistenceManager] Initialized at {base_path} "
+              f"({self.backend.__class__.__name__}, {self.durability})")
+
+    def _create_backend(self, log_segment_bytes: int) -> StorageBackend:
+        """Build the backend selected in PERSISTENCE_DEFAULTS."""
+        fsync = self.durability == "fsync"
+        if PERSISTENCE_DEFAULTS["backend"] == "sqlite":
+            db_path = PERSISTENCE_DEFAULTS["sqlite_path"] or os.path.join(self.base_path, "atheris.db")
+            return SQLiteBackend(db_path, fsync=fsync, codec_for=self.codec_for)
+        return FileBackend(self.base_path, log_segment_bytes, fsync=fsync, codec_for=self.codec_for)
+
+    def codec_for(self, agent_name: str, key: str) -> Codec:
+        """
+        Resolve the codec used to write (agent_name, key): an 'agent/key'
+        override wins over an 'agent' override, which wins over the default.
+        The key 'log' selects the codec of the agent's log.
+        """
+        return self.codecs.get(f"{agent_name}/{key}") or self.codecs.get(agent_name) or self.default_codec
 
-    def _file_path(self, agent_name: str, key: str) -> str:
+    @classmethod
+    def flush_all(cls):
         """
-        Construct the file path for a given agent and key.
+        Flush pending writes of every live PersistenceManager (e.g. on shutdown).
         """
-        agent_dir = os.path.join(self.base_path, agent_name)
-        if not os.path.exists(agent_dir):
-            os.makedirs(agent_dir)
-        return os.path.join(agent_dir, f"{key}.json")
+        for manager in list(_instances):
+            manager.flush()
 
     def save(self, agent_name: str, key: str, data: Any):
         """
-        Save data to a JSON file.
+        Save data under (agent_name, key).
+
+        In buffered mode the value is only recorded in memory; repeated saves
+        of the same (agent, key) are coalesced and the latest value is written
+        by the background flusher, or earlier on flush().
+
+        Keys listed in `delta_keys` are written as delta checkpoints: only the
+        top-level entries of a dict that changed since the previous save are
+        appended, and a full snapshot is written every `delta_compact_every`
+        deltas.
 
         Args:
             agent_name (str): Name of the agent
             key (str): Identifier (e.g., 'checkpoint', 'output')
             data (Any): JSON-serializable object
         """
-        path = self._file_path(agent_name, key)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        print(f"[PersistenceManager] Saved {key} for '{agent_name}'")
+        self._invalidate(agent_name, key)
+
+        if self.durability != "buffered" or self._closed:
+            self._write(agent_name, key, data)
+            print(f"[PersistenceManager] Saved {key} for '{agent_name}'")
+            return
+
+        with self._pending_lock:
+            self._pending[(agent_name, key)] = data
+            pending_count = len(self._pending)
+
+        self._ensure_flusher()
+        if pending_count >= self.max_pending:
+            self._flush_requested.set()
+
+    def flush(self):
+        """
+        Write all pending buffered saves in one backend batch.
+
+        If the batch fails (e.g. a value was mutated while being serialized),
+        its values stay pending and are retried on the next flush unless they
+        were superseded in the meantime.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return
+
+            try:
+                full = []
+                for (agent_name, key), data in batch.items():
+                    if self._uses_delta(agent_name, key):
+                        self._write(agent_name, key, data)
+                    else:
+                        full.append((agent_name, key, data))
+                self.backend.write_many(full)
+                print(f"[PersistenceManager] Flushed {len(batch)} pending saves")
+            except Exception as e:
+                print(f"[PersistenceManager] Flush failed, will retry: {e}")
+                with self._pending_lock:
+                    for pending_key, data in batch.items():
+                        self._pending.setdefault(pending_key, data)
+
+    def _uses_delta(self, agent_name: str, key: str) -> bool:
+        return f"{agent_name}/{key}" in self.delta_keys or agent_name in self.delta_keys
+
+    def _write(self, agent_name: str, key: str, data: Any):
+        """Write a value to the backend, as a delta when configured."""
+        if not self._uses_delta(agent_name, key):
+            self.backend.write(agent_name, key, data)
+            return
+
+        # Snapshot + delta updates span several files or statements; other
+        # processes sharing the storage must not interleave with them
+        with self._delta_lock, self.backend.state_lock(agent_name).exclusive():
+            self._write_delta(agent_name, key, data)
+
+    def _write_delta(self, agent_name: str, key: str, data: Any):
+        if not isinstance(data, dict):
+            self.backend.write(agent_name, key, data)  # also drops the deltas
+            self._delta_state.pop((agent_name, key), None)
+            return
+
+        codec = record_codec(self.codec_for(agent_name, key))
+        fingerprints = {k: hash(codec.encode(v)) for k, v in data.items()}
+        state = self._delta_state.get((agent_name, key))
+
+        # Deltas are computed against what this process last wrote; if
+        # another writer changed the value since, write it in full instead
+        if (state is None or state["count"] >= self.delta_compact_every or
+                state["version"] != self.backend.version(agent_name, key)):
+            # A full write drops the deltas after the snapshot. If we crash
+            # in between, replaying the old deltas over the new snapshot
+            # yields the same state, since each entry's last delta matches it.
+            self.backend.write(agent_name, key, data)
+            self._delta_state[(agent_name, key)] = {
+                "fingerprints": fingerprints, "count": 0, "version": self.backend.version(agent_name, key)
+            }
+            return
+
+        previous = state["fingerprints"]
+        changed = {k: data[k] for k, fp in fingerprints.items() if previous.get(k) != fp}
+        removed = [k for k in previous if k not in fingerprints]
+        if changed or removed:
+            self.backend.append_delta(agent_name, key, {"set": changed, "del": removed})
+            state["count"] += 1
+            state["version"] = self.backend.version(agent_name, key)
+        state["fingerprints"] = fingerprints
+
+    def close(self):
+        """
+        Stop the background flusher, write any pending data and close the backend.
+        """
+        self._closed = True
+        self.stop_log_compaction()
+        self._flush_requested.set()
+        if self._flusher and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=self.flush_interval * 2)
+        self.flush()
+        self.backend.close()
+
+    def _ensure_flusher(self):
+        """Start the background flusher thread on first buffered save."""
+        if self._flusher is None:
+            with self._flush_lock:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+                    self._flusher.start()
+
+    def _flush_loop(self):
+        """Flush pending saves every `flush_interval` seconds or when requested."""
+        while not self._closed:
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            self.flush()
 
     def load(self, agent_name: str, key: str) -> Optional[Any]:
         """
-        Load data from a JSON file.
+        Load data stored under (agent_name, key).
+
+        Pending buffered saves are returned before anything in the backend.
+        With the read cache enabled, a value is only re-read and re-parsed
+        when the backend's version token for the key has changed; otherwise
+        it is unpickled from the cache, which is cheaper than reading and
+        decoding it (see benchmarks/bench_read_cache.py). Every call returns
+        its own copy, so callers may keep and mutate it.
 
         Returns:
-            Loaded data or None if file not found.
+            Loaded data or None if nothing was stored.
         """
-        path = self._file_path(agent_name, key)
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return None
+        cache_key = (agent_name, key)
+        with self._pending_lock:
+            pending = self._pending.get(cache_key, _MISSING)
+        if pending is not _MISSING:
+            return _copy(pending)
+
+        if not self.read_cache:
+            return self._read(agent_name, key)
+
+        token = self.backend.version(agent_name, key)
+        if token is None:
+            return self._read(agent_name, key)
+
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == token:
+            self.cache_hits += 1
+            return pickle.loads(cached[1])
+
+        # If the key is rewritten between version() and read(), the stale
+        # token simply forces another read on the next load.
+        self.cache_misses += 1
+        value = self._read(agent_name, key)
+        with self._cache_lock:
+            self._cache[cache_key] = (token, pickle.dumps(value, protocol=5))
+        return value
+
+    def _read(self, agent_name: str, key: str) -> Optional[Any]:
+        """Read a value from the backend and apply any deltas recorded on top of it."""
+        with self.backend.state_lock(agent_name).shared():
+            value = self.backend.read(agent_name, key)
+            if isinstance(value, dict):
+                for delta in self.backend.read_deltas(agent_name, key):
+                    value.update(delta.get("set", {}))
+                    for removed in delta.get("del", []):
+                        value.pop(removed, None)
+            return value
+
+    def _invalidate(self, agent_name: str, key: str):
+        """Drop the cached value of (agent_name, key)."""
+        with self._cache_lock:
+            self._cache.pop((agent_name, key), None)
 
     def append_log(self, agent_name: str, log_data: Dict[str, Any]):
         """
-        Append a log entry with timestamp to agent's log file.
+        Append a log entry with timestamp to agent's log.
+
+        Appends are O(1): the file backend writes one JSON line to the active
+        log segment and the SQLite backend inserts one row.
 
         Args:
             log_data (dict): JSON log entry
         """
-        log_path = self._file_path(agent_name, "log")
-        existing = []
-
-        if os.path.exists(log_path):
-            with open(log_path, "r", encoding="utf-8") as f:
-                existing = json.load(f)
-
         log_entry = {
             "timestamp": time.time(),
             "event": log_data
         }
-        existing.append(log_entry)
-
-        with open(log_path, "w", encoding="utf-8") as f:
-            json.dump(existing, f, indent=2)
+        self.backend.append_log(agent_name, log_entry)
 
         print(f"[PersistenceManager] Logged event for '{agent_name}'")
 
+    def iter_log_history(self, agent_name: str, since: Optional[float] = None, until: Optional[float] = None,
+                         predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream agent's event log from oldest to newest, one entry at a time.
+
+        Args:
+            since (float): Only entries with timestamp >= since
+            until (float): Only entries with timestamp <= until
+            predicate (callable): Only entries for which predicate(entry) is true
+        """
+        entries = self.backend.iter_log(agent_name, since, until)
+        if predicate is not None:
+            entries = (entry for entry in entries if predicate(entry))
+        return entries
+
+    def open_log_reader(self, agent_name: str) -> LogReader:
+        """
+        Return a read-only, memory-mapped reader over an agent's log for
+        scanning long histories with flat memory use (file backend only).
+        """
+        return self.backend.open_log_reader(agent_name)
+
     def checkpoint_agent(self, agent_name: str, state_data: Dict[str, Any]):
         """
         Save an agent's checkpoint.
@@ -92,22 +416,97 @@ class PersistenceManager:
         """
         return self.load(agent_name, "checkpoint")
 
-    def get_log_history(self, agent_name: str) -> list:
+    def get_log_history(self, agent_name: str, since: Optional[float] = None, until: Optional[float] = None,
+                        limit: Optional[int] = None,
+                        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> list:
+        """
+        Return agent's event log, or the part of it selected by a time range
+        and predicate (see iter_log_history). Time ranges are answered from
+        the log's timestamp index without reading the rest of the history.
+
+        Args:
+            limit (int): Return at most this many entries, oldest first
+        """
+        entries = self.iter_log_history(agent_name, since, until, predicate)
+        if limit is not None:
+            entries = itertools.islice(entries, limit)
+        return list(entries)
+
+    def set_retention(self, agent_name: str, policy: Optional[RetentionPolicy]):
+        """
+        Set (or with None, remove) the retention policy of an agent; '*'
+        applies to every agent without its own policy.
+        """
+        if policy is None:
+            self.retention.pop(agent_name, None)
+        else:
+            self.retention[agent_name] = policy
+
+    def compact_logs(self, agent_name: Optional[str] = None) -> Dict[str, Tuple[int, int]]:
         """
-        Return agent's full event log.
+        Apply retention policies to one agent's log, or to every stored log.
+
+        Returns:
+            {agent: (entries before, entries after)} for the compacted logs.
+        """
+        agents = [agent_name] if agent_name else self.backend.log_agents()
+        results = {}
+        for name in agents:
+            policy = self.retention.get(name) or self.retention.get("*")
+            if policy is None:
+                continue
+            try:
+                results[name] = self.backend.compact_log(name, policy)
+            except Exception as e:
+                print(f"[PersistenceManager] Log compaction failed for '{name}': {e}")
+                continue
+            before, after = results[name]
+            if before != after:
+                print(f"[PersistenceManager] Compacted log of '{name}': {before} -> {after} entries")
+        return results
+
+    def start_log_compaction(self, interval: Optional[float] = None):
+        """
+        Run compact_logs() in a background thread every `interval` seconds.
+        Only one manager per storage root needs to do this.
         """
-        return self.load(agent_name, "log") or []
+        if self._compactor is not None:
+            return
+        interval = interval or PERSISTENCE_DEFAULTS["retention_interval"]
+        stop = self._compaction_stop = threading.Event()
+
+        def loop():
+            while not stop.wait(interval):
+                self.compact_logs()
+
+        self._compactor = threading.Thread(target=loop, daemon=True)
+        self._compactor.start()
+        print(f"[PersistenceManager] Log compaction every {interval}s")
+
+    def stop_log_compaction(self):
+        """Stop the background compaction thread if running."""
+        self._compaction_stop.set()
+        self._compactor = None
 
     def clear_agent_data(self, agent_name: str):
         """
         Delete all stored data for a given agent.
         """
-        agent_dir = os.path.join(self.base_path, agent_name)
-        if os.path.exists(agent_dir):
-            for f in os.listdir(agent_dir):
-                os.remove(os.path.join(agent_dir, f))
-            os.rmdir(agent_dir)
-            print(f"[PersistenceManager] Cleared data for '{agent_name}'")
+        with self._pending_lock:
+            for pending_key in [k for k in self._pending if k[0] == agent_name]:
+                del self._pending[pending_key]
+        with self._cache_lock:
+            for cache_key in [k for k in self._cache if k[0] == agent_name]:
+                del self._cache[cache_key]
+        with self._delta_lock:
+            for delta_key in [k for k in self._delta_state if k[0] == agent_name]:
+                del self._delta_state[delta_key]
+        self.backend.clear(agent_name)
+        print(f"[PersistenceManager] Cleared data for '{agent_name}'")
+
+
+# Write out buffered saves if the interpreter exits without an explicit flush
+atexit.register(PersistenceManager.flush_all)
 
 
 # Example usage
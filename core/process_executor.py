@@ -0,0 +1,223 @@
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Optional, Tuple, Type
+from atheris.core.agent_base import AgentBase
+from atheris.core.core_events import event_bus
+from atheris.core.file_lock import FileLock
+from atheris.core.persistence_manager import PERSISTENCE_DEFAULTS, configure as configure_persistence
+from atheris.utils.ipc_transport import TransportClient
+
+# "thread": the agent runs in the calling process (default)
+# "process": the agent's work runs in a ProcessPoolExecutor worker, so
+#   CPU-bound agents don't serialize on the GIL with every other agent
+EXECUTORS = ("thread", "process")
+
+PROCESS_WORKERS = os.cpu_count() or 2
+
+# Out-of-band buffers (numpy arrays, pickle.PickleBuffer) at least this large leave a worker
+# through shared memory instead of the result pipe
+OUT_OF_BAND_MIN_BYTES = 64 * 1024
+
+# Agent instances of this worker process, one per pipeline stage
+_worker_agents: Dict[Tuple[str, Type[AgentBase]], AgentBase] = {}
+_state_locks: Dict[str, FileLock] = {}
+
+
+def state_attributes(agent: AgentBase) -> Tuple[str, ...]:
+    """Attributes an agent keeps through PersistenceManager when run in a process (its `process_state`)."""
+    return tuple(getattr(agent, "process_state", ()))
+
+
+def load_state(agent: AgentBase):
+    """Set the agent's process_state attributes to their persisted values."""
+    persistence = getattr(agent, "persistence", None)
+    if persistence is None:
+        return
+    for attr in state_attributes(agent):
+        value = persistence.load(agent.agent_name, attr)
+        if value is not None:
+            setattr(agent, attr, value)
+
+
+def save_state(agent: AgentBase):
+    """Persist the agent's process_state attributes and flush them for other processes."""
+    persistence = getattr(agent, "persistence", None)
+    if persistence is None or not state_attributes(agent):
+        return
+    for attr in state_attributes(agent):
+        persistence.save(agent.agent_name, attr, getattr(agent, attr))
+    persistence.flush()
+
+
+def encode_results(results: Any) -> Tuple[bytes, List[Tuple[str, int]]]:
+    """
+    Pickle `results` with protocol 5, moving large out-of-band buffers into
+    shared memory segments. Returns the pickle and the (segment name, size)
+    of each buffer; decode_results() reads and releases the segments.
+    """
+    buffers: List[pickle.PickleBuffer] = []
+
+    def keep_out_of_band(buffer: pickle.PickleBuffer) -> bool:
+        if buffer.raw().nbytes < OUT_OF_BAND_MIN_BYTES:
+            return True  # serialize in-band
+        buffers.append(buffer)
+        return False
+
+    payload = pickle.dumps(results, protocol=5, buffer_callback=keep_out_of_band)
+    segments = []
+    try:
+        for buffer in buffers:
+            raw = buffer.raw()
+            segment = shared_memory.SharedMemory(create=True, size=raw.nbytes)
+            segment.buf[:raw.nbytes] = raw
+            segments.append((segment.name, raw.nbytes))
+            # The receiving process owns (and unlinks) the segment from here on
+            resource_tracker.unregister(segment._name, "shared_memory")
+            segment.close()
+    except Exception:
+        _release(segments)
+        raise
+    return payload, segments
+
+
+def decode_results(payload: bytes, segments: List[Tuple[str, int]]) -> Any:
+    """Rebuild results encoded by encode_results() and unlink their shared memory."""
+    try:
+        buffers = []
+        for name, size in segments:
+            segment = shared_memory.SharedMemory(name=name)
+            buffers.append(bytearray(segment.buf[:size]))
+            segment.close()
+        return pickle.loads(payload, buffers=buffers)
+    finally:
+        _release(segments)
+
+
+def _release(segments: List[Tuple[str, int]]):
+    for name, _ in segments:
+        try:
+            segment = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+        segment.close()
+        segment.unlink()
+
+
+def _state_lock(agent: AgentBase) -> FileLock:
+    lock = _state_locks.get(agent.agent_name)
+    if lock is None:
+        path = os.path.join(agent.persistence.base_path, f".{agent.agent_name}.process.lock")
+        lock = _state_locks[agent.agent_name] = FileLock(path)
+    return lock
+
+
+def _init_worker(persistence_defaults: Dict[str, Any], transport_path: Optional[str]):
+    # Spawned workers don't inherit configure() calls made in the parent
+    configure_persistence(persistence_defaults)
+    if transport_path is not None:
+        # Events emitted here reach the parent's (and other processes') subscribers
+        event_bus.attach_transport(TransportClient(transport_path))
+
+
+def _run_in_worker(stage: str, agent_class: Type[AgentBase], config: Dict[str, Any],
+                   items: List[Any], use_batch: bool) -> Tuple[bytes, List[Tuple[str, int]], bool]:
+    """
+    Run one pipeline batch on this worker's instance of the stage's agent.
+    Returns the encoded results and whether the batch emitted events that
+    no other process could receive (no transport).
+    """
+    agent = _worker_agents.get((stage, agent_class))
+    if agent is None:
+        agent = _worker_agents[(stage, agent_class)] = agent_class(config)
+    emitted = event_bus.emitted
+    if not state_attributes(agent):
+        results = run_items(stage, agent, items, use_batch)
+    else:
+        # Read-modify-write of the persisted state: one batch of the agent at a time
+        with _state_lock(agent).exclusive():
+            load_state(agent)  # other workers may have handled earlier batches
+            results = run_items(stage, agent, items, use_batch)
+            save_state(agent)
+    if event_bus.transport is not None:
+        event_bus.transport.flush(timeout=2)
+    events_lost = event_bus.transport is None and event_bus.emitted > emitted
+    return encode_results(results) + (events_lost,)
+
+
+def run_items(stage: str, agent: AgentBase, items: List[Any], use_batch: bool) -> List[Any]:
+    """
+    Run `items` through an agent the way ExecutionPipeline does: in one
+    run_with_batch() call, or one run_with_input() (or run()) call per item.
+    Failed items are reported and dropped.
+    """
+    if use_batch:
+        try:
+            return list(agent.run_with_batch(items))  # one result per item
+        except Exception as e:
+            print(f"[ExecutionPipeline] Error in '{stage}': {e}")
+            return []
+    results = []
+    for task_data in items:
+        try:
+            results.append(agent.run_with_input(task_data) if hasattr(agent, 'run_with_input') else agent.run())
+        except Exception as e:
+            print(f"[ExecutionPipeline] Error in '{stage}': {e}")
+    return results
+
+
+class ProcessRunner:
+    def __init__(self, workers: int = PROCESS_WORKERS):
+        """
+        Runs agent batches in a pool of worker processes.
+
+        Each worker keeps its own instance of every agent it has run, built
+        from the agent's class and config. Attributes listed in the agent's
+        `process_state` are loaded from PersistenceManager before each batch
+        and saved after it, since consecutive batches may land on different
+        workers; anything else an agent keeps in memory is per worker. An
+        agent with process_state runs one batch at a time across workers,
+        under a file lock next to its storage; stateless agents run batches
+        in parallel.
+        Results are pickled with protocol 5 and large buffers come back
+        through shared memory rather than the result pipe.
+        Workers connect to the parent event bus's TransportHub, if any, so
+        events emitted by an agent in a worker reach subscribers elsewhere.
+        Without a transport such events stay in the worker, and the first
+        batch of a stage that emits any prints a warning.
+
+        Args:
+            workers (int): Worker processes
+        """
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._warned_stages = set()
+
+    def run(self, stage: str, agent: AgentBase, items: List[Any], use_batch: bool) -> List[Any]:
+        """
+        Run a batch of a stage in a worker process and return its results;
+        blocks the calling thread (not the GIL) until they arrive.
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                transport_path = event_bus.transport.path if event_bus.transport is not None else None
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(dict(PERSISTENCE_DEFAULTS), transport_path))
+            future = self._pool.submit(_run_in_worker, stage, type(agent), agent.config, items, use_batch)
+        payload, segments, events_lost = future.result()
+        results = decode_results(payload, segments)
+        if events_lost and stage not in self._warned_stages:
+            self._warned_stages.add(stage)
+            print(f"[ProcessRunner] Warning: '{stage}' emitted events in a worker process with no transport "
+                  f"configured (events.transport); they reached only handlers in that worker")
+        load_state(agent)  # keep the local instance's status() current
+        return results
+
+    def shutdown(self, wait: bool = True):
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
@@ -0,0 +1,505 @@
+import os
+import re
+import json
+import time
+import bisect
+import shutil
+import struct
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from atheris.core.file_lock import FileLock
+from atheris.core.serialization import Codec, CompactJsonCodec, detect_codec
+
+LOG_SEGMENT_BYTES = 8 * 1024 * 1024  # rotate segments at ~8 MB
+SEAL_GRACE_SECONDS = 2.0  # sealed segments are left alone this long for in-flight appends
+
+# Binary segments store each record as a 4-byte big-endian length + payload
+RECORD_HEADER = struct.Struct(">I")
+
+# Sparse segment index ('<segment>.idx'): (timestamp, byte offset) of the
+# record starting a segment and of one record per INDEX_INTERVAL_BYTES after it
+INDEX_ENTRY = struct.Struct(">dQ")
+INDEX_INTERVAL_BYTES = 64 * 1024
+
+
+class SegmentedLog:
+    def __init__(self, directory: str, prefix: str = "log", max_segment_bytes: int = LOG_SEGMENT_BYTES,
+                 codec: Optional[Codec] = None):
+        """
+        Append-only log split into numbered segment files.
+
+        With a JSON codec each record is one compact JSON line (log.000000.jsonl);
+        with a binary codec records are length-prefixed (e.g. log.000000.pkl).
+        Either way appending costs O(1) regardless of how much history has been
+        written. Once the active segment grows past `max_segment_bytes`, or the
+        codec changes, new records go to the next segment.
+
+        Several processes may append to the same log: rotation and the
+        append itself happen under an exclusive lock on '<prefix>.lock', and
+        only one process at a time compacts.
+
+        Records carrying a "timestamp" are expected to be appended in time
+        order (append(stamp=True) takes it under the append lock); each
+        segment keeps a sparse timestamp -> offset index next to it so that
+        iter_range() only reads the bytes around the requested window.
+
+        Args:
+            directory (str): Directory holding the segment files
+            prefix (str): Segment file prefix
+            max_segment_bytes (int): Size threshold for rotating segments
+            codec (Codec): Record codec (compact JSON lines by default)
+        """
+        self.directory = directory
+        self.prefix = prefix
+        self.max_segment_bytes = max_segment_bytes
+        self.codec = codec or CompactJsonCodec()
+        self.extension = self.codec.extension if self.codec.binary else "jsonl"
+        self._pattern = re.compile(rf"^{re.escape(prefix)}\.(\d{{6}})\.(\w+)$")
+        self._active_index: Optional[int] = None
+        self._lock = FileLock(os.path.join(directory, f"{prefix}.lock"))
+        self._compact_lock = FileLock(os.path.join(directory, f"{prefix}.compact.lock"))
+        self._indexed_path: Optional[str] = None
+        self._indexed_offset = 0
+        self._index_cache: Dict[str, Tuple[Tuple[int, int], List[Tuple[float, int]]]] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def segment_path(self, index: int, extension: Optional[str] = None) -> str:
+        """Return the file path of segment `index`."""
+        return os.path.join(self.directory, f"{self.prefix}.{index:06d}.{extension or self.extension}")
+
+    def segment_files(self) -> Dict[int, str]:
+        """Return {index: path} for all existing segments."""
+        if not os.path.isdir(self.directory):
+            return {}
+        files = {}
+        for name in os.listdir(self.directory):
+            match = self._pattern.match(name)
+            if match:
+                files[int(match.group(1))] = os.path.join(self.directory, name)
+        return files
+
+    def segments(self) -> List[int]:
+        """Return the indices of all existing segments in ascending order."""
+        return sorted(self.segment_files())
+
+    def encode_record(self, record: Dict[str, Any]) -> bytes:
+        """Frame a record for this log's segment format."""
+        if self.codec.binary:
+            return frame_record(self.codec.encode(record))
+        return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+    def append(self, record: Dict[str, Any], stamp: bool = False) -> Tuple[int, int]:
+        """
+        Append a single record to the active segment, rotating if needed.
+
+        Args:
+            record (dict): Record to append
+            stamp (bool): Set the record's "timestamp" to the current time
+                under the append lock, so concurrent appends (from threads
+                or processes) land in timestamp order
+
+        Returns:
+            (segment index, byte offset) at which the record was written.
+        """
+        data = None if stamp else self.encode_record(record)
+
+        with self._lock.exclusive():
+            if stamp:
+                record = dict(record, timestamp=time.time())
+                data = self.encode_record(record)
+
+
+            if self._active_index is None:
+                files = self.segment_files()
+                if not files:
+                    self._active_index = 0
+                else:
+                    last = max(files)
+                    # Never mix formats within one segment
+                    same_format = files[last] == self.segment_path(last)
+                    self._active_index = last if same_format else last + 1
+
+            # Follow segments opened by other writers or sealed by compaction
+            while os.path.exists(self.segment_path(self._active_index + 1)):
+                self._active_index += 1
+
+            path = self.segment_path(self._active_index)
+            try:
+                size = os.path.getsize(path)
+            except FileNotFoundError:
+                size = 0
+
+            if size and size + len(data) > self.max_segment_bytes:
+                self._active_index += 1
+                path = self.segment_path(self._active_index)
+                size = 0
+
+            timestamp = record.get("timestamp")
+            if isinstance(timestamp, (int, float)) and (
+                size == 0 or path != self._indexed_path or
+                size - self._indexed_offset >= INDEX_INTERVAL_BYTES
+            ):
+                append_bytes(index_path(path), INDEX_ENTRY.pack(timestamp, size))
+                self._indexed_path, self._indexed_offset = path, size
+
+            append_bytes(path, data)
+            return self._active_index, size
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all records from oldest to newest without loading the whole log.
+
+        A truncated trailing record (e.g. from a crash mid-append) is skipped.
+        """
+        files = self.segment_files()
+        for index in sorted(files):
+            yield from read_segment(files[index])
+
+    def iter_range(self, since: Optional[float] = None, until: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records with since <= timestamp <= until, oldest first.
+        """
+        if since is None and until is None:
+            yield from self.iter_records()
+            return
+
+        for path, offset in self.plan_range(since, until):
+            past_until = False
+            for _, record in iter_segment(path, offset):
+                timestamp = record.get("timestamp", 0)
+                if since is not None and timestamp < since:
+                    continue
+                if until is not None and timestamp > until:
+                    past_until = True  # later records of this segment may still be in range
+                    continue
+                yield record
+            if past_until:
+                return
+
+    def plan_range(self, since: Optional[float] = None,
+                   until: Optional[float] = None) -> Iterator[Tuple[str, int]]:
+        """
+        Yield (segment path, start offset) for the segments that may hold
+        records in [since, until], oldest first.
+
+        Whole segments outside the window are skipped using the first
+        timestamp of the following segment, and within a segment reading
+        starts at the last index point before `since`. Callers still filter
+        records by timestamp, and read on to the end of the segment holding
+        the first one past `until` in case timestamps are locally out of
+        order (e.g. after a clock step), before stopping.
+        """
+        files = self.segment_files()
+        indices = sorted(files)
+        for pos, index in enumerate(indices):
+            path = files[index]
+            sealed = pos + 1 < len(indices)
+
+            if since is not None and sealed:
+                next_first = self._first_timestamp(files[indices[pos + 1]], pos + 2 < len(indices))
+                if next_first is not None and next_first < since:
+                    continue
+
+            points = self.segment_index(path, sealed) if since is not None or until is not None else []
+            if until is not None and points and points[0][1] == 0 and points[0][0] > until:
+                return
+
+            offset = 0
+            if since is not None and points:
+                k = bisect.bisect_left([ts for ts, _ in points], since) - 1
+                if k >= 0:
+                    offset = points[k][1]
+            yield path, offset
+
+    def segment_index(self, path: str, sealed: bool = True) -> List[Tuple[float, int]]:
+        """
+        Return the sparse (timestamp, offset) index of a segment.
+
+        A missing index (e.g. for migrated or compacted segments) is rebuilt
+        by scanning the segment, and saved if the segment is sealed.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return []
+        token = (st.st_size, st.st_mtime_ns)
+        cached = self._index_cache.get(path)
+        if cached and cached[0] == token:
+            return cached[1]
+
+        points = read_index(index_path(path))
+        if not points:
+            points = build_index(path)
+            if sealed and points:
+                tmp_path = index_path(path) + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    for timestamp, offset in points:
+                        f.write(INDEX_ENTRY.pack(timestamp, offset))
+                os.replace(tmp_path, index_path(path))
+
+        if sealed:
+            self._index_cache[path] = (token, points)
+        return points
+
+    def _first_timestamp(self, path: str, sealed: bool) -> Optional[float]:
+        points = self.segment_index(path, sealed)
+        if points and points[0][1] == 0:
+            return points[0][0]
+        for _, record in iter_segment(path):
+            return record.get("timestamp")
+        return None
+
+    def seal(self) -> bool:
+        """
+        Close the active segment by creating an empty successor, so that
+        compaction can rewrite it once the grace period has passed.
+
+        Returns:
+            True if a non-empty segment was sealed.
+        """
+        with self._lock.exclusive():
+            files = self.segment_files()
+            if not files:
+                return False
+            last = max(files)
+            if os.path.getsize(files[last]) == 0:
+                return False
+            open(self.segment_path(last + 1), "ab").close()
+            return True
+
+    def compact(self, keep: Callable[[Iterable[Dict[str, Any]]], Iterable[Dict[str, Any]]],
+                drop_oldest: Optional[Callable[[List[int], int, int], int]] = None,
+                grace: float = SEAL_GRACE_SECONDS) -> Tuple[int, int]:
+        """
+        Rewrite sealed segments through `keep`, merging them into one segment.
+
+        Only a prefix of segments that are not the active one and have not
+        been modified for `grace` seconds is touched, so appends are never
+        blocked or lost. Readers running concurrently may see some entries
+        twice while the merged segment replaces the old ones.
+
+        Args:
+            keep (callable): Filters an iterator of records (e.g. RetentionPolicy.filter)
+            drop_oldest (callable): Given kept record sizes plus the entry and
+                byte counts of newer segments, returns how many of the oldest
+                kept records to drop (e.g. RetentionPolicy.entries_to_drop)
+            grace (float): Minimum age in seconds of segments to rewrite
+
+        Returns:
+            (records before, records after) for the rewritten segments;
+            (0, 0) if another process is compacting this log.
+        """
+        with self._compact_lock.try_exclusive() as acquired:
+            if not acquired:
+                return 0, 0
+            return self._compact(keep, drop_oldest, grace)
+
+    def _compact(self, keep: Callable[[Iterable[Dict[str, Any]]], Iterable[Dict[str, Any]]],
+                 drop_oldest: Optional[Callable[[List[int], int, int], int]],
+                 grace: float) -> Tuple[int, int]:
+        files = self.segment_files()
+        if len(files) < 2:
+            return 0, 0
+
+        indices = sorted(files)
+        cutoff = time.time() - grace
+        candidates = []
+        for index in indices[:-1]:
+            if os.path.getmtime(files[index]) > cutoff:
+                break
+            candidates.append(index)
+        if not candidates:
+            return 0, 0
+
+        before = 0
+
+        def counted(records):
+            nonlocal before
+            for record in records:
+                before += 1
+                yield record
+
+        def source():
+            for index in candidates:
+                yield from read_segment(files[index])
+
+        target = self.segment_path(candidates[-1])
+        tmp_path = target + ".compact"
+        sizes: List[int] = []
+        with open(tmp_path, "wb") as out:
+            for record in keep(counted(source())):
+                data = self.encode_record(record)
+                out.write(data)
+                sizes.append(len(data))
+
+        drop = 0
+        if drop_oldest is not None and sizes:
+            newer = [files[i] for i in indices if i > candidates[-1]]
+            newer_entries = sum(1 for path in newer for _ in read_segment(path))
+            newer_bytes = sum(os.path.getsize(path) for path in newer)
+            drop = drop_oldest(sizes, newer_entries, newer_bytes)
+
+        if drop:
+            offset = sum(sizes[:drop])
+            trimmed = tmp_path + ".trim"
+            with open(tmp_path, "rb") as src, open(trimmed, "wb") as dst:
+                src.seek(offset)
+                shutil.copyfileobj(src, dst)
+            os.replace(trimmed, tmp_path)
+
+        after = len(sizes) - drop
+        last_mtime = os.path.getmtime(files[candidates[-1]])
+        if after:
+            os.replace(tmp_path, target)
+            # Keep the original mtime so the merged segment isn't mistaken for a fresh one
+            os.utime(target, (last_mtime, last_mtime))
+        else:
+            os.remove(tmp_path)
+
+        for index in candidates:
+            stale = [index_path(files[index])]
+            if files[index] != target or not after:
+                stale.append(files[index])
+            for path in stale:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        return before, after
+
+    def migrate_legacy(self, legacy_path: str) -> bool:
+        """
+        Convert a legacy JSON-array log file into the first segment.
+
+        Only runs when no segments exist yet and the file holds a list of
+        {"timestamp", "event"} entries; anything else is left untouched. The
+        legacy file is renamed to '<name>.migrated' afterwards.
+
+        Returns:
+            True if a migration happened.
+        """
+        if not os.path.exists(legacy_path):
+            return False
+        with self._lock.exclusive():
+            return self._migrate_legacy(legacy_path)
+
+    def _migrate_legacy(self, legacy_path: str) -> bool:
+        if not os.path.exists(legacy_path):
+            return False  # migrated by another process meanwhile
+
+        if self.segments():
+            # Segment 0 is written atomically before the rename below, so a
+            # leftover legacy file here means a previous migration completed.
+            os.replace(legacy_path, legacy_path + ".migrated")
+            return False
+
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except ValueError:
+            return False
+
+        if not isinstance(entries, list) or not all(
+            isinstance(e, dict) and "timestamp" in e and "event" in e for e in entries
+        ):
+            return False
+
+        target = self.segment_path(0)
+        tmp_path = target + ".tmp"
+        with open(tmp_path, "wb") as f:
+            for entry in entries:
+                f.write(self.encode_record(entry))
+        os.replace(tmp_path, target)
+        os.replace(legacy_path, legacy_path + ".migrated")
+        print(f"[SegmentedLog] Migrated {len(entries)} entries from {legacy_path}")
+        return True
+
+
+def append_bytes(path: str, data: bytes):
+    """Write `data` to the end of `path` using O_APPEND."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def frame_record(payload: bytes) -> bytes:
+    """Length-prefix a payload for a binary-framed file."""
+    return RECORD_HEADER.pack(len(payload)) + payload
+
+
+def index_path(segment_path: str) -> str:
+    """Return the sparse index file path of a segment."""
+    return segment_path + ".idx"
+
+
+def read_index(path: str) -> List[Tuple[float, int]]:
+    """Read a sparse index file; a torn trailing entry is ignored."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return []
+    usable = len(raw) - len(raw) % INDEX_ENTRY.size
+    return [INDEX_ENTRY.unpack_from(raw, pos) for pos in range(0, usable, INDEX_ENTRY.size)]
+
+
+def build_index(path: str) -> List[Tuple[float, int]]:
+    """Scan a segment and return its sparse (timestamp, offset) index."""
+    points: List[Tuple[float, int]] = []
+    last_offset = None
+    for offset, record in iter_segment(path):
+        timestamp = record.get("timestamp")
+        if not isinstance(timestamp, (int, float)):
+            continue
+        if last_offset is None or offset - last_offset >= INDEX_INTERVAL_BYTES:
+            points.append((float(timestamp), offset))
+            last_offset = offset
+    return points
+
+
+def iter_segment(path: str, offset: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Stream (offset, record) pairs of one segment file starting at byte
+    `offset`, which must be a record boundary. The framing is picked from the
+    extension: '.jsonl' is newline-delimited, anything else length-prefixed.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        f.seek(offset)
+        if path.endswith(".jsonl"):
+            for line in f:
+                start = offset
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    yield start, json.loads(line)
+                except ValueError:
+                    continue
+            return
+
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            (length,) = RECORD_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            yield offset, detect_codec(payload).decode(payload)
+            offset += RECORD_HEADER.size + length
+
+
+def read_segment(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the records of one segment file.
+    """
+    for _, record in iter_segment(path):
+        yield record
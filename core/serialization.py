@@ -0,0 +1,124 @@
+import json
+import pickle
+from typing import Any, Dict
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+
+class Codec:
+    """
+    Encodes persisted values to bytes and back.
+
+    Binary codecs start their output with a fixed `magic` prefix so stored
+    data can be decoded without knowing which codec wrote it.
+    """
+    name = ""
+    extension = ""
+    magic = b""
+    binary = False
+
+    def encode(self, data: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, raw: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    """Indented JSON, the original on-disk format."""
+    name = "json"
+    extension = "json"
+
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    def decode(self, raw: bytes) -> Any:
+        return json.loads(raw)
+
+
+class CompactJsonCodec(JsonCodec):
+    """JSON without indentation or spaces after separators."""
+    name = "compact_json"
+
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+class PickleCodec(Codec):
+    """
+    Pickle protocol 5. Only use for storage written by this system: loading
+    a pickle can execute arbitrary code.
+    """
+    name = "pickle"
+    extension = "pkl"
+    magic = b"\x80\x05"  # PROTO opcode + protocol number
+    binary = True
+
+    def encode(self, data: Any) -> bytes:
+        return pickle.dumps(data, protocol=5)
+
+    def decode(self, raw: bytes) -> Any:
+        return pickle.loads(raw)
+
+
+class MsgpackCodec(Codec):
+    """MessagePack, available when the msgpack package is installed."""
+    name = "msgpack"
+    extension = "msgpack"
+    magic = b"\x00MPK"
+    binary = True
+
+    def encode(self, data: Any) -> bytes:
+        return self.magic + msgpack.packb(data, use_bin_type=True)
+
+    def decode(self, raw: bytes) -> Any:
+        return msgpack.unpackb(memoryview(raw)[len(self.magic):], raw=False, strict_map_key=False)
+
+
+CODECS: Dict[str, Codec] = {
+    codec.name: codec for codec in (JsonCodec(), CompactJsonCodec(), PickleCodec())
+}
+if msgpack is not None:
+    CODECS[MsgpackCodec.name] = MsgpackCodec()
+
+DEFAULT_CODEC = CODECS["json"]
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Look up a codec by name.
+    """
+    if name not in CODECS:
+        raise ValueError(f"Unknown or unavailable codec: {name}")
+    return CODECS[name]
+
+
+def record_codec(codec: Codec) -> Codec:
+    """
+    Codec for individually stored records (log entries, deltas): indented
+    JSON is replaced by its compact form.
+    """
+    return CODECS["compact_json"] if codec.name == "json" else codec
+
+
+def detect_codec(raw: bytes) -> Codec:
+    """
+    Pick the codec that wrote `raw` from its magic prefix; anything without
+    a known prefix is treated as JSON.
+    """
+    for codec in CODECS.values():
+        if codec.magic and raw[:len(codec.magic)] == codec.magic:
+            return codec
+    return DEFAULT_CODEC
+
+
+def decode(raw: Any) -> Any:
+    """
+    Decode bytes written by any registered codec (str is treated as JSON).
+    """
+    if isinstance(raw, str):
+        return json.loads(raw)
+    return detect_codec(raw).decode(raw)
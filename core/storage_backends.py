@@ -0,0 +1,562 @@
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+from atheris.core.file_lock import FileLock
+from atheris.core.log_reader import LogReader
+from atheris.core.log_retention import RetentionPolicy
+from atheris.core.segmented_log import SegmentedLog, LOG_SEGMENT_BYTES, append_bytes, frame_record, read_segment
+from atheris.core.serialization import CODECS, DEFAULT_CODEC, Codec, decode, record_codec
+
+# Resolves the codec used to write (agent_name, key); key 'log' selects the log codec
+CodecResolver = Callable[[str, str], Codec]
+
+
+def default_codec_for(agent_name: str, key: str) -> Codec:
+    return DEFAULT_CODEC
+
+
+class StorageBackend(ABC):
+    """
+    Storage interface used by PersistenceManager.
+
+    A backend stores two kinds of data per agent: key/value state (save/load,
+    checkpoints) and an append-only event log.
+    """
+
+    @abstractmethod
+    def write(self, agent_name: str, key: str, data: Any):
+        """Store `data` under (agent_name, key), replacing any previous value and its deltas."""
+        pass
+
+    def write_many(self, items: Iterable[Tuple[str, str, Any]]):
+        """
+        Store several (agent_name, key, data) values. Backends that support
+        transactions override this to commit the batch at once.
+        """
+        for agent_name, key, data in items:
+            self.write(agent_name, key, data)
+
+    @abstractmethod
+    def read(self, agent_name: str, key: str) -> Optional[Any]:
+        """Return the value stored under (agent_name, key) or None."""
+        pass
+
+    def version(self, agent_name: str, key: str) -> Optional[Hashable]:
+        """
+        Return a cheap token that changes whenever (agent_name, key) or its
+        deltas are rewritten, or None if unknown. Used to validate read caches.
+        """
+        return None
+
+    @abstractmethod
+    def append_delta(self, agent_name: str, key: str, delta: Dict[str, Any]):
+        """Append a {"set": {...}, "del": [...]} delta on top of (agent_name, key)."""
+        pass
+
+    @abstractmethod
+    def read_deltas(self, agent_name: str, key: str) -> Iterator[Dict[str, Any]]:
+        """Stream the deltas recorded since the last full write, oldest first."""
+        pass
+
+    @abstractmethod
+    def clear_deltas(self, agent_name: str, key: str):
+        """Drop all deltas of (agent_name, key), e.g. after a full write."""
+        pass
+
+    @abstractmethod
+    def append_log(self, agent_name: str, entry: Dict[str, Any]):
+        """Append a {"timestamp", "event"} entry to the agent's log."""
+        pass
+
+    @abstractmethod
+    def iter_log(self, agent_name: str, since: Optional[float] = None,
+                 until: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the agent's log entries from oldest to newest, optionally only
+        those with since <= timestamp <= until.
+        """
+        pass
+
+    def open_log_reader(self, agent_name: str) -> LogReader:
+        """
+        Return a memory-mapped reader over the agent's log segments, for
+        backends that store logs in segment files.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not store logs in segment files")
+
+    @abstractmethod
+    def log_agents(self) -> List[str]:
+        """Return the names of agents that have a log."""
+        pass
+
+    @abstractmethod
+    def compact_log(self, agent_name: str, policy: RetentionPolicy) -> Tuple[int, int]:
+        """
+        Apply a retention policy to the agent's log without blocking appends.
+
+        Returns:
+            (entries before, entries after) for the part of the log examined.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self, agent_name: str):
+        """Delete all state and log entries of an agent."""
+        pass
+
+    @abstractmethod
+    def state_lock(self, agent_name: str) -> FileLock:
+        """
+        Return the lock that writers sharing the storage across processes
+        hold while writing an agent's state and its deltas.
+        """
+        pass
+
+    def close(self):
+        """Release any open resources."""
+        pass
+
+
+class FileBackend(StorageBackend):
+    def __init__(self, base_path: str, log_segment_bytes: int = LOG_SEGMENT_BYTES, fsync: bool = False,
+                 codec_for: CodecResolver = default_codec_for):
+        """
+        One file per (agent, key) plus log segments per agent.
+
+        State files are named '<key>.<codec extension>' (e.g. 'latest.json',
+        'snapshot.pkl'); a file written with a previously configured codec is
+        still found and is replaced on the next save. Writes go to a temporary
+        file that is renamed over the target, so a crash never leaves a
+        partially written state file. Deltas are appended to '<key>.delta'
+        as length-prefixed records.
+
+        Args:
+            base_path (str): Root directory; each agent gets a subdirectory
+            log_segment_bytes (int): Size at which log segments rotate
+            fsync (bool): fsync every state write
+            codec_for (callable): Codec resolver for (agent_name, key)
+        """
+        self.base_path = base_path
+        self.log_segment_bytes = log_segment_bytes
+        self.fsync = fsync
+        self.codec_for = codec_for
+        self._extensions = sorted({codec.extension for codec in CODECS.values()})
+        self._logs: Dict[str, SegmentedLog] = {}
+        self._logs_lock = threading.Lock()
+        self._state_locks: Dict[str, FileLock] = {}
+        os.makedirs(base_path, exist_ok=True)
+
+    def _file_path(self, agent_name: str, key: str, extension: str = "json") -> str:
+        """
+        Construct the file path for a given agent and key.
+        """
+        agent_dir = os.path.join(self.base_path, agent_name)
+        if not os.path.exists(agent_dir):
+            os.makedirs(agent_dir, exist_ok=True)
+        return os.path.join(agent_dir, f"{key}.{extension}")
+
+    def _existing_path(self, agent_name: str, key: str) -> Optional[str]:
+        """
+        Return the path holding (agent_name, key), checking the configured
+        codec's extension first, or None if nothing was stored.
+        """
+        preferred = self.codec_for(agent_name, key).extension
+        for extension in [preferred] + [e for e in self._extensions if e != preferred]:
+            path = self._file_path(agent_name, key, extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _log(self, agent_name: str) -> SegmentedLog:
+        """
+        Return the segmented log for an agent, migrating a legacy log.json on first use.
+        """
+        with self._logs_lock:
+            log = self._logs.get(agent_name)
+            if log is None:
+                agent_dir = os.path.join(self.base_path, agent_name)
+                log = SegmentedLog(agent_dir, "log", self.log_segment_bytes,
+                                   codec=self.codec_for(agent_name, "log"))
+                log.migrate_legacy(os.path.join(agent_dir, "log.json"))
+                self._logs[agent_name] = log
+            return log
+
+    def write(self, agent_name: str, key: str, data: Any):
+        codec = self.codec_for(agent_name, key)
+        path = self._file_path(agent_name, key, codec.extension)
+        self._atomic_write(path, codec.encode(data))
+
+        # Drop a copy written under a previously configured codec
+        for extension in self._extensions:
+            if extension != codec.extension:
+                stale = self._file_path(agent_name, key, extension)
+                if os.path.exists(stale):
+                    os.remove(stale)
+        # Deltas recorded on top of the previous value no longer apply
+        self.clear_deltas(agent_name, key)
+
+    def _atomic_write(self, path: str, data: bytes):
+        """Write `data` to a temporary file in the same directory and rename it over `path`."""
+        directory = os.path.dirname(path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if self.fsync:
+            dir_fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def read(self, agent_name: str, key: str) -> Optional[Any]:
+        path = self._existing_path(agent_name, key)
+        if path is None:
+            return None
+        with open(path, "rb") as f:
+            return decode(f.read())
+
+    @staticmethod
+    def _stat_token(path: Optional[str]) -> Optional[Tuple[int, int, int, int]]:
+        if path is None:
+            return None
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+    def version(self, agent_name: str, key: str) -> Optional[Hashable]:
+        state = self._stat_token(self._existing_path(agent_name, key))
+        if state is None:
+            return None
+        return state, self._stat_token(self._delta_path(agent_name, key))
+
+    def _delta_path(self, agent_name: str, key: str) -> str:
+        return self._file_path(agent_name, key, "delta")
+
+    def append_delta(self, agent_name: str, key: str, delta: Dict[str, Any]):
+        payload = record_codec(self.codec_for(agent_name, key)).encode(delta)
+        path = self._delta_path(agent_name, key)
+        append_bytes(path, frame_record(payload))
+        if self.fsync:
+            with open(path, "rb") as f:
+                os.fsync(f.fileno())
+
+    def read_deltas(self, agent_name: str, key: str) -> Iterator[Dict[str, Any]]:
+        return read_segment(self._delta_path(agent_name, key))
+
+    def clear_deltas(self, agent_name: str, key: str):
+        try:
+            os.remove(self._delta_path(agent_name, key))
+        except FileNotFoundError:
+            pass
+
+    def append_log(self, agent_name: str, entry: Dict[str, Any]):
+        # Re-stamped under the segment lock, so concurrent appends stay in time order
+        self._log(agent_name).append(entry, stamp=True)
+
+    def iter_log(self, agent_name: str, since: Optional[float] = None,
+                 until: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        return self._log(agent_name).iter_range(since, until)
+
+    def open_log_reader(self, agent_name: str) -> LogReader:
+        return LogReader(self._log(agent_name))
+
+    def log_agents(self) -> List[str]:
+        agents = []
+        for name in sorted(os.listdir(self.base_path)):
+            agent_dir = os.path.join(self.base_path, name)
+            if os.path.isdir(agent_dir) and (
+                os.path.exists(os.path.join(agent_dir, "log.json")) or
+                any(f.startswith("log.") and f[4:10].isdigit() for f in os.listdir(agent_dir))
+            ):
+                agents.append(name)
+        return agents
+
+    def compact_log(self, agent_name: str, policy: RetentionPolicy) -> Tuple[int, int]:
+        """
+        Seal the active segment and rewrite previously sealed segments. An
+        entry therefore becomes eligible for compaction on the run after the
+        one that sealed its segment.
+        """
+        log = self._log(agent_name)
+        result = log.compact(
+            lambda entries: policy.filter(entries, time.time()),
+            drop_oldest=policy.entries_to_drop
+        )
+        log.seal()
+        return result
+
+    def state_lock(self, agent_name: str) -> FileLock:
+        with self._logs_lock:
+            lock = self._state_locks.get(agent_name)
+            if lock is None:
+                lock = FileLock(os.path.join(self.base_path, agent_name, "state.lock"))
+                self._state_locks[agent_name] = lock
+            return lock
+
+    def clear(self, agent_name: str):
+        with self._logs_lock:
+            self._logs.pop(agent_name, None)
+        agent_dir = os.path.join(self.base_path, agent_name)
+        if os.path.exists(agent_dir):
+            for f in os.listdir(agent_dir):
+                os.remove(os.path.join(agent_dir, f))
+            os.rmdir(agent_dir)
+
+
+class SQLiteBackend(StorageBackend):
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS kv (
+            agent TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT NOT NULL,
+            version INTEGER NOT NULL DEFAULT 1,
+            PRIMARY KEY (agent, key)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            agent TEXT NOT NULL,
+            timestamp REAL NOT NULL,
+            event TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS logs_agent_ts ON logs (agent, timestamp)",
+        """
+        CREATE TABLE IF NOT EXISTS deltas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            agent TEXT NOT NULL,
+            key TEXT NOT NULL,
+            delta NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS deltas_agent_key ON deltas (agent, key, id)",
+        # kv.version comes from a database-wide counter, so a key that is
+        # deleted and written again never reuses a version
+        """
+        CREATE TABLE IF NOT EXISTS sequences (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        )
+        """,
+        "INSERT OR IGNORE INTO sequences (name, value) SELECT 'kv_version', COALESCE(MAX(version), 0) FROM kv",
+    )
+
+    def __init__(self, db_path: str, fsync: bool = False, codec_for: CodecResolver = default_codec_for):
+        """
+        SQLite storage in WAL mode: a key/value table for state and an
+        indexed table for agent logs. Values written by JSON codecs are stored
+        as TEXT, binary codecs as BLOBs.
+
+        Args:
+            db_path (str): Database file path
+            fsync (bool): Use synchronous=FULL instead of NORMAL
+            codec_for (callable): Codec resolver for (agent_name, key)
+        """
+        self.db_path = db_path
+        self.codec_for = codec_for
+        self.synchronous = "FULL" if fsync else "NORMAL"
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._state_lock = FileLock(db_path + ".lock")
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._conn()
+        with conn:
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+
+    def _conn(self) -> sqlite3.Connection:
+        """
+        Return this thread's connection, opening it on first use and again
+        in a forked child (SQLite connections must not cross a fork).
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _encode(self, agent_name: str, key: str, data: Any, codec: Optional[Codec] = None):
+        codec = codec or self.codec_for(agent_name, key)
+        raw = codec.encode(data)
+        return raw if codec.binary else raw.decode("utf-8")
+
+    def write(self, agent_name: str, key: str, data: Any):
+        self.write_many([(agent_name, key, data)])
+
+    def write_many(self, items: Iterable[Tuple[str, str, Any]]):
+        rows = [(agent_name, key, self._encode(agent_name, key, data)) for agent_name, key, data in items]
+        conn = self._conn()
+        with conn:
+            for row in rows:
+                conn.execute("UPDATE sequences SET value = value + 1 WHERE name = 'kv_version'")
+                conn.execute(
+                    "INSERT INTO kv (agent, key, value, version) "
+                    "VALUES (?, ?, ?, (SELECT value FROM sequences WHERE name = 'kv_version')) "
+                    "ON CONFLICT (agent, key) DO UPDATE SET value = excluded.value, version = excluded.version",
+                    row,
+                )
+            # Deltas recorded on top of the previous values no longer apply
+            conn.executemany("DELETE FROM deltas WHERE agent = ? AND key = ?", [row[:2] for row in rows])
+
+    def read(self, agent_name: str, key: str) -> Optional[Any]:
+        row = self._conn().execute(
+            "SELECT value FROM kv WHERE agent = ? AND key = ?", (agent_name, key)
+        ).fetchone()
+        return decode(row[0]) if row else None
+
+    def version(self, agent_name: str, key: str) -> Optional[Hashable]:
+        row = self._conn().execute(
+            "SELECT version, (SELECT MAX(id) FROM deltas WHERE agent = ? AND key = ?) "
+            "FROM kv WHERE agent = ? AND key = ?",
+            (agent_name, key, agent_name, key),
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def append_delta(self, agent_name: str, key: str, delta: Dict[str, Any]):
+        codec = record_codec(self.codec_for(agent_name, key))
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO deltas (agent, key, delta) VALUES (?, ?, ?)",
+                (agent_name, key, self._encode(agent_name, key, delta, codec)),
+            )
+
+    def read_deltas(self, agent_name: str, key: str) -> Iterator[Dict[str, Any]]:
+        cursor = self._conn().execute(
+            "SELECT delta FROM deltas WHERE agent = ? AND key = ? ORDER BY id", (agent_name, key)
+        )
+        for (delta,) in cursor:
+            yield decode(delta)
+
+    def clear_deltas(self, agent_name: str, key: str):
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM deltas WHERE agent = ? AND key = ?", (agent_name, key))
+
+    def append_log(self, agent_name: str, entry: Dict[str, Any]):
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO logs (agent, timestamp, event) VALUES (?, ?, ?)",
+                (agent_name, entry["timestamp"],
+                 self._encode(agent_name, "log", entry["event"], record_codec(self.codec_for(agent_name, "log")))),
+            )
+
+    def iter_log(self, agent_name: str, since: Optional[float] = None,
+                 until: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        if since is None and until is None:
+            cursor = self._conn().execute(
+                "SELECT timestamp, event FROM logs WHERE agent = ? ORDER BY id", (agent_name,)
+            )
+        else:
+            # Served by the (agent, timestamp) index
+            cursor = self._conn().execute(
+                "SELECT timestamp, event FROM logs WHERE agent = ? AND timestamp >= ? AND timestamp <= ? "
+                "ORDER BY timestamp, id",
+                (agent_name, float("-inf") if since is None else since, float("inf") if until is None else until),
+            )
+        for timestamp, event in cursor:
+            yield {"timestamp": timestamp, "event": decode(event)}
+
+    def log_agents(self) -> List[str]:
+        return [row[0] for row in self._conn().execute("SELECT DISTINCT agent FROM logs ORDER BY agent")]
+
+    def compact_log(self, agent_name: str, policy: RetentionPolicy) -> Tuple[int, int]:
+        """
+        Apply the policy with DELETE statements in one short transaction;
+        WAL mode lets concurrent appends proceed while it runs.
+        """
+        now = time.time()
+        conn = self._conn()
+        count = "SELECT COUNT(*) FROM logs WHERE agent = ?"
+        with conn:
+            before = conn.execute(count, (agent_name,)).fetchone()[0]
+
+            if policy.max_age is not None:
+                conn.execute("DELETE FROM logs WHERE agent = ? AND timestamp < ?",
+                             (agent_name, now - policy.max_age))
+
+            # Oldest tiers first; each keeps the first entry per bucket
+            tiers = policy.downsample
+            for i, (tier_age, bucket) in enumerate(tiers):
+                newer_bound = now - tier_age
+                older_bound = now - tiers[i + 1][0] if i + 1 < len(tiers) else None
+                conn.execute(
+                    "DELETE FROM logs WHERE agent = :agent AND timestamp < :newer "
+                    "AND (:older IS NULL OR timestamp >= :older) AND id NOT IN ("
+                    "  SELECT MIN(id) FROM logs WHERE agent = :agent AND timestamp < :newer "
+                    "  AND (:older IS NULL OR timestamp >= :older) "
+                    "  GROUP BY CAST(timestamp / :bucket AS INTEGER))",
+                    {"agent": agent_name, "newer": newer_bound, "older": older_bound, "bucket": bucket},
+                )
+
+            if policy.max_entries is not None:
+                conn.execute(
+                    "DELETE FROM logs WHERE agent = :agent AND id <= ("
+                    "  SELECT id FROM logs WHERE agent = :agent ORDER BY id DESC LIMIT 1 OFFSET :keep)",
+                    {"agent": agent_name, "keep": policy.max_entries},
+                )
+
+            if policy.max_bytes is not None:
+                conn.execute(
+                    "DELETE FROM logs WHERE agent = :agent AND id <= ("
+                    "  SELECT id FROM (SELECT id, SUM(LENGTH(event)) OVER (ORDER BY id DESC) AS total "
+                    "  FROM logs WHERE agent = :agent) WHERE total > :max_bytes ORDER BY id DESC LIMIT 1)",
+                    {"agent": agent_name, "max_bytes": policy.max_bytes},
+                )
+
+            after = conn.execute(count, (agent_name,)).fetchone()[0]
+        return before, after
+
+    def clear(self, agent_name: str):
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM kv WHERE agent = ?", (agent_name,))
+            conn.execute("DELETE FROM logs WHERE agent = ?", (agent_name,))
+            conn.execute("DELETE FROM deltas WHERE agent = ?", (agent_name,))
+
+    def state_lock(self, agent_name: str) -> FileLock:
+        # SQLite serializes the statements themselves; the lock only has to
+        # cover multi-statement updates (snapshot + clearing deltas)
+        return self._state_lock
+
+    def close(self):
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+        self._local = threading.local()
+
+
+BACKENDS = {
+    "file": FileBackend,
+    "sqlite": SQLiteBackend,
+}
@@ -1,14 +1,16 @@
 import asyncio
 import json
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 import websockets
+from atheris.core.core_events import event_bus
 
 connected_clients: List[websockets.WebSocketServerProtocol] = []
 
 class RealTimeUpdateServer:
-    def __init__(self, host: str = "localhost", port: int = 6789):
+    def __init__(self, host: str = "localhost", port: int = 6789, event_types: Optional[List[str]] = None):
         self.host = host
         self.port = port
+        self.event_types = event_types or []  # bus events pushed to clients
         self.queue = asyncio.Queue()
         print(f"[RealTimeUpdateServer] Initialized on ws://{host}:{port}")
 
@@ -40,7 +42,15 @@ class RealTimeUpdateServer:
     def push_update(self, update: Dict):
         asyncio.create_task(self.queue.put(update))
 
+    def _forwarder(self, event_type: str):
+        async def forward(payload: Dict[str, Any]):
+            await self.queue.put({"type": event_type, "payload": payload})
+        return forward
+
     async def start(self):
+        for event_type in self.event_types:
+            # Runs on this loop, so emitters anywhere never wait for the clients
+            event_bus.subscribe(event_type, self._forwarder(event_type))
         server = await websockets.serve(self.handler, self.host, self.port)
         await self.send_updates()
         await server.wait_closed()
@@ -48,7 +58,7 @@ class RealTimeUpdateServer:
 
 # Example simulation
 if __name__ == "__main__":
-    server = RealTimeUpdateServer()
+    server = RealTimeUpdateServer(event_types=["alert_triggered", "validator_changed"])
 
     async def simulate_updates():
         while True:
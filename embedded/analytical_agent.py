@@ -1,6 +1,6 @@
 import time
 import statistics
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from atheris.core.agent_base import AgentBase
 from atheris.core.persistence_manager import PersistenceManager
 from atheris.core.core_events import event_bus
@@ -13,11 +13,33 @@ class AnalyticalAgent(AgentBase):
 
     def run(self):
         """Main analytical cycle."""
-        raw_data = self.persistence.load("learning", "latest")
+        self.run_with_input(None)
+
+    def run_with_input(self, raw_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Analyze `raw_data` (e.g. LearningAgent output routed by the
+        pipeline), or LearningAgent's latest stored data if none is given,
+        and return the result.
+        """
+        if not isinstance(raw_data, dict) or not raw_data:
+            raw_data = self.persistence.load("learning", "latest")
         if not raw_data:
             print("[AnalyticalAgent] No data available from LearningAgent.")
-            return
+            return None
+
+        analysis_result = self.analyze(raw_data)
+
+        event_bus.emit("alert_triggered", {
+            "type": "analysis_complete",
+            "data": analysis_result,
+            "timestamp": time.time()
+        })
+
+        print("[AnalyticalAgent] Analysis complete and stored.")
+        return analysis_result
 
+    def analyze(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze one snapshot of learning data and store the result."""
         analysis_result = {}
 
         if "network" in raw_data:
@@ -32,17 +54,10 @@ class AnalyticalAgent(AgentBase):
             wallet_insights = self._analyze_wallets(raw_data["wallets"])
             analysis_result["wallets"] = wallet_insights
 
-        # Save and emit
+        # Save
         self.persistence.save(self.agent_name, "latest", analysis_result)
         self.persistence.append_log(self.agent_name, analysis_result)
-
-        event_bus.emit("alert_triggered", {
-            "type": "analysis_complete",
-            "data": analysis_result,
-            "timestamp": time.time()
-        })
-
-        print("[AnalyticalAgent] Analysis complete and stored.")
+        return analysis_result
 
     def _analyze_network(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze Solana network metrics (mocked for now)."""
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from atheris.core.agent_base import AgentBase
 from atheris.core.persistence_manager import PersistenceManager
 
@@ -27,6 +27,32 @@ class AnalyticsHub(AgentBase):
 
         return aggregated
 
+    def event_counts(self, agent_name: str, since: Optional[float] = None, until: Optional[float] = None,
+                     bucket: float = 3600) -> Dict[float, int]:
+        """
+        Count an agent's logged events per time bucket, scanning its history
+        through a memory-mapped reader instead of loading it into memory.
+        Backends without segment files (SQLite) stream the history instead.
+
+        Args:
+            agent_name (str): Agent whose log to scan
+            since (float): Start of the window (timestamp)
+            until (float): End of the window (timestamp)
+            bucket (float): Bucket width in seconds
+
+        Returns:
+            dict: {bucket start timestamp: event count}
+        """
+        try:
+            entries = self.persistence.open_log_reader(agent_name).range(since, until)
+        except NotImplementedError:
+            entries = self.persistence.iter_log_history(agent_name, since, until)
+        counts: Dict[float, int] = {}
+        for entry in entries:
+            start = entry["timestamp"] // bucket * bucket
+            counts[start] = counts.get(start, 0) + 1
+        return counts
+
     def summarize(self) -> str:
         data = self.aggregate()
         summary = []
@@ -23,6 +23,7 @@ class NetworkTrafficAgent(AgentBase):
             return
 
         anomalies = []
+        spikes = []
         for program_id, tx_count in traffic_data.items():
             history = self.history.get(program_id, [])
             history.append(tx_count)
@@ -34,7 +35,7 @@ class NetworkTrafficAgent(AgentBase):
 
             if spike:
                 anomalies.append(program_id)
-                event_bus.emit("alert_triggered", {
+                spikes.append({
                     "type": "traffic_spike",
                     "program_id": program_id,
                     "tx_count": tx_count,
@@ -44,6 +45,7 @@ class NetworkTrafficAgent(AgentBase):
 
             self.history[program_id] = history
 
+        event_bus.emit_many("alert_triggered", spikes)
         self.persistence.save(self.agent_name, "traffic", self.history)
         self.persistence.append_log(self.agent_name, {
             "timestamp": time.time(),
@@ -1,7 +1,7 @@
 import asyncio
 import json
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from solana.rpc.async_api import AsyncClient
 from solana.publickey import PublicKey
 from atheris.core.agent_base import AgentBase
@@ -16,29 +16,57 @@ class OnchainFeedListener(AgentBase):
         self.accounts_to_watch: List[str] = config.get("accounts", [])
         self.indexed_events: List[Dict[str, Any]] = []
         self.persistence = PersistenceManager()
+        self.interval = config.get("interval", 15)
+        self.max_requests = config.get("max_requests", 4)  # account fetches in flight at once
+        self.client: Optional[AsyncClient] = None
+
+    async def arun(self):
+        """Fetch every watched account once, up to `max_requests` at a time."""
+        if self.client is None:
+            self.client = AsyncClient(self.rpc_url)
+        limit = asyncio.Semaphore(self.max_requests)
+        captured = await asyncio.gather(*(self._fetch(acc, limit) for acc in list(self.accounts_to_watch)))
+        if any(captured):
+            await asyncio.get_running_loop().run_in_executor(None, self._save)
+
+    def run(self):
+        """Blocking single pass, for thread-based schedulers."""
+        asyncio.run(self._run_once())
+
+    async def _run_once(self):
+        try:
+            await self.arun()
+        finally:
+            # The client's session is bound to this pass's event loop
+            if self.client is not None:
+                client, self.client = self.client, None
+                await client.close()
 
     async def monitor_accounts(self):
-        client = AsyncClient(self.rpc_url)
         print(f"[OnchainFeedListener] Monitoring {len(self.accounts_to_watch)} accounts...")
-
         while True:
-            for acc in self.accounts_to_watch:
-                try:
-                    pubkey = PublicKey(acc)
-                    response = await client.get_account_info(pubkey)
-                    if response["result"]["value"]:
-                        data = {
-                            "account": acc,
-                            "timestamp": time.time(),
-                            "slot": response["result"]["context"]["slot"],
-                            "lamports": response["result"]["value"]["lamports"]
-                        }
-                        self.indexed_events.append(data)
-                        self._save()
-                        print(f"[OnchainFeedListener] Event captured for {acc} at slot {data['slot']}")
-                except Exception as e:
-                    print(f"[OnchainFeedListener] Error fetching {acc}: {e}")
-            await asyncio.sleep(15)  # interval between fetches
+            await self.aexecute()
+            await asyncio.sleep(self.interval)  # interval between fetches
+
+    async def _fetch(self, acc: str, limit: asyncio.Semaphore) -> bool:
+        """Fetch one account and record its state; returns whether an event was captured."""
+        try:
+            async with limit:
+                response = await self.client.get_account_info(PublicKey(acc))
+            if not response["result"]["value"]:
+                return False
+            data = {
+                "account": acc,
+                "timestamp": time.time(),
+                "slot": response["result"]["context"]["slot"],
+                "lamports": response["result"]["value"]["lamports"]
+            }
+            self.indexed_events.append(data)
+            print(f"[OnchainFeedListener] Event captured for {acc} at slot {data['slot']}")
+            return True
+        except Exception as e:
+            print(f"[OnchainFeedListener] Error fetching {acc}: {e}")
+            return False
 
     def add_account(self, account_pubkey: str):
         if account_pubkey not in self.accounts_to_watch:
@@ -7,6 +7,9 @@ from atheris.utils.text_preprocessing import preprocess_text
 
 
 class SentimentAgent(AgentBase):
+    # Kept in PersistenceManager when run with executor="process"
+    process_state = ("sentiment_scores",)
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.agent_name = "sentiment_agent"
@@ -18,10 +21,26 @@ class SentimentAgent(AgentBase):
         print("[SentimentAgent] Running sentiment analysis loop...")
 
     def analyze_sentiment(self, message_id: str, content: str) -> float:
+        score = self._score(message_id, content)
+        self._save()
+        return score
+
+    def run_with_input(self, message: Dict[str, str]) -> Dict[str, Any]:
+        """Pipeline entry point: score {"message_id", "content"}."""
+        score = self.analyze_sentiment(message["message_id"], message["content"])
+        return {"message_id": message["message_id"], "score": score}
+
+    def run_with_batch(self, messages: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Score several pipeline messages, saving the scores once."""
+        results = [{"message_id": m["message_id"], "score": self._score(m["message_id"], m["content"])}
+                   for m in messages]
+        self._save()
+        return results
+
+    def _score(self, message_id: str, content: str) -> float:
         clean_text = preprocess_text(content)
         score = self._mock_sentiment_score(clean_text)
         self.sentiment_scores[message_id] = score
-        self._save()
         print(f"[SentimentAgent] Analyzed '{message_id}' with score {score}")
         return score
 
@@ -42,7 +61,8 @@ class SentimentAgent(AgentBase):
 
     def batch_analyze(self, messages: Dict[str, str]):
         for mid, content in messages.items():
-            self.analyze_sentiment(mid, content)
+            self._score(mid, content)
+        self._save()
 
     def get_scores(self) -> Dict[str, float]:
         return self.sentiment_scores
@@ -1,4 +1,5 @@
 import time
+import asyncio
 from typing import Dict, Any
 from atheris.core.agent_base import AgentBase
 from atheris.core.persistence_manager import PersistenceManager
@@ -33,6 +34,39 @@ class SolanaIndexer(AgentBase):
         governance_accounts = get_governance_accounts()
         transactions = get_recent_transactions(slot)
 
+        event = self._store(slot, validators, governance_accounts, transactions)
+        # Emit an event for pipeline or alert bots
+        event_bus.emit("new_block", event)
+        self._report(slot, transactions)
+
+    async def arun(self):
+        """
+        Same pass as run() in an event loop. The RPC connector is blocking,
+        so its calls run in the loop's executor, the three lookups for a new
+        slot concurrently.
+        """
+        print("[SolanaIndexer] Pulling on-chain Solana data...")
+        loop = asyncio.get_running_loop()
+
+        latest_block = await loop.run_in_executor(None, get_latest_block)
+        slot = latest_block.get("slot", 0)
+
+        if slot <= self.last_slot_checked:
+            print(f"[SolanaIndexer] No new slots since {self.last_slot_checked}.")
+            return
+
+        validators, governance_accounts, transactions = await asyncio.gather(
+            loop.run_in_executor(None, get_validator_list),
+            loop.run_in_executor(None, get_governance_accounts),
+            loop.run_in_executor(None, get_recent_transactions, slot),
+        )
+
+        event = await loop.run_in_executor(None, self._store, slot, validators, governance_accounts, transactions)
+        await event_bus.aemit("new_block", event)
+        self._report(slot, transactions)
+
+    def _store(self, slot: int, validators: list, governance_accounts: list, transactions: list) -> Dict[str, Any]:
+        """Persist an indexed slot and return its new_block event payload."""
         indexed_data = {
             "slot": slot,
             "validators": validators,
@@ -45,15 +79,14 @@ class SolanaIndexer(AgentBase):
         self.persistence.append_log(self.agent_name, indexed_data)
 
         self.last_slot_checked = slot
-
-        # Emit an event for pipeline or alert bots
-        event_bus.emit("new_block", {
+        return {
             "slot": slot,
             "tx_count": len(transactions),
             "validators": len(validators),
             "governance_accounts": len(governance_accounts)
-        })
+        }
 
+    def _report(self, slot: int, transactions: list):
         print(f"[SolanaIndexer] Indexed slot {slot} with {len(transactions)} transactions.")
 
     def status(self) -> Dict[str, Any]:
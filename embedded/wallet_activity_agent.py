@@ -23,6 +23,7 @@ class WalletActivityAgent(AgentBase):
             return
 
         alerts = []
+        events = []
         for wallet in data:
             wallet_id = wallet["wallet"]
             tx_count = wallet["txs"]
@@ -37,7 +38,7 @@ class WalletActivityAgent(AgentBase):
 
             if spike and not history.get("spike"):
                 alerts.append(wallet_id)
-                event_bus.emit("wallet_active", {
+                events.append({
                     "wallet": wallet_id,
                     "tx_count": tx_count,
                     "avg": avg,
@@ -48,6 +49,7 @@ class WalletActivityAgent(AgentBase):
             history["spike"] = spike
             self.snapshot[wallet_id] = history
 
+        event_bus.emit_many("wallet_active", events)
         # Store results
         self.persistence.save(self.agent_name, "snapshot", self.snapshot)
         self.persistence.append_log(self.agent_name, {
@@ -1,7 +1,7 @@
 import time
 from typing import Dict, Callable
 from atheris.core.agent_base import AgentBase
-from atheris.core.core_events import event_bus
+from atheris.core.core_events import EVENT_TYPES, event_bus
 from atheris.core.persistence_manager import PersistenceManager
 
 
@@ -19,7 +19,16 @@ class ResponderAgent(AgentBase):
 
     def _subscribe_to_events(self):
         for event_name in self.response_map:
-            event_bus.subscribe(event_name, self._create_handler(event_name))
+            # Alert kinds such as 'traffic_spike' arrive as alert_triggered with a matching type
+            event_type, where = (event_name, None) if event_name in EVENT_TYPES else \
+                ("alert_triggered", {"type": event_name})
+
+            if event_bus.journal is not None:
+                # Events emitted while the responder was down are handled when it comes back
+                event_bus.subscribe_durable(f"{self.agent_name}.{event_name}", event_type,
+                                            self._create_handler(event_name), where=where)
+            else:
+                event_bus.subscribe(event_type, self._create_handler(event_name), where=where)
         print(f"[ResponderAgent] Subscribed to events: {list(self.response_map.keys())}")
 
     def _create_handler(self, event_name: str):
@@ -70,4 +79,4 @@ if __name__ == "__main__":
     time.sleep(1)
     event_bus.emit("wallet_active", {"wallet": "wallet123", "tx_count": 35})
     time.sleep(1)
-    event_bus.emit("traffic_spike", {"program_id": "XYZProgram", "tx_count": 1000, "average": 420})
+    event_bus.emit("alert_triggered", {"type": "traffic_spike", "program_id": "XYZProgram", "tx_count": 1000, "average": 420})
@@ -0,0 +1,12 @@
+import os
+import sys
+import types
+
+# The repository root is the `atheris` package; expose it under that name
+# when the package isn't installed, so the tests import it as agents do.
+try:
+    import atheris  # noqa: F401
+except ImportError:
+    package = types.ModuleType("atheris")
+    package.__path__ = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+    sys.modules["atheris"] = package
@@ -0,0 +1,131 @@
+import threading
+import time
+import unittest
+
+from atheris.core.agent_base import AgentBase
+from atheris.core.agent_scheduler import AgentScheduler
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TimedAgent(AgentBase):
+    def __init__(self, config):
+        super().__init__(config)
+        self.duration = config.get("duration", 0.0)
+        self.starts = []
+        self.overlaps = 0
+        self._busy = threading.Lock()
+
+    def run(self):
+        if not self._busy.acquire(blocking=False):
+            self.overlaps += 1
+            return
+        try:
+            self.starts.append(time.monotonic())
+            time.sleep(self.duration)
+        finally:
+            self._busy.release()
+
+
+def gaps(starts):
+    return [b - a for a, b in zip(starts, starts[1:])]
+
+
+class SchedulerCase(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = AgentScheduler(workers=4)
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+
+class TestModes(SchedulerCase):
+    def test_fixed_rate_keeps_the_start_cadence(self):
+        agent = TimedAgent({"interval": 0.1, "duration": 0.04})
+        self.scheduler.schedule("rate", agent, mode="fixed_rate", initial_delay=0)
+        self.scheduler.start()
+        self.assertTrue(wait_until(lambda: len(agent.starts) >= 5))
+
+        # Starts stay on the grid laid from the first one; time spent running does not push them back
+        first = agent.starts[0]
+        for n, start in enumerate(agent.starts[:5]):
+            self.assertAlmostEqual(start - first, n * 0.1, delta=0.03)
+
+    def test_fixed_delay_waits_after_each_run(self):
+        agent = TimedAgent({"interval": 0.1, "duration": 0.04})
+        self.scheduler.schedule("delay", agent, mode="fixed_delay", initial_delay=0)
+        self.scheduler.start()
+        self.assertTrue(wait_until(lambda: len(agent.starts) >= 4))
+
+        for gap in gaps(agent.starts[:4]):
+            self.assertGreaterEqual(gap, 0.14 - 0.005)
+
+    def test_fixed_rate_skips_ticks_missed_while_overrunning(self):
+        agent = TimedAgent({"interval": 0.05, "duration": 0.12})
+        self.scheduler.schedule("slow", agent, mode="fixed_rate", initial_delay=0)
+        self.scheduler.start()
+        self.assertTrue(wait_until(lambda: len(agent.starts) >= 3))
+        self.scheduler.stop()
+
+        status = self.scheduler.status()["slow"]
+        self.assertGreater(status["missed"], 0)
+        self.assertEqual(agent.overlaps, 0)
+        # No burst of catch-up runs: the next start waits for the next grid tick
+        for gap in gaps(agent.starts):
+            self.assertGreaterEqual(gap, 0.12)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.schedule("bad", TimedAgent({}), mode="cron")
+
+
+class TestJobs(SchedulerCase):
+    def test_set_interval_moves_the_pending_run(self):
+        agent = TimedAgent({"interval": 30})
+        self.scheduler.schedule("job", agent, initial_delay=0)
+        self.scheduler.start()
+        self.assertTrue(wait_until(lambda: self.scheduler.status()["job"]["runs"] == 1))
+        self.assertGreater(self.scheduler.status()["job"]["next_in"], 20)
+
+        self.scheduler.set_interval("job", 0.05)
+        self.assertTrue(wait_until(lambda: len(agent.starts) >= 3, timeout=2))
+        self.assertEqual(self.scheduler.status()["job"]["interval"], 0.05)
+
+    def test_set_interval_unknown_job(self):
+        with self.assertRaises(KeyError):
+            self.scheduler.set_interval("missing", 1)
+
+    def test_unschedule_stops_future_runs(self):
+        agent = TimedAgent({"interval": 0.02})
+        self.scheduler.schedule("job", agent, initial_delay=0)
+        self.scheduler.start()
+        self.assertTrue(wait_until(lambda: len(agent.starts) >= 2))
+        self.scheduler.unschedule("job")
+        time.sleep(0.05)  # let a run in progress finish
+        runs = len(agent.starts)
+
+        time.sleep(0.1)
+        self.assertEqual(len(agent.starts), runs)
+        self.assertNotIn("job", self.scheduler.status())
+
+    def test_restart_resumes_jobs(self):
+        agent = TimedAgent({"interval": 0.02})
+        self.scheduler.schedule("job", agent, initial_delay=0)
+        self.scheduler.start()
+        self.assertTrue(wait_until(lambda: len(agent.starts) >= 2))
+        self.scheduler.stop()
+        runs = len(agent.starts)
+
+        self.scheduler.start()
+        self.assertTrue(wait_until(lambda: len(agent.starts) > runs))
+
+
+if __name__ == "__main__":
+    unittest.main()
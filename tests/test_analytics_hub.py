@@ -0,0 +1,40 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from atheris.core.persistence_manager import PersistenceManager
+from atheris.core.storage_backends import FileBackend, SQLiteBackend
+from atheris.embedded.analytics_hub import AnalyticsHub
+
+
+class TestEventCounts(unittest.TestCase):
+    def setUp(self):
+        self.base_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.base_path, ignore_errors=True)
+
+    def make_backend(self):
+        return FileBackend(self.base_path)
+
+    def test_counts_per_bucket(self):
+        hub = AnalyticsHub({})
+        hub.persistence = PersistenceManager(base_path=self.base_path, backend=self.make_backend())
+        with mock.patch("time.time") as now:
+            for timestamp in (0, 10, 3599, 3600, 7300, 9000):
+                now.return_value = float(timestamp)
+                hub.persistence.append_log("traffic_monitor", {"t": timestamp})
+
+        self.assertEqual(hub.event_counts("traffic_monitor"), {0: 3, 3600: 1, 7200: 2})
+        self.assertEqual(hub.event_counts("traffic_monitor", since=10, until=7300), {0: 2, 3600: 1, 7200: 1})
+
+
+class TestEventCountsSQLite(TestEventCounts):
+    def make_backend(self):
+        return SQLiteBackend(os.path.join(self.base_path, "atheris.db"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from atheris.core.agent_base import AgentBase
+from atheris.core.async_runtime import AsyncAgentRuntime
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class RpcAgent(AgentBase):
+    """Async agent whose runs each wait `duration` seconds on a fake RPC."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.duration = config.get("duration", 0.0)
+        self.in_flight = 0
+        self.peak = 0
+        self.cancelled = 0
+
+    def run(self):
+        pass
+
+    async def arun(self):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.duration)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+class BlockingAgent(AgentBase):
+    def __init__(self, config):
+        super().__init__(config)
+        self.threads = set()
+
+    def run(self):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+
+
+class RuntimeCase(unittest.TestCase):
+    def setUp(self):
+        self.runtime = AsyncAgentRuntime(adapter_workers=2)
+
+    def tearDown(self):
+        self.runtime.stop(timeout=5)
+
+
+class TestConcurrency(RuntimeCase):
+    def test_runs_in_flight_are_capped(self):
+        agent = RpcAgent({"interval": 0.01, "duration": 0.2})
+        self.runtime.add("rpc", agent, max_concurrency=3)
+        self.runtime.start()
+        self.assertTrue(wait_until(lambda: self.runtime.status()["rpc"]["runs"] >= 6))
+
+        self.assertEqual(agent.peak, 3)
+        status = self.runtime.status()["rpc"]
+        self.assertLessEqual(status["in_flight"], 3)
+        self.assertEqual(status["max_concurrency"], 3)
+        self.assertTrue(status["async"])
+
+    def test_default_runs_one_at_a_time(self):
+        agent = RpcAgent({"interval": 0.01, "duration": 0.05})
+        self.runtime.add("rpc", agent)
+        self.runtime.start()
+        self.assertTrue(wait_until(lambda: self.runtime.status()["rpc"]["runs"] >= 3))
+
+        self.assertEqual(agent.peak, 1)
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            self.runtime.add("rpc", RpcAgent({}), max_concurrency=0)
+
+    def test_sync_agents_run_on_the_adapter_pool(self):
+        agent = BlockingAgent({"interval": 0.01})
+        self.runtime.add("sync", agent, max_concurrency=2)
+        self.runtime.start()
+        self.assertTrue(wait_until(lambda: self.runtime.status()["sync"]["runs"] >= 3))
+
+        self.assertFalse(self.runtime.status()["sync"]["async"])
+        self.assertTrue(agent.threads)
+        self.assertTrue(all(name.startswith("async-adapter") for name in agent.threads))
+
+
+class TestJobs(RuntimeCase):
+    def test_add_and_remove_while_running(self):
+        self.runtime.start()
+        agent = RpcAgent({"interval": 0.01, "duration": 5})
+        self.runtime.add("rpc", agent, max_concurrency=2)
+        self.assertTrue(wait_until(lambda: agent.in_flight == 2))
+
+        self.runtime.remove("rpc")
+        self.assertTrue(wait_until(lambda: agent.in_flight == 0))
+        self.assertEqual(agent.cancelled, 2)
+        self.assertNotIn("rpc", self.runtime.status())
+
+    def test_stop_cancels_runs_in_flight(self):
+        agent = RpcAgent({"interval": 0.01, "duration": 5})
+        self.runtime.add("rpc", agent)
+        self.runtime.start()
+        self.assertTrue(wait_until(lambda: agent.in_flight == 1))
+
+        self.runtime.stop(timeout=5)
+        self.assertEqual((agent.in_flight, agent.cancelled), (0, 1))
+
+    def test_run_in_the_callers_loop(self):
+        agent = RpcAgent({"interval": 0.01, "duration": 0.0})
+        self.runtime.add("rpc", agent)
+
+        async def main():
+            asyncio.get_running_loop().call_later(0.1, self.runtime.stop)
+            await self.runtime.run()
+
+        asyncio.run(main())
+        self.assertGreater(self.runtime.status()["rpc"]["runs"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,261 @@
+import asyncio
+import gc
+import threading
+import time
+import unittest
+from unittest import mock
+
+from atheris.core import core_events
+from atheris.core.core_events import EventBus
+
+
+class TestAsyncDispatch(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus(dispatch="async", workers=3)
+
+    def test_per_type_order_and_worker_threads(self):
+        received = []
+        threads = set()
+
+        def handler(payload):
+            received.append(payload["n"])
+            threads.add(threading.current_thread().name)
+
+        self.bus.subscribe("new_block", handler)
+        for n in range(50):
+            self.bus.emit("new_block", {"n": n})
+
+        self.assertTrue(self.bus.drain(5))
+        self.assertEqual(received, list(range(50)))
+        self.assertNotIn(threading.current_thread().name, threads)
+
+    def test_non_dict_payload_reaches_unfiltered_subscribers(self):
+        everything, filtered = [], []
+        self.bus.subscribe("vote_cast", everything.append)
+        self.bus.subscribe("vote_cast", filtered.append, where={"k": 1})
+        self.bus.emit("vote_cast", "not a dict")
+        self.bus.emit("vote_cast", {"k": 1})
+
+        self.assertTrue(self.bus.drain(5))
+        self.assertEqual(everything, ["not a dict", {"k": 1}])
+        self.assertEqual(filtered, [{"k": 1}])
+
+    def test_coroutine_handler_tasks_are_kept_until_done(self):
+        received = []
+
+        async def handler(payload):
+            await asyncio.sleep(0.01)
+            received.append(payload["n"])
+
+        async def main():
+            self.bus.subscribe("new_block", handler)
+            async_handler = self.bus.subscribers["new_block"][0]
+            for n in range(5):
+                self.bus.emit("new_block", {"n": n})
+            self.assertTrue(await asyncio.get_running_loop().run_in_executor(None, self.bus.drain, 5))
+            gc.collect()
+            for _ in range(50):
+                if len(received) == 5:
+                    break
+                await asyncio.sleep(0.01)
+            return async_handler
+
+        async_handler = asyncio.run(main())
+        self.assertEqual(sorted(received), list(range(5)))
+        self.assertEqual(async_handler._tasks, set())
+
+
+class TestAemit(unittest.TestCase):
+    def test_waits_for_handlers_without_blocking_the_loop(self):
+        bus = EventBus()
+        calls = []
+
+        def slow_sync(payload):
+            time.sleep(0.1)
+            calls.append(("sync", threading.current_thread() is threading.main_thread()))
+
+        async def coroutine(payload):
+            await asyncio.sleep(0.05)
+            calls.append(("async", threading.current_thread() is threading.main_thread()))
+
+        async def main():
+            bus.subscribe("new_block", slow_sync)
+            bus.subscribe("new_block", coroutine)
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticking = asyncio.ensure_future(ticker())
+            await bus.aemit("new_block", {"slot": 1})
+            ticking.cancel()
+            return ticks
+
+        ticks = asyncio.run(main())
+        self.assertEqual(sorted(calls), [("async", True), ("sync", False)])
+        self.assertGreater(ticks, 3)
+
+    def test_unknown_event_type(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(EventBus().aemit("not_an_event", {}))
+
+
+class TestFilters(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+        self.received = {}
+
+    def collect(self, name):
+        return lambda payload: self.received.setdefault(name, []).append(payload["n"])
+
+    def test_equality_membership_and_multi_field_filters(self):
+        self.bus.subscribe("alert_triggered", self.collect("spikes"), where={"type": "traffic_spike"})
+        self.bus.subscribe("alert_triggered", self.collect("either"), where={"type": ["traffic_spike", "drain"]})
+        self.bus.subscribe("alert_triggered", self.collect("severe_drain"),
+                           where={"type": "drain", "severity": "high"})
+        self.bus.subscribe("alert_triggered", self.collect("all"))
+        payloads = [
+            {"n": 0, "type": "traffic_spike"},
+            {"n": 1, "type": "drain", "severity": "low"},
+            {"n": 2, "type": "drain", "severity": "high"},
+            {"n": 3, "type": "other"},
+            {"n": 4},
+        ]
+        self.bus.emit_many("alert_triggered", payloads)
+
+        self.assertEqual(self.received, {"spikes": [0], "either": [0, 1, 2], "severe_drain": [2],
+                                         "all": [0, 1, 2, 3, 4]})
+
+    def test_unhashable_values_do_not_match(self):
+        self.bus.subscribe("alert_triggered", self.collect("spikes"), where={"type": "traffic_spike"})
+        self.bus.subscribe("alert_triggered", self.collect("all"))
+        self.bus.emit("alert_triggered", {"n": 0, "type": ["traffic_spike"]})
+
+        self.assertEqual(self.received, {"all": [0]})
+
+
+class TestBatching(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+        self.batches = []
+
+    def test_emit_many_reaches_plain_handlers_per_payload(self):
+        received = []
+        self.bus.subscribe("new_block", received.append)
+        self.bus.emit_many("new_block", [{"slot": n} for n in range(3)])
+
+        self.assertEqual(received, [{"slot": 0}, {"slot": 1}, {"slot": 2}])
+
+    def test_full_batches_are_delivered_at_once(self):
+        self.bus.subscribe("new_block", self.batches.append, batch=True, max_batch_size=4, max_latency=None)
+        self.bus.emit_many("new_block", [{"slot": n} for n in range(10)])
+
+        self.assertEqual([[p["slot"] for p in batch] for batch in self.batches], [[0, 1, 2, 3], [4, 5, 6, 7]])
+        self.assertTrue(self.bus.drain(5))  # delivers the remainder
+        self.assertEqual([p["slot"] for p in self.batches[-1]], [8, 9])
+
+    def test_partial_batch_is_delivered_after_max_latency(self):
+        self.bus.subscribe("new_block", self.batches.append, batch=True, max_batch_size=100, max_latency=0.05)
+        self.bus.emit("new_block", {"slot": 1})
+        self.bus.emit("new_block", {"slot": 2})
+        self.assertEqual(self.batches, [])
+
+        deadline = time.monotonic() + 5
+        while not self.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.batches, [[{"slot": 1}, {"slot": 2}]])
+
+
+class TestPriorityLanes(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus(dispatch="async", workers=1)
+        self.order = []
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+        def blocker(payload):
+            self.started.set()
+            self.gate.wait(5)
+
+        self.bus.subscribe("vote_cast", blocker)
+        for event_type in ("new_block", "token_moved", "validator_changed"):
+            self.bus.subscribe(event_type, lambda payload, t=event_type: self.order.append(t))
+
+    def emit_while_busy(self, wait: float = 0.0):
+        self.bus.emit("vote_cast", {})
+        self.assertTrue(self.started.wait(5))
+        for event_type in ("new_block", "token_moved", "validator_changed"):
+            self.bus.emit(event_type, {})
+        time.sleep(wait)
+        self.gate.set()
+        self.assertTrue(self.bus.drain(5))
+
+    def test_higher_lanes_are_served_first(self):
+        self.emit_while_busy()
+
+        self.assertEqual(self.order, ["validator_changed", "token_moved", "new_block"])
+        stats = self.bus.lane_stats()
+        self.assertEqual({lane: stats[lane]["dispatched"] for lane in stats}, {"high": 1, "normal": 2, "low": 1})
+        self.assertEqual(sum(lane["queued"] for lane in stats.values()), 0)
+
+    def test_overdue_lane_is_served_ahead(self):
+        with mock.patch.dict(core_events.LANE_MAX_WAIT, {"normal": 5.0, "low": 0.05}):
+            self.emit_while_busy(wait=0.1)
+
+        self.assertEqual(self.order[0], "new_block")
+        self.assertEqual(self.bus.lane_stats()["low"]["starvation_picks"], 1)
+
+    def test_set_priority_moves_a_type(self):
+        self.bus.set_priority("new_block", "high")
+        self.emit_while_busy()
+
+        self.assertEqual(self.order[0], "new_block")
+        with self.assertRaises(ValueError):
+            self.bus.set_priority("new_block", "urgent")
+
+
+class TestCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+        self.received = []
+        self.bus.subscribe("wallet_active", self.received.append)
+
+    def test_first_event_is_not_delayed(self):
+        self.bus.coalesce("wallet_active", ["wallet"], window=60)
+        self.bus.emit("wallet_active", {"wallet": "w1", "timestamp": 100})
+
+        self.assertEqual(self.received, [{"wallet": "w1", "timestamp": 100}])
+
+    def test_duplicates_merge_into_one_release(self):
+        self.bus.coalesce("wallet_active", ["wallet"], window=60)
+        for timestamp in (100, 101, 102, 105):
+            self.bus.emit("wallet_active", {"wallet": "w1", "timestamp": timestamp, "amount": timestamp})
+        self.assertEqual(len(self.received), 1)
+
+        self.assertTrue(self.bus.drain(5))  # closes the window
+        self.assertEqual(len(self.received), 2)
+        self.assertEqual(self.received[1], {"wallet": "w1", "timestamp": 105, "amount": 105, "count": 3,
+                                            "first_timestamp": 101, "last_timestamp": 105})
+
+    def test_keys_and_filters_are_separate(self):
+        self.bus.coalesce("wallet_active", ["wallet"], window=60, where={"chain": "solana"})
+        self.bus.emit("wallet_active", {"wallet": "w1", "chain": "solana", "timestamp": 1})
+        self.bus.emit("wallet_active", {"wallet": "w2", "chain": "solana", "timestamp": 2})
+        self.bus.emit("wallet_active", {"wallet": "w1", "chain": "other", "timestamp": 3})
+        self.bus.emit("wallet_active", {"wallet": "w1", "chain": "other", "timestamp": 4})
+
+        self.assertEqual([p["timestamp"] for p in self.received], [1, 2, 3, 4])
+
+    def test_window_without_duplicates_releases_nothing(self):
+        self.bus.coalesce("wallet_active", ["wallet"], window=60)
+        self.bus.emit("wallet_active", {"wallet": "w1", "timestamp": 1})
+
+        self.assertTrue(self.bus.drain(5))
+        self.assertEqual(len(self.received), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import shutil
+import tempfile
+import time
+import unittest
+
+from atheris.core.core_events import EventBus
+from atheris.core.event_journal import EventJournal
+
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class JournalCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class TestReplay(JournalCase):
+    def test_replay_from_offset_time_and_type(self):
+        journal = EventJournal(self.directory, max_segment_bytes=512)
+        offsets = [journal.append("new_block" if n % 2 else "vote_cast", {"n": n}) for n in range(20)]
+        self.assertEqual(offsets, sorted(offsets))
+        self.assertGreater(len(journal.log.segments()), 1)
+
+        self.assertEqual([r["payload"]["n"] for r in journal.replay()], list(range(20)))
+        self.assertEqual([r["payload"]["n"] for r in journal.replay(from_offset=offsets[15])], list(range(15, 20)))
+        self.assertEqual([r["payload"]["n"] for r in journal.replay(event_types=["new_block"])],
+                         list(range(1, 20, 2)))
+
+        middle = list(journal.replay())[10]["timestamp"]
+        self.assertTrue(all(r["timestamp"] >= middle for r in journal.replay(from_time=middle)))
+        self.assertEqual(list(journal.replay(from_time=time.time() + 60)), [])
+
+
+class TestConsumerGroups(JournalCase):
+    def test_groups_resume_after_their_committed_offset(self):
+        journal = EventJournal(self.directory)
+        for n in range(5):
+            journal.append("new_block", {"n": n})
+
+        first, second = [], []
+        self.assertEqual(journal.consume("indexer", lambda r: first.append(r["payload"]["n"])), 5)
+        journal.append("new_block", {"n": 5})
+        self.assertEqual(journal.consume("indexer", lambda r: first.append(r["payload"]["n"])), 1)
+        self.assertEqual(journal.consume("alerts", lambda r: second.append(r["payload"]["n"]), limit=3), 3)
+
+        self.assertEqual(first, list(range(6)))
+        self.assertEqual(second, [0, 1, 2])
+        # A new instance (e.g. after a restart) reads the committed offsets
+        restarted = EventJournal(self.directory)
+        resumed = []
+        restarted.consume("alerts", lambda r: resumed.append(r["payload"]["n"]))
+        self.assertEqual(resumed, [3, 4, 5])
+
+    def test_durable_subscriber_catches_up_on_missed_events(self):
+        bus = EventBus()
+        bus.configure(journal=self.directory)
+        received = []
+        bus.subscribe_durable("watcher", "wallet_active", received.append, where={"chain": "solana"})
+        bus.emit("wallet_active", {"wallet": "a", "chain": "solana"})
+        bus.emit("wallet_active", {"wallet": "b", "chain": "other"})
+        self.assertTrue(wait_until(lambda: len(received) == 1))
+        bus.stop_durable(timeout=5)
+
+        bus.emit("wallet_active", {"wallet": "c", "chain": "solana"})  # while the group is down
+        bus.subscribe_durable("watcher", "wallet_active", received.append, where={"chain": "solana"})
+        self.assertTrue(wait_until(lambda: len(received) == 2))
+        bus.stop_durable(timeout=5)
+        self.assertEqual([p["wallet"] for p in received], ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
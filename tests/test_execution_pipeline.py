@@ -0,0 +1,149 @@
+import threading
+import time
+import unittest
+
+from atheris.core.agent_base import AgentBase
+from atheris.core.execution_pipeline import ExecutionPipeline
+
+
+class StepAgent(AgentBase):
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.delay = self.config.get("delay", 0.0)
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def run(self):
+        pass
+
+    def run_with_input(self, item):
+        self.gate.wait()
+        time.sleep(self.delay)
+        return item + 1
+
+
+class BatchAgent(StepAgent):
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.batches = []
+
+    def run_with_batch(self, items):
+        self.gate.wait()
+        self.batches.append(len(items))
+        return [item + 1 for item in items]
+
+
+class PipelineCase(unittest.TestCase):
+    def setUp(self):
+        self.pipeline = ExecutionPipeline(process_workers=1)
+        self.results = []
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        self.pipeline.stop(drain=False, timeout=5)
+
+    def collect(self, result):
+        with self.lock:
+            self.results.append(result)
+
+
+class TestDrain(PipelineCase):
+    def test_drain_waits_for_routed_results(self):
+        self.pipeline.register_agent("first", StepAgent({"delay": 0.01}), workers=2)
+        self.pipeline.register_agent("second", StepAgent({"delay": 0.01}))
+        self.pipeline.define_route("first", ["second"])
+        self.pipeline.register_output_handler("second", self.collect)
+        self.pipeline.start()
+        for n in range(10):
+            self.pipeline.enqueue_task("first", n)
+
+        self.assertTrue(self.pipeline.drain(timeout=5))
+        self.assertEqual(sorted(self.results), list(range(2, 12)))
+        self.assertEqual(self.pipeline.processed, {"first": 10, "second": 10})
+
+    def test_drain_times_out_while_a_stage_is_blocked(self):
+        agent = StepAgent()
+        agent.gate.clear()
+        self.pipeline.register_agent("stage", agent)
+        self.pipeline.start()
+        self.pipeline.enqueue_task("stage", 1)
+
+        self.assertFalse(self.pipeline.drain(timeout=0.1))
+        agent.gate.set()
+        self.assertTrue(self.pipeline.drain(timeout=5))
+
+    def test_failed_output_handler_still_drains(self):
+        def handler(result):
+            if result % 2:
+                raise RuntimeError("dashboard down")
+            self.collect(result)
+
+        self.pipeline.register_agent("stage", StepAgent())
+        self.pipeline.register_output_handler("stage", handler)
+        self.pipeline.start()
+        for n in range(6):
+            self.pipeline.enqueue_task("stage", n)
+
+        self.assertTrue(self.pipeline.drain(timeout=5))
+        self.assertEqual(sorted(self.results), [2, 4, 6])
+        self.assertEqual(self.pipeline.processed["stage"], 3)
+
+    def test_batches_are_capped(self):
+        agent = BatchAgent()
+        agent.gate.clear()
+        self.pipeline.register_agent("stage", agent, batch_size=4)
+        self.pipeline.register_output_handler("stage", self.collect)
+        self.pipeline.start()
+        for n in range(10):
+            self.pipeline.enqueue_task("stage", n)
+        agent.gate.set()
+
+        self.assertTrue(self.pipeline.drain(timeout=5))
+        self.assertEqual(sorted(self.results), list(range(1, 11)))
+        self.assertEqual(sum(agent.batches), 10)
+        self.assertLessEqual(max(agent.batches), 4)
+
+
+class TestStop(PipelineCase):
+    def test_stop_processes_what_is_queued(self):
+        self.pipeline.register_agent("first", StepAgent({"delay": 0.01}))
+        self.pipeline.register_agent("second", StepAgent())
+        self.pipeline.define_route("first", ["second"])
+        self.pipeline.register_output_handler("second", self.collect)
+        self.pipeline.start()
+        for n in range(5):
+            self.pipeline.enqueue_task("first", n)
+
+        self.pipeline.stop(timeout=5)
+        self.assertEqual(sorted(self.results), list(range(2, 7)))
+        self.assertFalse(self.pipeline.running)
+        self.assertEqual(self.pipeline._threads, {})
+
+    def test_stop_without_drain_exits_promptly(self):
+        agent = StepAgent({"delay": 0.05})
+        self.pipeline.register_agent("stage", agent, workers=2)
+        self.pipeline.start()
+        threads = list(self.pipeline._threads["stage"])
+        for n in range(50):
+            self.pipeline.enqueue_task("stage", n)
+
+        started = time.monotonic()
+        self.pipeline.stop(drain=False, timeout=5)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertLess(self.pipeline.processed["stage"], 50)
+
+    def test_restart_after_stop(self):
+        self.pipeline.register_agent("stage", StepAgent())
+        self.pipeline.register_output_handler("stage", self.collect)
+        self.pipeline.start()
+        self.pipeline.stop(timeout=5)
+
+        self.pipeline.start()
+        self.pipeline.enqueue_task("stage", 1)
+        self.assertTrue(self.pipeline.drain(timeout=5))
+        self.assertEqual(self.results, [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import contextlib
+import io
+import unittest
+
+from atheris.core.core_events import EventBus
+from atheris.utils.handler_stats import HandlerStats, handler_name
+from atheris.utils.message_bus import MessageBus
+
+
+class Monitor:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+
+    def on_event(self, payload):
+        if self.fail:
+            raise RuntimeError("boom")
+
+
+class TestHandlerStats(unittest.TestCase):
+    def test_same_named_handlers_are_kept_apart(self):
+        bus = EventBus()
+        good, bad = Monitor(), Monitor(fail=True)
+        bus.subscribe("new_block", good.on_event)
+        bus.subscribe("new_block", bad.on_event)
+        for slot in range(3):
+            bus.emit("new_block", {"slot": slot})
+
+        name = handler_name(good.on_event)
+        stats = bus.stats()["new_block"]
+        self.assertEqual(set(stats), {name, f"{name}#2"})
+        self.assertEqual((stats[name]["calls"], stats[name]["errors"]), (3, 0))
+        self.assertEqual((stats[f"{name}#2"]["calls"], stats[f"{name}#2"]["errors"]), (3, 3))
+
+    def test_latency_summary(self):
+        stats = HandlerStats("Test", slow_threshold=None)
+        handler = Monitor().on_event
+        for elapsed in (0.0002, 0.0002, 0.003, 0.2):
+            stats.record("topic", handler, elapsed)
+
+        summary = stats.snapshot()["topic"][handler_name(handler)]
+        self.assertEqual(summary["calls"], 4)
+        self.assertAlmostEqual(summary["avg"], 0.2034 / 4)
+        self.assertEqual(summary["max"], 0.2)
+        self.assertEqual((summary["p50"], summary["p99"]), (0.0005, 0.5))
+        self.assertEqual(summary["histogram"]["0.0005"], 2)
+
+    def test_message_bus_counts_errors(self):
+        bus = MessageBus()
+        bus.subscribe("agent.update", Monitor(fail=True).on_event)
+        bus.publish("agent.update", {})
+
+        (summary,) = bus.stats()["agent.update"].values()
+        self.assertEqual((summary["calls"], summary["errors"]), (1, 1))
+
+    def test_slow_calls_warn_once_per_interval(self):
+        stats = HandlerStats("Test", slow_threshold=0.1)
+        handler = Monitor().on_event
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            stats.record("topic", handler, 0.05)
+            stats.record("topic", handler, 0.3)
+            stats.record("topic", handler, 0.4)
+
+        self.assertEqual(output.getvalue().count("[Test] Slow handler"), 1)
+        self.assertIn(handler_name(handler), output.getvalue())
+
+    def test_reset(self):
+        stats = HandlerStats("Test")
+        stats.record("topic", Monitor().on_event, 0.001)
+        stats.reset()
+        self.assertEqual(stats.snapshot(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
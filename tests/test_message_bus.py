@@ -0,0 +1,51 @@
+import unittest
+
+from atheris.utils.message_bus import MessageBus
+from atheris.utils.topic_trie import TopicTrie
+
+
+class TestTopicTrie(unittest.TestCase):
+    def test_wildcards(self):
+        trie = TopicTrie()
+        for pattern in ("agent.update", "agent.*", "agent.#", "#", "*.update", "agent.*.status"):
+            trie.add(pattern, pattern)
+
+        self.assertEqual(trie.match("agent.update"), ("agent.update", "agent.*", "agent.#", "#", "*.update"))
+        self.assertEqual(trie.match("agent"), ("agent.#", "#"))
+        self.assertEqual(trie.match("agent.update.status"), ("agent.#", "#", "agent.*.status"))
+        self.assertEqual(trie.match("dashboard.refresh"), ("#",))
+
+    def test_remove_invalidates_cached_matches(self):
+        trie = TopicTrie()
+        trie.add("agent.*", "a")
+        self.assertEqual(trie.match("agent.update"), ("a",))
+        self.assertTrue(trie.remove("agent.*", "a"))
+        self.assertEqual(trie.match("agent.update"), ())
+        self.assertFalse(trie)
+
+
+class TestMessageBusRouting(unittest.TestCase):
+    def test_callback_under_overlapping_patterns_runs_once(self):
+        bus = MessageBus()
+        received = []
+        bus.subscribe("agent.*", received.append)
+        bus.subscribe("agent.#", received.append)
+        bus.publish("agent.update", 1)
+        bus.publish("agent.update.status", 2)
+        bus.publish("dashboard.update", 3)
+
+        self.assertEqual(received, [1, 2])
+
+    def test_unsubscribe(self):
+        bus = MessageBus()
+        received = []
+        bus.subscribe("agent.#", received.append)
+        bus.publish("agent.update", 1)
+        bus.unsubscribe("agent.#", received.append)
+        bus.publish("agent.update", 2)
+
+        self.assertEqual(received, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import time
+import unittest
+
+from atheris.core.agent_base import AgentBase
+from atheris.core.orchestration_engine import OrchestrationEngine, groups_to_dag, validate_dag
+
+
+class SleepAgent(AgentBase):
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.duration = self.config.get("duration", 0.0)
+        self.fail = self.config.get("fail", False)
+        self.runs = 0
+
+    def run(self):
+        self.runs += 1
+        time.sleep(self.duration)
+        if self.fail:
+            raise RuntimeError("boom")
+
+
+def make_agents(**durations):
+    return {name: SleepAgent({"duration": duration}) for name, duration in durations.items()}
+
+
+class EngineCase(unittest.TestCase):
+    def tearDown(self):
+        if getattr(self, "engine", None) is not None:
+            self.engine.stop()
+
+
+class TestSchedules(unittest.TestCase):
+    def test_groups_become_dependencies_on_the_previous_group(self):
+        dag = groups_to_dag([["learning"], ["analysis", "risk"], ["output"]])
+        self.assertEqual(dag, {"learning": [], "analysis": ["learning"], "risk": ["learning"],
+                               "output": ["analysis", "risk"]})
+
+    def test_cycles_are_rejected(self):
+        with self.assertRaises(ValueError):
+            validate_dag({"a": ["b"], "b": ["c"], "c": ["a"]})
+        with self.assertRaises(ValueError):
+            OrchestrationEngine(make_agents(a=0, b=0), {"a": ["b"], "b": ["a"]})
+
+    def test_upstream_only_agents_are_roots(self):
+        engine = OrchestrationEngine(make_agents(a=0, b=0), {"b": ["a"]})
+        self.assertEqual(engine.dag, {"b": ["a"], "a": []})
+
+
+class TestCycles(EngineCase):
+    def test_critical_path_follows_the_slowest_branch(self):
+        agents = make_agents(fetch=0.02, fast=0.01, slow=0.15, report=0.01)
+        self.engine = OrchestrationEngine(agents, {"fast": ["fetch"], "slow": ["fetch"], "report": ["fast", "slow"]})
+        report = self.engine.run_cycle()
+
+        self.assertEqual(report["critical_path"], ["fetch", "slow", "report"])
+        self.assertEqual(report["bottleneck"], "slow")
+        self.assertIs(self.engine.cycle_stats(), report)
+        timings = report["agents"]
+        # fast and slow run side by side once fetch is done; report waits for both
+        self.assertLess(timings["slow"]["start"], timings["fast"]["finish"])
+        self.assertGreaterEqual(timings["fast"]["start"], timings["fetch"]["finish"])
+        self.assertGreaterEqual(timings["report"]["start"], timings["slow"]["finish"])
+        self.assertLess(report["duration"], 0.02 + 0.01 + 0.15 + 0.01 + 0.1)
+
+    def test_agent_starts_when_its_own_upstream_is_done(self):
+        agents = make_agents(a=0.15, b=0.01, c=0.01)
+        self.engine = OrchestrationEngine(agents, {"a": [], "b": [], "c": ["b"]})
+        report = self.engine.run_cycle()
+
+        # c is not held back by the unrelated slow root
+        self.assertLess(report["agents"]["c"]["finish"], report["agents"]["a"]["finish"])
+        self.assertEqual(report["critical_path"], ["a"])
+
+    def test_limited_workers_report_queueing(self):
+        agents = make_agents(a=0.05, b=0.05)
+        self.engine = OrchestrationEngine(agents, [["a", "b"]], workers=1)
+        timings = self.engine.run_cycle()["agents"]
+
+        self.assertGreater(max(timings["a"]["queued"], timings["b"]["queued"]), 0.03)
+
+    def test_failed_or_inactive_agents_do_not_block_downstream(self):
+        agents = make_agents(a=0, b=0, c=0)
+        agents["a"].fail = True
+        agents["b"].active = False
+        self.engine = OrchestrationEngine(agents, [["a"], ["b"], ["c"]])
+        self.engine.run_cycle()
+
+        self.assertEqual((agents["a"].runs, agents["b"].runs, agents["c"].runs), (1, 0, 1))
+
+    def test_schedule_update_applies_from_next_cycle(self):
+        agents = make_agents(a=0, b=0)
+        self.engine = OrchestrationEngine(agents, [["a"], ["b"]])
+        self.assertEqual(self.engine.run_cycle()["critical_path"], ["a", "b"])
+
+        self.engine.update_schedule({"a": ["b"]})
+        report = self.engine.run_cycle()
+        self.assertEqual(report["critical_path"], ["b", "a"])
+        self.assertEqual([r["cycle"] for r in self.engine.history], [1, 2])
+
+    def test_stop_ends_the_loop(self):
+        agents = make_agents(a=0)
+        self.engine = OrchestrationEngine(agents, [["a"]])
+        self.engine.set_cycle_interval(60)
+        self.engine.start()
+        deadline = time.monotonic() + 5
+        while self.engine.cycles == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.engine.stop()
+
+        time.sleep(0.05)
+        self.assertEqual(self.engine.cycles, 1)
+        self.assertFalse(self.engine.running)
+
+
+if __name__ == "__main__":
+    unittest.main()
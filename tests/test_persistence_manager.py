@@ -0,0 +1,120 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from atheris.core.persistence_manager import PersistenceManager
+from atheris.core.storage_backends import FileBackend, SQLiteBackend
+
+
+class BackendCase(unittest.TestCase):
+    """Runs each test against the file backend; see the SQLite subclass below."""
+
+    def setUp(self):
+        self.base_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.base_path, ignore_errors=True)
+
+    def make_backend(self):
+        return FileBackend(self.base_path)
+
+    def manager(self, **options) -> PersistenceManager:
+        return PersistenceManager(base_path=self.base_path, backend=self.make_backend(), **options)
+
+
+class TestDurability(BackendCase):
+    def test_write_through_is_visible_to_other_managers(self):
+        self.manager(durability="write_through").save("agent", "state", {"v": 1})
+        self.assertEqual(self.manager(read_cache=False).load("agent", "state"), {"v": 1})
+
+    def test_buffered_saves_coalesce_until_flush(self):
+        writer = self.manager(durability="buffered", flush_interval=60)
+        for v in range(5):
+            writer.save("agent", "state", {"v": v})
+        writer.save("agent", "other", [1])
+
+        self.assertEqual(writer.load("agent", "state"), {"v": 4})  # pending values are read back
+        self.assertIsNone(writer.backend.read("agent", "state"))
+        writer.flush()
+        self.assertEqual(self.manager(read_cache=False).load("agent", "state"), {"v": 4})
+        self.assertEqual(self.manager(read_cache=False).load("agent", "other"), [1])
+
+    def test_max_pending_triggers_background_flush(self):
+        writer = self.manager(durability="buffered", flush_interval=60, max_pending=3)
+        for key in ("a", "b", "c"):
+            writer.save("agent", key, key)
+
+        deadline = time.monotonic() + 5
+        while writer.backend.read("agent", "c") is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([writer.backend.read("agent", key) for key in ("a", "b", "c")], ["a", "b", "c"])
+        writer.close()
+
+    def test_close_flushes_pending_saves(self):
+        writer = self.manager(durability="buffered", flush_interval=60)
+        writer.save("agent", "state", {"v": 1})
+        writer.close()
+        self.assertEqual(self.manager(read_cache=False).load("agent", "state"), {"v": 1})
+
+    def test_fsync_level_reaches_the_backend(self):
+        manager = PersistenceManager(base_path=self.base_path, durability="fsync")
+        self.assertTrue(manager.backend.fsync)
+        manager.save("agent", "state", {"v": 1})
+        self.assertEqual(manager.load("agent", "state"), {"v": 1})
+        with self.assertRaises(ValueError):
+            PersistenceManager(base_path=self.base_path, durability="eventually")
+
+
+class TestDurabilitySQLite(TestDurability):
+    def make_backend(self):
+        return SQLiteBackend(os.path.join(self.base_path, "atheris.db"))
+
+
+class TestDeltaCheckpoints(BackendCase):
+    def test_full_write_drops_earlier_deltas(self):
+        writer = self.manager(delta_keys=["agent/state"])
+        for i in range(7):
+            writer.save("agent", "state", {"x": i, "y": 1})
+
+        # The key is no longer a delta key here, e.g. after a config change
+        self.manager(delta_keys=[]).save("agent", "state", {"only": 1})
+
+        self.assertEqual(self.manager(read_cache=False).load("agent", "state"), {"only": 1})
+        self.assertEqual(self.manager(delta_keys=["agent/state"]).load("agent", "state"), {"only": 1})
+
+    def test_deltas_replay_onto_snapshot(self):
+        writer = self.manager(delta_keys=["agent/state"], delta_compact_every=3)
+        for i in range(10):
+            writer.save("agent", "state", {"x": i, "y": 1, f"k{i % 4}": i})
+        writer.save("agent", "state", {"x": 10})
+
+        self.assertEqual(self.manager(read_cache=False).load("agent", "state"), {"x": 10})
+
+
+class TestDeltaCheckpointsSQLite(TestDeltaCheckpoints):
+    def make_backend(self):
+        return SQLiteBackend(os.path.join(self.base_path, "atheris.db"))
+
+
+class TestReadCache(BackendCase):
+    def test_rewrite_after_delete_invalidates_cache(self):
+        reader = self.manager(read_cache=True)
+        reader.save("agent", "state", {"v": 1})
+        self.assertEqual(reader.load("agent", "state"), {"v": 1})
+
+        other = self.make_backend()  # e.g. another process
+        other.clear("agent")
+        other.write("agent", "state", {"v": 2})
+
+        self.assertEqual(reader.load("agent", "state"), {"v": 2})
+
+
+class TestReadCacheSQLite(TestReadCache):
+    def make_backend(self):
+        return SQLiteBackend(os.path.join(self.base_path, "atheris.db"))
+
+
+if __name__ == "__main__":
+    unittest.main()
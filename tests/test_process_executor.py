@@ -0,0 +1,101 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from atheris.core import process_executor
+from atheris.core.agent_base import AgentBase
+from atheris.core.core_events import event_bus
+from atheris.core.persistence_manager import PersistenceManager
+from atheris.core.process_executor import ProcessRunner
+
+
+class CountingAgent(AgentBase):
+    process_state = ("seen",)
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.agent_name = "counting_agent"
+        self.persistence = PersistenceManager(base_path=config["base_path"])
+        self.seen = []
+
+    def run(self):
+        pass
+
+    def run_with_input(self, item):
+        self.seen.append(item)
+        return os.getpid()
+
+
+class AlertingAgent(AgentBase):
+    def run(self):
+        pass
+
+    def run_with_input(self, item):
+        event_bus.emit("alert_triggered", {"type": "test", "item": item})
+        return item
+
+
+class ProcessRunnerCase(unittest.TestCase):
+    def setUp(self):
+        self.base_path = tempfile.mkdtemp()
+        self.runner = ProcessRunner(workers=2)
+
+    def tearDown(self):
+        self.runner.shutdown()
+        shutil.rmtree(self.base_path, ignore_errors=True)
+
+
+class TestProcessState(ProcessRunnerCase):
+    def test_state_survives_batches_on_different_workers(self):
+        agent = CountingAgent({"base_path": self.base_path})
+        pids = set()
+        for batch in ([1, 2], [3], [4, 5, 6]):
+            pids.update(self.runner.run("count", agent, batch, use_batch=False))
+
+        self.assertNotIn(os.getpid(), pids)
+        self.assertEqual(agent.seen, [1, 2, 3, 4, 5, 6])  # refreshed from persistence
+
+    def test_concurrent_batches_keep_every_update(self):
+        agent = CountingAgent({"base_path": self.base_path})
+        threads = [threading.Thread(target=self.runner.run, args=("count", agent, [i], False))
+                   for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(agent.seen), list(range(8)))
+
+
+class TestPool(ProcessRunnerCase):
+    def test_concurrent_first_runs_create_one_pool(self):
+        agent = CountingAgent({"base_path": self.base_path})
+        with mock.patch.object(process_executor, "ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool_class:
+            threads = [threading.Thread(target=self.runner.run, args=("count", agent, [i], False))
+                       for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(pool_class.call_count, 1)
+
+    def test_warns_once_about_events_without_transport(self):
+        self.assertIsNone(event_bus.transport)
+        agent = AlertingAgent({})
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual(self.runner.run("alerts", agent, [1, 2], use_batch=False), [1, 2])
+            self.runner.run("alerts", agent, [3], use_batch=False)
+
+        self.assertEqual(output.getvalue().count("[ProcessRunner] Warning: 'alerts' emitted events"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import shutil
+import tempfile
+import threading
+import unittest
+
+from atheris.core.log_reader import LogReader
+from atheris.core.segmented_log import SegmentedLog
+
+
+class TestSegmentedLog(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.log = SegmentedLog(self.directory, max_segment_bytes=2048)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_concurrent_appends_land_in_time_order(self):
+        def writer(thread):
+            for i in range(200):
+                self.log.append({"timestamp": 0, "thread": thread, "i": i}, stamp=True)
+
+        threads = [threading.Thread(target=writer, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        timestamps = [record["timestamp"] for record in self.log.iter_records()]
+        self.assertEqual(len(timestamps), 800)
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertGreater(len(self.log.segments()), 1)
+
+    def test_range_reads_tolerate_local_disorder(self):
+        # 50.5 lands after 52, e.g. after a clock step
+        for timestamp in list(range(51)) + [52, 50.5, 51] + list(range(53, 100)):
+            self.log.append({"timestamp": float(timestamp)})
+
+        expected = [40.0 + i for i in range(11)] + [50.5]
+        self.assertEqual([r["timestamp"] for r in self.log.iter_range(40, 50.6)], expected)
+        self.assertEqual([r["timestamp"] for r in LogReader(self.log).range(40, 50.6)], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
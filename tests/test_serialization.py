@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from atheris.core.persistence_manager import PersistenceManager
+from atheris.core.serialization import CODECS, DEFAULT_CODEC, decode, detect_codec, get_codec, msgpack
+from atheris.core.storage_backends import FileBackend, SQLiteBackend
+
+SAMPLE = {"wallet": "9xQe", "balances": [1, 2.5, None], "flags": {"active": True}, "note": "ünïcode"}
+
+
+class TestCodecs(unittest.TestCase):
+    def test_round_trip_and_detection(self):
+        for name, codec in CODECS.items():
+            with self.subTest(codec=name):
+                raw = codec.encode(SAMPLE)
+                self.assertEqual(codec.decode(raw), SAMPLE)
+                self.assertIs(detect_codec(raw), codec if codec.magic else DEFAULT_CODEC)
+                self.assertEqual(decode(raw), SAMPLE)
+
+    def test_text_is_read_as_json(self):
+        self.assertEqual(decode('{"a": 1}'), {"a": 1})
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            get_codec("yaml")
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_msgpack_is_registered(self):
+        self.assertIs(detect_codec(get_codec("msgpack").encode(SAMPLE)), get_codec("msgpack"))
+
+
+class TestStoredCodecs(unittest.TestCase):
+    def setUp(self):
+        self.base_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.base_path, ignore_errors=True)
+
+    def test_values_survive_a_codec_change(self):
+        for backend in (FileBackend(self.base_path), SQLiteBackend(os.path.join(self.base_path, "atheris.db"))):
+            with self.subTest(backend=type(backend).__name__):
+                json_manager = PersistenceManager(base_path=self.base_path, backend=backend, read_cache=False)
+                json_manager.save("agent", "state", SAMPLE)
+                json_manager.append_log("agent", {"n": 1})
+
+                pickle_manager = PersistenceManager(base_path=self.base_path, backend=backend, read_cache=False,
+                                                    codecs={"agent": "pickle"})
+                backend.codec_for = pickle_manager.codec_for  # as when the manager builds its backend
+                self.assertEqual(pickle_manager.load("agent", "state"), SAMPLE)
+                pickle_manager.save("agent", "state", {**SAMPLE, "n": 2})
+                pickle_manager.append_log("agent", {"n": 2})
+
+                self.assertEqual(pickle_manager.load("agent", "state"), {**SAMPLE, "n": 2})
+                self.assertEqual([e["event"]["n"] for e in pickle_manager.get_log_history("agent")], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from atheris.core.core_events import EventBus
+from atheris.utils.ipc_transport import TransportClient, TransportHub
+from atheris.utils.message_bus import MessageBus
+
+
+def wait_until(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TransportCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.hub = TransportHub(os.path.join(self.tmp, "hub.sock"))
+        self.hub.start()
+        self.hub_running = True
+        self.clients = []
+
+    def tearDown(self):
+        for client in self.clients:
+            client.close()
+        if self.hub_running:
+            self.hub.stop()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def stop_hub(self):
+        self.hub.stop()
+        self.hub_running = False
+        for client in self.clients:
+            self.assertTrue(wait_until(lambda: client._closed))
+
+    def connect(self) -> TransportClient:
+        client = TransportClient(self.hub.path)
+        self.clients.append(client)
+        return client
+
+
+class TestPubSub(TransportCase):
+    def test_messages_reach_other_clients_only(self):
+        sender, receiver = self.connect(), self.connect()
+        received, echoed, batches = [], [], []
+        receiver.subscribe("agent.update", received.append)
+        receiver.subscribe("agent.batch", batches.append, batch=True)
+        sender.subscribe("agent.update", echoed.append)
+        time.sleep(0.1)  # let the hub register the subscriptions
+
+        sender.publish("agent.update", {"n": 1})
+        sender.publish_many("agent.batch", [{"n": 2}, {"n": 3}])
+        sender.publish("agent.other", {"n": 4})
+        sender.flush(timeout=2)
+
+        self.assertTrue(wait_until(lambda: received and batches))
+        self.assertEqual(received, [{"n": 1}])
+        self.assertEqual(batches, [[{"n": 2}, {"n": 3}]])
+        self.assertEqual(echoed, [])
+
+    def test_event_buses_exchange_events(self):
+        local, remote = EventBus(), EventBus()
+        local.attach_transport(self.connect())
+        remote.attach_transport(self.connect())
+        seen_locally, seen_remotely = [], []
+        local.subscribe("new_block", seen_locally.append)
+        remote.subscribe("new_block", seen_remotely.append)
+        time.sleep(0.1)
+
+        local.emit("new_block", {"slot": 7})
+
+        self.assertEqual(seen_locally, [{"slot": 7}])
+        self.assertTrue(wait_until(lambda: seen_remotely))
+        self.assertEqual(seen_remotely, [{"slot": 7}])
+
+
+class TestHubLoss(TransportCase):
+    def test_message_bus_delivers_locally_after_hub_loss(self):
+        bus = MessageBus(transport=self.connect())
+        received = []
+        bus.subscribe("agent.update", received.append)
+
+        self.stop_hub()
+        bus.publish("agent.update", {"n": 1})
+        bus.publish("agent.update", {"n": 2})
+
+        self.assertEqual(received, [{"n": 1}, {"n": 2}])
+
+    def test_event_bus_delivers_locally_after_hub_loss(self):
+        bus = EventBus()
+        bus.attach_transport(self.connect())
+        received = []
+        bus.subscribe("new_block", received.append)
+
+        self.stop_hub()
+        bus.emit("new_block", {"slot": 1})
+        bus.emit_many("new_block", [{"slot": 2}, {"slot": 3}])
+
+        self.assertEqual([p["slot"] for p in received], [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
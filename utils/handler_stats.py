@@ -0,0 +1,125 @@
+import time
+import bisect
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Upper bounds (seconds) of the latency histogram buckets; a last bucket
+# counts everything slower
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Handler calls slower than this (seconds) are reported
+SLOW_HANDLER_THRESHOLD = 0.5
+
+# Least seconds between two slow-handler warnings for the same handler
+SLOW_WARNING_INTERVAL = 60.0
+
+
+def handler_name(handler: Callable) -> str:
+    """Readable name of a handler, e.g. 'embedded.delegate_monitor.DelegateMonitor.on_event'."""
+    module = getattr(handler, "__module__", None) or ""
+    name = getattr(handler, "__qualname__", None) or type(handler).__qualname__
+    return f"{module}.{name}" if module else name
+
+
+class _HandlerRecord:
+    __slots__ = ("handler", "calls", "errors", "total", "max", "buckets", "last_warning")
+
+    def __init__(self, handler: Callable):
+        self.handler = handler  # also keeps id(handler) from being reused
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.last_warning = float("-inf")
+
+
+class HandlerStats:
+    def __init__(self, owner: str, slow_threshold: Optional[float] = SLOW_HANDLER_THRESHOLD):
+        """
+        Call counts, error counts and latency histograms per (topic, handler),
+        shared by the event and message buses.
+
+        A call slower than `slow_threshold` seconds prints a warning naming
+        the handler, at most once per SLOW_WARNING_INTERVAL per handler.
+
+        Args:
+            owner (str): Prefix of printed warnings, e.g. "EventBus"
+            slow_threshold (float): Seconds; None disables the warning
+        """
+        self.owner = owner
+        self.slow_threshold = slow_threshold
+        self._records: Dict[Tuple[str, int], _HandlerRecord] = {}  # by (topic, id(handler)), named in snapshot()
+        self._lock = threading.Lock()
+
+    def record(self, topic: str, handler: Callable, elapsed: float, error: bool = False):
+        key = (topic, id(handler))
+        warn = False
+        with self._lock:
+            record = self._records.get(key)
+            if record is None:
+                record = self._records[key] = _HandlerRecord(handler)
+            record.calls += 1
+            record.errors += error
+            record.total += elapsed
+            if elapsed > record.max:
+                record.max = elapsed
+            record.buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+            if self.slow_threshold is not None and elapsed > self.slow_threshold:
+                now = time.monotonic()
+                if now - record.last_warning >= SLOW_WARNING_INTERVAL:
+                    record.last_warning = now
+                    warn = True
+        if warn:
+            print(f"[{self.owner}] Slow handler {handler_name(handler)} for '{topic}': {elapsed * 1000:.1f} ms "
+                  f"(threshold {self.slow_threshold * 1000:.0f} ms)")
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Returns:
+            {topic: {handler name: {"calls", "errors", "avg", "max", "p50",
+            "p95", "p99", "histogram"}}} with times in seconds. Percentiles
+            are bucket upper bounds (None past the last bound), and the
+            histogram maps each upper bound (or "+inf") to a call count.
+            Distinct handlers sharing a name on a topic (e.g. the same method
+            of two instances) are listed separately, the later ones with a
+            "#2", "#3", ... suffix.
+        """
+        with self._lock:
+            records = [(topic, record.handler, record.calls, record.errors, record.total, record.max,
+                        list(record.buckets)) for (topic, _), record in self._records.items()]
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for topic, handler, calls, errors, total, longest, buckets in records:
+            handlers = result.setdefault(topic, {})
+            name = base = handler_name(handler)
+            suffix = 1
+            while name in handlers:
+                suffix += 1
+                name = f"{base}#{suffix}"
+            handlers[name] = {
+                "calls": calls,
+                "errors": errors,
+                "avg": total / calls if calls else 0.0,
+                "max": longest,
+                "p50": _percentile(buckets, calls, 0.50),
+                "p95": _percentile(buckets, calls, 0.95),
+                "p99": _percentile(buckets, calls, 0.99),
+                "histogram": dict(zip([str(bound) for bound in LATENCY_BUCKETS] + ["+inf"], buckets)),
+            }
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._records.clear()
+
+
+def _percentile(buckets: List[int], calls: int, fraction: float) -> Optional[float]:
+    if not calls:
+        return None
+    rank = fraction * calls
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS, buckets):
+        seen += count
+        if seen >= rank:
+            return bound
+    return None
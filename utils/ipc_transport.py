@@ -0,0 +1,341 @@
+import os
+import time
+import errno
+import pickle
+import socket
+import struct
+import selectors
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from atheris.utils.topic_trie import TopicTrie
+
+# Frame: op, topic length, payload length, then topic (UTF-8) and payload
+# (a pickled message, or a pickled list of messages for PUB_MANY)
+FRAME_HEADER = struct.Struct(">BHI")
+SUB, UNSUB, PUB, PUB_MANY = 1, 2, 3, 4
+
+# A subscriber whose unsent backlog grows past this is disconnected
+MAX_PEER_BACKLOG = 64 * 1024 * 1024
+RECV_BYTES = 256 * 1024
+
+
+def encode_frame(op: int, topic: str, payload: bytes = b"") -> bytes:
+    topic_bytes = topic.encode("utf-8")
+    return FRAME_HEADER.pack(op, len(topic_bytes), len(payload)) + topic_bytes + payload
+
+
+def decode_frames(buffer: bytearray) -> List[Tuple[int, str, bytes, bytes]]:
+    """
+    Split complete frames off the front of `buffer` (consumed in place).
+
+    Returns:
+        [(op, topic, payload, raw frame)]
+    """
+    frames = []
+    pos = 0
+    view = memoryview(buffer)
+    while len(buffer) - pos >= FRAME_HEADER.size:
+        op, topic_len, payload_len = FRAME_HEADER.unpack_from(buffer, pos)
+        end = pos + FRAME_HEADER.size + topic_len + payload_len
+        if end > len(buffer):
+            break
+        topic_start = pos + FRAME_HEADER.size
+        topic = bytes(view[topic_start:topic_start + topic_len]).decode("utf-8")
+        payload = bytes(view[topic_start + topic_len:end])
+        frames.append((op, topic, payload, bytes(view[pos:end])))
+        pos = end
+    view.release()
+    del buffer[:pos]
+    return frames
+
+
+class _Peer:
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.inbox = bytearray()
+        self.outbox = bytearray()
+        self.topics: set = set()
+
+
+class TransportHub:
+    def __init__(self, path: str):
+        """
+        Local message broker on a Unix domain socket.
+
+        Processes connect with TransportClient and subscribe to topics or
+        wildcard patterns ('agent.*', 'agent.#'); every published frame is
+        forwarded unchanged, once, to each other connection with a matching
+        subscription. The hub never unpickles messages. It runs on one
+        selector thread and usually lives in the master process.
+
+        Args:
+            path (str): Socket file path
+        """
+        self.path = path
+        self._selector = selectors.DefaultSelector()
+        self._routes = TopicTrie()  # subscribed pattern -> peers
+        self._server: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self):
+        """Bind the socket and start routing on a background thread."""
+        if os.path.exists(self.path):
+            os.remove(self.path)  # left behind by a previous run
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen(64)
+        self._server.setblocking(False)
+        self._selector.register(self._server, selectors.EVENT_READ)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        print(f"[TransportHub] Listening on {self.path}")
+
+    def stop(self):
+        """Stop routing, disconnect every client and remove the socket file."""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=2)
+        for key in list(self._selector.get_map().values()):
+            key.fileobj.close()
+        self._selector.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _run(self):
+        while self._running:
+            for key, events in self._selector.select(timeout=0.2):
+                if key.data is None:
+                    self._accept()
+                    continue
+                peer = key.data
+                if events & selectors.EVENT_READ:
+                    self._read(peer)
+                if events & selectors.EVENT_WRITE and peer.sock.fileno() != -1:
+                    self._write(peer)
+
+    def _accept(self):
+        sock, _ = self._server.accept()
+        sock.setblocking(False)
+        self._selector.register(sock, selectors.EVENT_READ, _Peer(sock))
+
+    def _read(self, peer: _Peer):
+        try:
+            data = peer.sock.recv(RECV_BYTES)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(peer)
+            return
+
+        peer.inbox += data
+        for op, topic, _, raw in decode_frames(peer.inbox):
+            if op == SUB:
+                if topic not in peer.topics:
+                    peer.topics.add(topic)
+                    self._routes.add(topic, peer)
+            elif op == UNSUB:
+                if topic in peer.topics:
+                    peer.topics.discard(topic)
+                    self._routes.remove(topic, peer)
+            elif op in (PUB, PUB_MANY):
+                for subscriber in self._routes.match(topic):
+                    if subscriber is not peer:
+                        self._send(subscriber, raw)
+
+    def _send(self, peer: _Peer, raw: bytes):
+        pending = bool(peer.outbox)
+        peer.outbox += raw
+        if len(peer.outbox) > MAX_PEER_BACKLOG:
+            print("[TransportHub] Dropping a subscriber that stopped reading")
+            self._drop(peer)
+        elif not pending:
+            self._write(peer)
+
+    def _write(self, peer: _Peer):
+        try:
+            sent = peer.sock.send(peer.outbox)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self._drop(peer)
+            return
+        del peer.outbox[:sent]
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if peer.outbox else 0)
+        self._selector.modify(peer.sock, events, peer)
+
+    def _drop(self, peer: _Peer):
+        for topic in peer.topics:
+            self._routes.remove(topic, peer)
+        peer.topics.clear()
+        try:
+            self._selector.unregister(peer.sock)
+        except (KeyError, ValueError):
+            pass
+        peer.sock.close()
+
+
+class TransportClient:
+    def __init__(self, path: str, connect_timeout: float = 5.0):
+        """
+        Connection to a TransportHub, used to publish and subscribe across
+        processes.
+
+        Messages are pickled (protocol 5), so only connect processes of this
+        system to a hub. Publishing only appends to an outgoing buffer that a
+        writer thread sends, so bursts go out in few large writes. Callbacks
+        run on the client's reader thread.
+
+        Args:
+            path (str): Hub socket path
+            connect_timeout (float): Seconds to keep retrying while the hub starts
+        """
+        self.path = path
+        self._sock = self._connect(connect_timeout)
+        self._callbacks: Dict[str, List[Tuple[Callable, bool, bool]]] = {}  # by pattern
+        self._routes = TopicTrie()
+        self._lock = threading.Lock()
+        self._outbox = bytearray()
+        self._out_cond = threading.Condition()
+        self._sending = False
+        self._closed = False
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._reader.start()
+        self._writer.start()
+
+    def _connect(self, timeout: float) -> socket.socket:
+        deadline = time.monotonic() + timeout
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.path)
+                return sock
+            except OSError as e:
+                sock.close()
+                if e.errno not in (errno.ENOENT, errno.ECONNREFUSED) or time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+
+    def subscribe(self, topic: str, callback: Callable[..., None], batch: bool = False,
+                  with_topic: bool = False):
+        """
+        Receive messages published to `topic` by other processes.
+
+        Args:
+            topic (str): Topic name or wildcard pattern ('agent.*', 'agent.#')
+            callback (callable): Takes a message, or with batch=True a list of
+                messages (one list per publish_many call)
+            batch (bool): Deliver lists of messages
+            with_topic (bool): Call callback(topic, message) with the topic the
+                message was published to. The same callback subscribed under
+                several matching patterns is then called once per message.
+        """
+        entry = (callback, batch, with_topic)
+        with self._lock:
+            first = topic not in self._callbacks
+            self._callbacks.setdefault(topic, []).append(entry)
+            self._routes.add(topic, entry)
+        if first:
+            self._queue(encode_frame(SUB, topic))
+
+    def unsubscribe(self, topic: str, callback: Callable[[Any], None]):
+        with self._lock:
+            for entry in self._callbacks.get(topic, []):
+                if entry[0] == callback:
+                    self._routes.remove(topic, entry)
+            remaining = [entry for entry in self._callbacks.get(topic, []) if entry[0] != callback]
+            if remaining:
+                self._callbacks[topic] = remaining
+            elif self._callbacks.pop(topic, None) is not None:
+                self._queue(encode_frame(UNSUB, topic))
+
+    def publish(self, topic: str, message: Any):
+        """Send one message to the other processes subscribed to `topic`."""
+        self._queue(encode_frame(PUB, topic, pickle.dumps(message, protocol=5)))
+
+    def publish_many(self, topic: str, messages: List[Any]):
+        """Send several messages to `topic` in one frame."""
+        self._queue(encode_frame(PUB_MANY, topic, pickle.dumps(list(messages), protocol=5)))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything published so far has been handed to the socket."""
+        with self._out_cond:
+            return self._out_cond.wait_for(lambda: not (self._outbox or self._sending) or self._closed, timeout)
+
+    def close(self):
+        """Send what is buffered and disconnect."""
+        self.flush(timeout=2)
+        self._closed = True
+        with self._out_cond:
+            self._out_cond.notify_all()
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+    def _queue(self, frame: bytes):
+        with self._out_cond:
+            if self._closed:
+                raise RuntimeError("Transport client is closed")
+            self._outbox += frame
+            self._out_cond.notify_all()
+
+    def _write_loop(self):
+        while True:
+            with self._out_cond:
+                self._out_cond.wait_for(lambda: self._outbox or self._closed)
+                if self._closed:
+                    return
+                data, self._outbox = bytes(self._outbox), bytearray()
+                self._sending = True
+            try:
+                self._sock.sendall(data)
+            except OSError as e:
+                if not self._closed:
+                    print(f"[TransportClient] Connection to {self.path} lost: {e}")
+                self._closed = True
+            with self._out_cond:
+                self._sending = False
+                self._out_cond.notify_all()
+
+    def _read_loop(self):
+        inbox = bytearray()
+        while not self._closed:
+            try:
+                data = self._sock.recv(RECV_BYTES)
+            except OSError:
+                data = b""
+            if not data:
+                break
+            inbox += data
+            for op, topic, payload, _ in decode_frames(inbox):
+                self._deliver(op, topic, payload)
+        with self._out_cond:
+            if not self._closed:
+                # The hub went away: stop queueing frames nobody will read
+                print(f"[TransportClient] Connection to {self.path} lost")
+                self._closed = True
+            self._out_cond.notify_all()
+
+    def _deliver(self, op: int, topic: str, payload: bytes):
+        with self._lock:
+            callbacks = self._routes.match(topic)
+        if not callbacks:
+            return
+        messages = pickle.loads(payload)
+        if op == PUB:
+            messages = [messages]
+        for callback, batch, with_topic in callbacks:
+            try:
+                if batch:
+                    callback(topic, messages) if with_topic else callback(messages)
+                else:
+                    for message in messages:
+                        callback(topic, message) if with_topic else callback(message)
+            except Exception as e:
+                print(f"[TransportClient] Error in callback for topic '{topic}': {e}")
@@ -1,10 +1,36 @@
-from typing import Callable, Dict, List, Any
+import time
+from typing import Callable, Dict, List, Any, Optional
 from threading import Lock
+from atheris.utils.ipc_transport import TransportClient
+from atheris.utils.handler_stats import HandlerStats, SLOW_HANDLER_THRESHOLD
+from atheris.utils.topic_trie import TopicTrie
 
 class MessageBus:
-    def __init__(self):
-        self.subscribers: Dict[str, List[Callable[[Any], None]]] = {}
+    def __init__(self, transport: Optional[TransportClient] = None,
+                 slow_handler_threshold: Optional[float] = SLOW_HANDLER_THRESHOLD):
+        """
+        Topic-based pub-sub over dotted topic names. Subscriptions may use
+        wildcards: '*' matches one segment and '#' zero or more, so
+        'agent.*' receives 'agent.update' and 'agent.#' also receives
+        'agent.update.status'. Publishing resolves subscribers through a
+        topic trie, cached per topic until subscriptions change; a callback
+        matched by several patterns is called once per message.
+
+        With a transport, messages are also exchanged
+        with MessageBus instances in other processes connected to the same
+        TransportHub: local publishes are forwarded, and remote ones are
+        delivered to local subscribers.
+
+        Every callback invocation is timed per (topic, callback); see stats().
+        Calls slower than `slow_handler_threshold` seconds print a warning.
+        """
+        self.subscribers: Dict[str, List[Callable[[Any], None]]] = {}  # by pattern
+        self._routes = TopicTrie()
         self.lock = Lock()
+        self.transport = transport
+        self._transport_failed = False
+        self._remote_handlers: Dict[str, Callable[[Any], None]] = {}
+        self.handler_stats = HandlerStats("MessageBus", slow_handler_threshold)
         print("[MessageBus] Initialized.")
 
     def subscribe(self, topic: str, callback: Callable[[Any], None]):
@@ -12,6 +38,12 @@ class MessageBus:
             if topic not in self.subscribers:
                 self.subscribers[topic] = []
             self.subscribers[topic].append(callback)
+            self._routes.add(topic, callback)
+            if self.transport is not None and topic not in self._remote_handlers:
+                # Remote messages arrive with their concrete topic, so one
+                # message matching several of our patterns is delivered once
+                self._remote_handlers[topic] = self._deliver
+                self.transport.subscribe(topic, self._deliver, with_topic=True)
             print(f"[MessageBus] Subscribed to topic '{topic}'.")
 
     def unsubscribe(self, topic: str, callback: Callable[[Any], None]):
@@ -20,17 +52,48 @@ class MessageBus:
                 self.subscribers[topic] = [
                     cb for cb in self.subscribers[topic] if cb != callback
                 ]
+                self._routes.remove(topic, callback)
+                if not self.subscribers[topic] and topic in self._remote_handlers:
+                    self.transport.unsubscribe(topic, self._remote_handlers.pop(topic))
                 print(f"[MessageBus] Unsubscribed from topic '{topic}'.")
 
     def publish(self, topic: str, message: Any):
+        """
+        Deliver `message` to local subscribers, then to other processes. A
+        lost transport is reported (once per outage) and never fails the publish.
+        """
+        self._deliver(topic, message)
+        if self.transport is None:
+            return
+        try:
+            self.transport.publish(topic, message)
+        except (RuntimeError, OSError) as e:
+            if not self._transport_failed:
+                print(f"[MessageBus] Not forwarding messages to other processes: {e}")
+            self._transport_failed = True
+        else:
+            self._transport_failed = False
+
+    def _deliver(self, topic: str, message: Any):
         with self.lock:
-            callbacks = self.subscribers.get(topic, []).copy()
+            callbacks = self._routes.match(topic)
         for callback in callbacks:
+            start = time.perf_counter()
+            error = False
             try:
                 callback(message)
-                print(f"[MessageBus] Dispatched message to topic '{topic}'.")
             except Exception as e:
+                error = True
                 print(f"[MessageBus] Error in callback for topic '{topic}': {e}")
+            self.handler_stats.record(topic, callback, time.perf_counter() - start, error)
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Per-callback instrumentation: {topic: {callback name: {"calls",
+        "errors", "avg", "max", "p50", "p95", "p99", "histogram"}}}, times in
+        seconds (see HandlerStats.snapshot()).
+        """
+        return self.handler_stats.snapshot()
 
 
 # Example usage
@@ -45,6 +108,7 @@ if __name__ == "__main__":
 
     bus.subscribe("agent.update", agent_handler)
     bus.subscribe("dashboard.render", dashboard_handler)
+    bus.subscribe("agent.#", lambda data: print(f"[AgentWatcher] Any agent topic: {data}"))
 
     bus.publish("agent.update", {"type": "status", "value": "active"})
     bus.publish("dashboard.render", {"ui": "update", "content": "Agent view refreshed"})
@@ -0,0 +1,102 @@
+import itertools
+from typing import Any, Dict, List, Tuple
+
+# In subscription patterns '*' matches exactly one dot-separated segment and
+# '#' matches zero or more, so 'agent.*' matches 'agent.update' and
+# 'agent.#' also matches 'agent' and 'agent.update.status'.
+SINGLE_WILDCARD = "*"
+MULTI_WILDCARD = "#"
+
+# Distinct topics whose resolved subscribers are cached
+RESOLVED_CACHE_SIZE = 4096
+
+
+def is_pattern(topic: str) -> bool:
+    return any(part in (SINGLE_WILDCARD, MULTI_WILDCARD) for part in topic.split("."))
+
+
+class _Node:
+    __slots__ = ("children", "values")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.values: List[Tuple[int, Any]] = []  # (subscription order, value)
+
+
+class TopicTrie:
+    def __init__(self):
+        """
+        Subscription patterns indexed by topic segment.
+
+        match() walks one trie level per topic segment, following the
+        literal child plus any '*' and '#' children, so its cost depends on
+        topic depth and wildcard use rather than on the number of
+        subscriptions. Results are cached per topic until the next add() or
+        remove(). Not thread-safe: callers hold their own lock.
+        """
+        self._root = _Node()
+        self._order = itertools.count()
+        self._resolved: Dict[str, Tuple[Any, ...]] = {}
+
+    def add(self, pattern: str, value: Any):
+        node = self._root
+        for part in pattern.split("."):
+            node = node.children.setdefault(part, _Node())
+        node.values.append((next(self._order), value))
+        self._resolved.clear()
+
+    def remove(self, pattern: str, value: Any) -> bool:
+        """Remove every entry of `value` under `pattern`; returns whether any was found."""
+        path = [self._root]
+        parts = pattern.split(".")
+        for part in parts:
+            child = path[-1].children.get(part)
+            if child is None:
+                return False
+            path.append(child)
+        node = path[-1]
+        remaining = [entry for entry in node.values if entry[1] != value]
+        if len(remaining) == len(node.values):
+            return False
+        node.values = remaining
+        # Prune branches left empty
+        for part, parent, child in zip(reversed(parts), reversed(path[:-1]), reversed(path[1:])):
+            if child.values or child.children:
+                break
+            del parent.children[part]
+        self._resolved.clear()
+        return True
+
+    def match(self, topic: str) -> Tuple[Any, ...]:
+        """Return the values of every pattern matching `topic`, once each, in the order they were added."""
+        resolved = self._resolved.get(topic)
+        if resolved is None:
+            entries: List[Tuple[int, Any]] = []
+            self._collect(self._root, topic.split("."), 0, entries)
+            seen: List[Any] = []
+            for _, value in sorted(entries, key=lambda entry: entry[0]):
+                if value not in seen:
+                    seen.append(value)
+            resolved = tuple(seen)
+            if len(self._resolved) >= RESOLVED_CACHE_SIZE:
+                self._resolved.clear()
+            self._resolved[topic] = resolved
+        return resolved
+
+    def _collect(self, node: _Node, parts: List[str], i: int, out: List[Tuple[int, Any]]):
+        multi = node.children.get(MULTI_WILDCARD)
+        if multi is not None:
+            for j in range(i, len(parts) + 1):
+                self._collect(multi, parts, j, out)
+        if i == len(parts):
+            out.extend(node.values)
+            return
+        child = node.children.get(parts[i])
+        if child is not None:
+            self._collect(child, parts, i + 1, out)
+        single = node.children.get(SINGLE_WILDCARD)
+        if single is not None:
+            self._collect(single, parts, i + 1, out)
+
+    def __bool__(self) -> bool:
+        return bool(self._root.children or self._root.values)